@@ -1,345 +1,164 @@
-import cudaq
+import time
+from collections import Counter
+
+from clasificacion_adaptativa import classify_dj_adaptive
+from ejecucion import resolve_engine, sample_kernel
+from motor_exacto import exact_probabilities, format_probabilities
+from oraculos import DJ3_ORACLES, all_secrets
+from registro_kernels import get_kernel, lazy_kernels
+from sumidero_resultados import (kernel_variant, probability_record, run_record, silent,
+                                 summarize_counts)
 
 # ============================================================================
 # ALGORITMOS DEUTSCH-JOZSA Y BERNSTEIN-VAZIRANI DE 3 QUBITS
 # ============================================================================
-
-print("\n" + "="*80)
-print("ALGORITMOS CUÁNTICOS CON 3 QUBITS")
-print("="*80)
+#
+# Los kernels dj3_* y bv3_* se construyen al primer uso desde el registro
+# perezoso (registro_kernels.py), a partir de los oráculos de oraculos.py.
+# Importar este módulo no compila ni imprime nada.
+# ============================================================================
 
 # ============================================================================
 # PARTE 1: DEUTSCH-JOZSA DE 3 QUBITS
 # ============================================================================
-
-print("\n" + "="*80)
-print("PARTE 1: ALGORITMO DEUTSCH-JOZSA (3 QUBITS)")
-print("="*80)
-
-# Funciones CONSTANTES
-
-@cudaq.kernel
-def dj3_constant_0():
-    """DJ: f(x) = 0 para todo x"""
-    qubits = cudaq.qvector(3)
-    
-    # Hadamard inicial
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Oráculo: no hace nada (f(x) = 0)
-    
-    # Hadamard final
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def dj3_constant_1():
-    """DJ: f(x) = 1 para todo x"""
-    qubits = cudaq.qvector(3)
-    
-    # Hadamard inicial
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Oráculo: aplica fase global π
-    z(qubits[0])
-    z(qubits[1])
-    z(qubits[2])
-    
-    # Hadamard final
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-# Funciones BALANCEADAS (ejemplos representativos)
-
-@cudaq.kernel
-def dj3_balanced_x0():
-    """DJ: f(x) = x₀"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    z(qubits[0])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def dj3_balanced_x1():
-    """DJ: f(x) = x₁"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    z(qubits[1])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def dj3_balanced_x2():
-    """DJ: f(x) = x₂"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    z(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def dj3_balanced_xor_01():
-    """DJ: f(x) = x₀ ⊕ x₁"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    cz(qubits[0], qubits[1])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def dj3_balanced_majority():
-    """DJ: f(x) = majority(x₀, x₁, x₂) - función balanceada compleja"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Implementación simplificada de majority
-    # majority es 1 si al menos 2 de los 3 bits son 1
-    cz(qubits[0], qubits[1])
-    cz(qubits[1], qubits[2])
-    cz(qubits[0], qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-
-def run_deutsch_jozsa_3qubits(kernel_func, function_name, shots=1000):
+#
+# Funciones CONSTANTES:
+#   dj3_constant_0         f(x) = 0   → sin fase
+#   dj3_constant_1         Z en los 3 qubits
+#
+# Funciones BALANCEADAS (ejemplos representativos):
+#   dj3_balanced_x0        f(x) = x₀        → Z(q0)
+#   dj3_balanced_x1        f(x) = x₁        → Z(q1)
+#   dj3_balanced_x2        f(x) = x₂        → Z(q2)
+#   dj3_balanced_xor_01    f(x) = x₀ ⊕ x₁   → CZ(q0, q1)
+#   dj3_balanced_majority  majority(x₀, x₁, x₂) → CZ(q0,q1) CZ(q1,q2) CZ(q0,q2)
+
+
+def run_deutsch_jozsa_3qubits(kernel_func, function_name, shots=1000, kernel_args=(),
+                              engine="cudaq", seed=None, adaptive=False, exact=False,
+                              sink=None, verbose=True):
     """Ejecuta y analiza Deutsch-Jozsa de 3 qubits"""
-    
-    print(f"\n{'='*80}")
-    print(f"Función: {function_name}")
-    print(f"{'='*80}")
-    
-    result = cudaq.sample(kernel_func, shots_count=shots)
-    print(f"\nResultados ({shots} shots):")
-    print(result)
-    
-    # Analizar
+    say = print if verbose else silent
+    
+    say(f"\n{'='*80}")
+    say(f"Función: {function_name}")
+    say(f"{'='*80}")
+    
+    if adaptive:
+        # Modo adaptativo: bloques pequeños + SPRT, con `shots` como máximo
+        engine = resolve_engine(kernel_func, kernel_args, engine)
+        tally = Counter()
+        start = time.perf_counter()
+        constant, used = classify_dj_adaptive(kernel_func, kernel_args, engine, tally,
+                                              max_shots=shots)
+        elapsed = time.perf_counter() - start
+        say(f"\nModo adaptativo (SPRT): {used} de {shots} shots usados")
+        say("✓ Conclusión: CONSTANTE" if constant else "✓ Conclusión: BALANCEADA")
+        record = run_record(tally, "dj", len(next(iter(tally))), function_name,
+                            kernel_variant(kernel_func, kernel_args), engine, used,
+                            elapsed_s=elapsed, verdict="constant" if constant else "balanced",
+                            max_shots=shots)
+        if sink is not None:
+            sink.write(record)
+        return record
+    
+    if exact:
+        # Modo exacto: probabilidades del vector de estado, sin shots
+        start = time.perf_counter()
+        probs, width = exact_probabilities(kernel_func, kernel_args)
+        elapsed = time.perf_counter() - start
+        say("\nProbabilidades exactas (vector de estado):")
+        say(format_probabilities(probs, width))
+        say(f"\nProbabilidad de medir |000⟩: {probs[0]:.4f}")
+        say("✓ Conclusión: CONSTANTE" if probs[0] > 0.9 else "✓ Conclusión: BALANCEADA")
+        record = probability_record(probs, width, "dj", width, function_name,
+                                    kernel_variant(kernel_func, kernel_args), elapsed,
+                                    "constant" if probs[0] > 0.9 else "balanced")
+        if sink is not None:
+            sink.write(record)
+        return record
+    
+    # El registro guarda el motor usado, no "auto"
+    engine = resolve_engine(kernel_func, kernel_args, engine)
+    start = time.perf_counter()
+    result = sample_kernel(kernel_func, kernel_args, shots, engine, seed)
+    elapsed = time.perf_counter() - start
+    say(f"\nResultados ({shots} shots):")
+    if verbose:
+        say(summarize_counts(result))
+    
+    # Analizar (n sale del ancho del resultado: vale para cualquier kernel)
     result_dict = {}
     for bits, count in result.items():
         result_dict[bits] = count
+    n = len(result.most_probable())
     
-    prob_000 = result_dict.get('000', 0) / shots
+    prob_000 = result_dict.get("0" * n, 0) / shots
     
-    print(f"\nProbabilidad de medir |000⟩: {prob_000:.4f}")
+    say(f"\nProbabilidad de medir |{'0' * n}⟩: {prob_000:.4f}")
     
-    if prob_000 > 0.9:
-        print("✓ Conclusión: CONSTANTE")
+    constant = prob_000 > 0.9
+    if constant:
+        say("✓ Conclusión: CONSTANTE")
     else:
-        print("✓ Conclusión: BALANCEADA")
+        say("✓ Conclusión: BALANCEADA")
+    
+    record = run_record(result, "dj", n, function_name, kernel_variant(kernel_func, kernel_args),
+                        engine, shots, elapsed_s=elapsed, verdict="constant" if constant else "balanced")
+    if sink is not None:
+        sink.write(record)
+    return record
 
 
 # ============================================================================
 # PARTE 2: BERNSTEIN-VAZIRANI DE 3 QUBITS
 # ============================================================================
+#
+# Con 3 qubits hay 2³ = 8 cadenas secretas posibles: bv3_s000 … bv3_s111.
+# El oráculo aplica Z en cada qubit i con s_i = 1, por ejemplo
+#   bv3_s101   f(x) = x₀ ⊕ x₂   → Z(q0) Z(q2)
 
-print("\n\n" + "="*80)
-print("PARTE 2: ALGORITMO BERNSTEIN-VAZIRANI (3 QUBITS)")
-print("="*80)
-print("\nCon 3 qubits hay 2³ = 8 cadenas secretas posibles")
-
-# Implementar las 8 cadenas secretas posibles
-
-@cudaq.kernel
-def bv3_s000():
-    """BV: s = "000" → f(x) = 0"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # No aplica fase
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
 
-@cudaq.kernel
-def bv3_s001():
-    """BV: s = "001" → f(x) = x₂"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    z(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def bv3_s010():
-    """BV: s = "010" → f(x) = x₁"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    z(qubits[1])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def bv3_s011():
-    """BV: s = "011" → f(x) = x₁ ⊕ x₂"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    z(qubits[1])
-    z(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def bv3_s100():
-    """BV: s = "100" → f(x) = x₀"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    z(qubits[0])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def bv3_s101():
-    """BV: s = "101" → f(x) = x₀ ⊕ x₂"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    z(qubits[0])
-    z(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def bv3_s110():
-    """BV: s = "110" → f(x) = x₀ ⊕ x₁"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    z(qubits[0])
-    z(qubits[1])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-@cudaq.kernel
-def bv3_s111():
-    """BV: s = "111" → f(x) = x₀ ⊕ x₁ ⊕ x₂"""
-    qubits = cudaq.qvector(3)
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    z(qubits[0])
-    z(qubits[1])
-    z(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    mz(qubits)
-
-
-def run_bernstein_vazirani_3qubits(kernel_func, secret_string, shots=1000):
+def run_bernstein_vazirani_3qubits(kernel_func, secret_string, shots=1000, kernel_args=(),
+                                   engine="cudaq", seed=None, exact=False, sink=None, verbose=True):
     """Ejecuta y analiza Bernstein-Vazirani de 3 qubits"""
-    
-    print(f"\n{'='*80}")
-    print(f"Buscando cadena secreta: s = \"{secret_string}\"")
-    print(f"{'='*80}")
-    
-    result = cudaq.sample(kernel_func, shots_count=shots)
-    print(f"\nResultados ({shots} shots):")
-    print(result)
+    say = print if verbose else silent
+    
+    say(f"\n{'='*80}")
+    say(f"Buscando cadena secreta: s = \"{secret_string}\"")
+    say(f"{'='*80}")
+    
+    if exact:
+        # Modo exacto: probabilidades del vector de estado, sin shots
+        start = time.perf_counter()
+        probs, width = exact_probabilities(kernel_func, kernel_args)
+        elapsed = time.perf_counter() - start
+        say("\nProbabilidades exactas (vector de estado):")
+        say(format_probabilities(probs, width))
+        
+        measured_state = format(int(probs.argmax()), f"0{width}b")
+        say(f"\nEstado más probable: |{measured_state}⟩")
+        say(f"Probabilidad exacta: {probs.max():.4f}")
+        
+        if measured_state == secret_string:
+            say(f"✓ ¡ÉXITO! Cadena recuperada: s = \"{measured_state}\"")
+        else:
+            say(f"✗ ERROR: Esperaba \"{secret_string}\" pero midió \"{measured_state}\"")
+        record = probability_record(probs, width, "bv", width, secret_string,
+                                    kernel_variant(kernel_func, kernel_args), elapsed,
+                                    measured_state)
+        if sink is not None:
+            sink.write(record)
+        return record
+    
+    # El registro guarda el motor usado, no "auto"
+    engine = resolve_engine(kernel_func, kernel_args, engine)
+    start = time.perf_counter()
+    result = sample_kernel(kernel_func, kernel_args, shots, engine, seed)
+    elapsed = time.perf_counter() - start
+    say(f"\nResultados ({shots} shots):")
+    if verbose:
+        say(summarize_counts(result))
     
     # Analizar
     result_dict = {}
@@ -354,13 +173,28 @@ def run_bernstein_vazirani_3qubits(kernel_func, secret_string, shots=1000):
     
     probability = max_count / shots
     
-    print(f"\nEstado medido más frecuente: |{measured_state}⟩")
-    print(f"Probabilidad: {probability:.4f} ({max_count}/{shots})")
+    say(f"\nEstado medido más frecuente: |{measured_state}⟩")
+    say(f"Probabilidad: {probability:.4f} ({max_count}/{shots})")
     
     if measured_state == secret_string:
-        print(f"✓ ¡ÉXITO! Cadena recuperada: s = \"{measured_state}\"")
+        say(f"✓ ¡ÉXITO! Cadena recuperada: s = \"{measured_state}\"")
     else:
-        print(f"✗ ERROR: Esperaba \"{secret_string}\" pero midió \"{measured_state}\"")
+        say(f"✗ ERROR: Esperaba \"{secret_string}\" pero midió \"{measured_state}\"")
+    
+    record = run_record(result, "bv", len(measured_state), secret_string,
+                        kernel_variant(kernel_func, kernel_args), engine, shots,
+                        elapsed_s=elapsed, verdict=measured_state)
+    if sink is not None:
+        sink.write(record)
+    return record
+
+
+# Nombres de kernel resueltos bajo demanda (dj3_constant_0, bv3_s101, ...)
+_KERNEL_NAMES = {f"dj3_{name}": ("dj", 3, name, False) for name in DJ3_ORACLES}
+_KERNEL_NAMES.update({f"bv3_s{secret}": ("bv", 3, secret, False)
+                      for secret in all_secrets(3)})
+
+__getattr__ = lazy_kernels(_KERNEL_NAMES)
 
 
 # ============================================================================
@@ -368,33 +202,37 @@ def run_bernstein_vazirani_3qubits(kernel_func, secret_string, shots=1000):
 # ============================================================================
 
 if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("ALGORITMOS CUÁNTICOS CON 3 QUBITS")
+    print("="*80)
     
     # EJECUTAR DEUTSCH-JOZSA
     print("\n" + "="*80)
     print("EJECUTANDO DEUTSCH-JOZSA DE 3 QUBITS")
     print("="*80)
     
-    run_deutsch_jozsa_3qubits(dj3_constant_0, "Constante: f(x) = 0")
-    run_deutsch_jozsa_3qubits(dj3_constant_1, "Constante: f(x) = 1")
-    run_deutsch_jozsa_3qubits(dj3_balanced_x0, "Balanceada: f(x) = x₀")
-    run_deutsch_jozsa_3qubits(dj3_balanced_x1, "Balanceada: f(x) = x₁")
-    run_deutsch_jozsa_3qubits(dj3_balanced_x2, "Balanceada: f(x) = x₂")
-    run_deutsch_jozsa_3qubits(dj3_balanced_xor_01, "Balanceada: f(x) = x₀⊕x₁")
-    run_deutsch_jozsa_3qubits(dj3_balanced_majority, "Balanceada: f(x) = majority")
+    run_deutsch_jozsa_3qubits(get_kernel("dj", 3, "constant_0"), "Constante: f(x) = 0")
+    run_deutsch_jozsa_3qubits(get_kernel("dj", 3, "constant_1"), "Constante: f(x) = 1")
+    run_deutsch_jozsa_3qubits(get_kernel("dj", 3, "balanced_x0"), "Balanceada: f(x) = x₀")
+    run_deutsch_jozsa_3qubits(get_kernel("dj", 3, "balanced_x1"), "Balanceada: f(x) = x₁")
+    run_deutsch_jozsa_3qubits(get_kernel("dj", 3, "balanced_x2"), "Balanceada: f(x) = x₂")
+    run_deutsch_jozsa_3qubits(get_kernel("dj", 3, "balanced_xor_01"), "Balanceada: f(x) = x₀⊕x₁")
+    run_deutsch_jozsa_3qubits(get_kernel("dj", 3, "balanced_majority"), "Balanceada: f(x) = majority")
     
     # EJECUTAR BERNSTEIN-VAZIRANI
     print("\n\n" + "="*80)
     print("EJECUTANDO BERNSTEIN-VAZIRANI DE 3 QUBITS")
     print("="*80)
-    
-    run_bernstein_vazirani_3qubits(bv3_s000, "000")
-    run_bernstein_vazirani_3qubits(bv3_s001, "001")
-    run_bernstein_vazirani_3qubits(bv3_s010, "010")
-    run_bernstein_vazirani_3qubits(bv3_s011, "011")
-    run_bernstein_vazirani_3qubits(bv3_s100, "100")
-    run_bernstein_vazirani_3qubits(bv3_s101, "101")
-    run_bernstein_vazirani_3qubits(bv3_s110, "110")
-    run_bernstein_vazirani_3qubits(bv3_s111, "111")
+    print("\nCon 3 qubits hay 2³ = 8 cadenas secretas posibles")
+    
+    run_bernstein_vazirani_3qubits(get_kernel("bv", 3, "000"), "000")
+    run_bernstein_vazirani_3qubits(get_kernel("bv", 3, "001"), "001")
+    run_bernstein_vazirani_3qubits(get_kernel("bv", 3, "010"), "010")
+    run_bernstein_vazirani_3qubits(get_kernel("bv", 3, "011"), "011")
+    run_bernstein_vazirani_3qubits(get_kernel("bv", 3, "100"), "100")
+    run_bernstein_vazirani_3qubits(get_kernel("bv", 3, "101"), "101")
+    run_bernstein_vazirani_3qubits(get_kernel("bv", 3, "110"), "110")
+    run_bernstein_vazirani_3qubits(get_kernel("bv", 3, "111"), "111")
     
    # RESUMEN
     print("\n\n" + "="*80)
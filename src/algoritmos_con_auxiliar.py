@@ -1,345 +1,254 @@
-import cudaq
+import time
+from collections import Counter
+
+import numpy as np
+
+from clasificacion_adaptativa import classify_dj_adaptive
+from ejecucion import resolve_engine, sample_kernel
+from marginales import counts_to_arrays, index_to_bits, marginalize
+from motor_exacto import exact_probabilities, format_probabilities, marginal_probabilities
+from oraculos import DJ_AUX_ORACLES, all_secrets
+from recursos_circuito import GATE_LABELS, resource_comparison
+from registro_kernels import get_kernel, lazy_kernels
+from sumidero_resultados import (kernel_variant, probability_record, run_record, silent,
+                                 summarize_counts)
 
 # ============================================================================
 # ALGORITMOS DEUTSCH-JOZSA Y BERNSTEIN-VAZIRANI CON QUBIT AUXILIAR
 # ============================================================================
-
-print("\n" + "="*80)
-print("ALGORITMOS CUÁNTICOS CON QUBIT AUXILIAR (Versión Tradicional)")
-print("="*80)
+#
+# Los kernels dj_aux_* y bv_aux_* se construyen al primer uso desde el
+# registro perezoso (registro_kernels.py), a partir de los oráculos de
+# oraculos.py. Importar este módulo no compila ni imprime nada.
+# ============================================================================
 
 # ============================================================================
 # PARTE 1: DEUTSCH-JOZSA CON QUBIT AUXILIAR (2 QUBITS DE TRABAJO + 1 AUXILIAR)
 # ============================================================================
-
-print("\n" + "="*80)
-print("PARTE 1: ALGORITMO DEUTSCH-JOZSA CON QUBIT AUXILIAR")
-print("="*80)
-print("\nEsquema: 2 qubits de trabajo + 1 qubit auxiliar = 3 qubits totales")
-
-# Funciones CONSTANTES
-
-@cudaq.kernel
-def dj_aux_constant_0():
-    """DJ con auxiliar: f(x) = 0 para todo x"""
-    qubits = cudaq.qvector(3)  # 2 trabajo + 1 auxiliar
-    
-    # Preparar auxiliar en |1⟩
-    x(qubits[2])
-    
-    # Hadamard en todos los qubits
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])  # Auxiliar: (|0⟩ - |1⟩)/√2
-    
-    # Oráculo: f(x) = 0 → no hace nada
-    # No aplicamos ninguna operación
-    
-    # Hadamard en qubits de trabajo
-    h(qubits[0])
-    h(qubits[1])
-    
-    # Medir solo los qubits de trabajo
-    mz(qubits[0])
-    mz(qubits[1])
-
-
-@cudaq.kernel
-def dj_aux_constant_1():
-    """DJ con auxiliar: f(x) = 1 para todo x"""
-    qubits = cudaq.qvector(3)
-    
-    # Preparar auxiliar en |1⟩
-    x(qubits[2])
-    
-    # Hadamard en todos
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Oráculo: f(x) = 1 → aplicar X al auxiliar para todo x
-    # Esto equivale a aplicar CNOT desde cada qubit de trabajo
-    # Pero como f(x)=1 siempre, aplicamos X directo
-    x(qubits[2])
-    
-    # Hadamard en qubits de trabajo
-    h(qubits[0])
-    h(qubits[1])
-    
-    mz(qubits[0])
-    mz(qubits[1])
-
-
-# Funciones BALANCEADAS
-
-@cudaq.kernel
-def dj_aux_balanced_x0():
-    """DJ con auxiliar: f(x) = x₀"""
-    qubits = cudaq.qvector(3)
-    
-    x(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Oráculo: f(x) = x₀ → CNOT de q0 a auxiliar
-    cx(qubits[0], qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    
-    mz(qubits[0])
-    mz(qubits[1])
-
-
-@cudaq.kernel
-def dj_aux_balanced_x1():
-    """DJ con auxiliar: f(x) = x₁"""
-    qubits = cudaq.qvector(3)
-    
-    x(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Oráculo: f(x) = x₁ → CNOT de q1 a auxiliar
-    cx(qubits[1], qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    
-    mz(qubits[0])
-    mz(qubits[1])
-
-
-@cudaq.kernel
-def dj_aux_balanced_xor():
-    """DJ con auxiliar: f(x) = x₀ ⊕ x₁"""
-    qubits = cudaq.qvector(3)
-    
-    x(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Oráculo: f(x) = x₀ ⊕ x₁ → CNOT de q0 y q1 a auxiliar
-    cx(qubits[0], qubits[2])
-    cx(qubits[1], qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    
-    mz(qubits[0])
-    mz(qubits[1])
-
-
-@cudaq.kernel
-def dj_aux_balanced_xnor():
-    """DJ con auxiliar: f(x) = NOT(x₀ ⊕ x₁)"""
-    qubits = cudaq.qvector(3)
-    
-    x(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Oráculo: f(x) = NOT(x₀ ⊕ x₁)
-    # Primero calculamos x₀ ⊕ x₁
-    cx(qubits[0], qubits[2])
-    cx(qubits[1], qubits[2])
-    # Luego negamos el resultado
-    x(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    
-    mz(qubits[0])
-    mz(qubits[1])
-
-
-def run_deutsch_jozsa_auxiliar(kernel_func, function_name, shots=1000):
-    """Ejecuta y analiza Deutsch-Jozsa CON qubit auxiliar"""
-    
-    print(f"\n{'='*80}")
-    print(f"Función: {function_name}")
-    print(f"{'='*80}")
-    
-    result = cudaq.sample(kernel_func, shots_count=shots)
-    print(f"\nResultados ({shots} shots):")
-    print(result)
-    
-    # Analizar (solo miramos los primeros 2 bits, ignoramos el auxiliar)
-    result_dict = {}
-    for bits, count in result.items():
-        # Extraer solo los 2 primeros bits (qubits de trabajo)
-        work_bits = bits[:2] if len(bits) >= 2 else bits
-        result_dict[work_bits] = result_dict.get(work_bits, 0) + count
-    
-    prob_00 = result_dict.get('00', 0) / shots
-    
-    print(f"\nProbabilidad de medir |00⟩ (qubits de trabajo): {prob_00:.4f}")
-    
-    if prob_00 > 0.9:
-        print("✓ Conclusión: CONSTANTE")
+#
+# Esquema de cada kernel (qubits 0-1 de trabajo, qubit 2 auxiliar):
+#   X(aux), H en todos → auxiliar en (|0⟩ - |1⟩)/√2
+#   Oráculo: CNOT desde los qubits de trabajo hacia el auxiliar
+#   H en los qubits de trabajo y medición solo de ellos
+#
+# Funciones CONSTANTES:
+#   dj_aux_constant_0      f(x) = 0          → sin operación
+#   dj_aux_constant_1      f(x) = 1          → X(aux)
+#
+# Funciones BALANCEADAS:
+#   dj_aux_balanced_x0     f(x) = x₀         → CX(q0, aux)
+#   dj_aux_balanced_x1     f(x) = x₁         → CX(q1, aux)
+#   dj_aux_balanced_xor    f(x) = x₀ ⊕ x₁    → CX(q0, aux) CX(q1, aux)
+#   dj_aux_balanced_xnor   f(x) = NOT(x₀ ⊕ x₁) → CX(q0, aux) CX(q1, aux) X(aux)
+
+
+def run_deutsch_jozsa_auxiliar(kernel_func, function_name, shots=1000, kernel_args=(),
+                               engine="cudaq", seed=None, adaptive=False, ancilla_qubits=None,
+                               exact=False, sink=None, verbose=True):
+    """Ejecuta y analiza Deutsch-Jozsa CON qubit auxiliar
+
+    ancilla_qubits: posiciones de la cadena medida a descartar; por defecto
+    todo lo que sigue a los 2 qubits de trabajo.
+    """
+    say = print if verbose else silent
+    
+    say(f"\n{'='*80}")
+    say(f"Función: {function_name}")
+    say(f"{'='*80}")
+    
+    if adaptive:
+        # Modo adaptativo: bloques pequeños + SPRT, con `shots` como máximo
+        engine = resolve_engine(kernel_func, kernel_args, engine)
+        tally = Counter()
+        start = time.perf_counter()
+        constant, used = classify_dj_adaptive(kernel_func, kernel_args, engine, tally,
+                                              max_shots=shots,
+                                              drop_qubits=ancilla_qubits or ())
+        elapsed = time.perf_counter() - start
+        say(f"\nModo adaptativo (SPRT): {used} de {shots} shots usados")
+        say("✓ Conclusión: CONSTANTE" if constant else "✓ Conclusión: BALANCEADA")
+        width = len(next(iter(tally)))
+        kept = width - len(set(ancilla_qubits or ()))
+        record = run_record(tally, "dj", kept, function_name,
+                            kernel_variant(kernel_func, kernel_args, "ancilla"), engine, used,
+                            elapsed_s=elapsed, verdict="constant" if constant else "balanced",
+                            max_shots=shots)
+        if sink is not None:
+            sink.write(record)
+        return record
+    
+    if exact:
+        # Modo exacto: vector de estado y suma sobre el auxiliar, sin shots
+        start = time.perf_counter()
+        probs, width = exact_probabilities(kernel_func, kernel_args)
+        if ancilla_qubits is None:
+            ancilla_qubits = range(2, width)
+        probs, kept = marginal_probabilities(probs, width, ancilla_qubits)
+        elapsed = time.perf_counter() - start
+        say("\nProbabilidades exactas (qubits de trabajo):")
+        say(format_probabilities(probs, kept))
+        say(f"\nProbabilidad de medir |00⟩ (qubits de trabajo): {probs[0]:.4f}")
+        say("✓ Conclusión: CONSTANTE" if probs[0] > 0.9 else "✓ Conclusión: BALANCEADA")
+        record = probability_record(probs, kept, "dj", kept, function_name,
+                                    kernel_variant(kernel_func, kernel_args, "ancilla"), elapsed,
+                                    "constant" if probs[0] > 0.9 else "balanced")
+        if sink is not None:
+            sink.write(record)
+        return record
+    
+    # El registro guarda el motor usado, no "auto"
+    engine = resolve_engine(kernel_func, kernel_args, engine)
+    start = time.perf_counter()
+    result = sample_kernel(kernel_func, kernel_args, shots, engine, seed)
+    elapsed = time.perf_counter() - start
+    say(f"\nResultados ({shots} shots):")
+    if verbose:
+        say(summarize_counts(result))
+    
+    # Analizar (descartamos el auxiliar con operaciones de bits vectorizadas)
+    indices, counts, width = counts_to_arrays(result)
+    if ancilla_qubits is None:
+        ancilla_qubits = range(2, width)
+    indices, counts, kept = marginalize(indices, counts, width, ancilla_qubits)
+    
+    prob_00 = counts[indices == 0].sum() / shots
+    
+    say(f"\nProbabilidad de medir |{'0' * kept}⟩ (qubits de trabajo): {prob_00:.4f}")
+    
+    constant = prob_00 > 0.9
+    if constant:
+        say("✓ Conclusión: CONSTANTE")
     else:
-        print("✓ Conclusión: BALANCEADA")
+        say("✓ Conclusión: BALANCEADA")
+    
+    record = run_record(result, "dj", kept, function_name,
+                        kernel_variant(kernel_func, kernel_args, "ancilla"), engine, shots,
+                        elapsed_s=elapsed, verdict="constant" if constant else "balanced")
+    if sink is not None:
+        sink.write(record)
+    return record
 
 
 # ============================================================================
 # PARTE 2: BERNSTEIN-VAZIRANI CON QUBIT AUXILIAR
 # ============================================================================
-
-print("\n\n" + "="*80)
-print("PARTE 2: ALGORITMO BERNSTEIN-VAZIRANI CON QUBIT AUXILIAR")
-print("="*80)
-print("\nEsquema: 2 qubits de trabajo + 1 qubit auxiliar = 3 qubits totales")
-
-# Las 4 cadenas secretas posibles para 2 qubits
-
-@cudaq.kernel
-def bv_aux_s00():
-    """BV con auxiliar: s = "00" → f(x) = 0"""
-    qubits = cudaq.qvector(3)
-    
-    # Preparar auxiliar en |1⟩
-    x(qubits[2])
-    
-    # Hadamard en todos
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Oráculo: f(x) = 0 (no hace nada)
-    
-    # Hadamard en qubits de trabajo
-    h(qubits[0])
-    h(qubits[1])
-    
-    mz(qubits[0])
-    mz(qubits[1])
-
-
-@cudaq.kernel
-def bv_aux_s01():
-    """BV con auxiliar: s = "01" → f(x) = x₁"""
-    qubits = cudaq.qvector(3)
-    
-    x(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Oráculo: s₁ = 1 → CNOT de q1 a auxiliar
-    cx(qubits[1], qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    
-    mz(qubits[0])
-    mz(qubits[1])
-
-
-@cudaq.kernel
-def bv_aux_s10():
-    """BV con auxiliar: s = "10" → f(x) = x₀"""
-    qubits = cudaq.qvector(3)
-    
-    x(qubits[2])
+#
+# Las 4 cadenas secretas posibles para 2 qubits: bv_aux_s00 … bv_aux_s11.
+# El oráculo aplica CNOT hacia el auxiliar desde cada qubit i con s_i = 1.
+
+
+def run_bernstein_vazirani_auxiliar(kernel_func, secret_string, shots=1000, kernel_args=(),
+                                    engine="cudaq", seed=None, ancilla_qubits=None, exact=False,
+                                    sink=None, verbose=True):
+    """Ejecuta y analiza Bernstein-Vazirani CON qubit auxiliar
+
+    ancilla_qubits: posiciones de la cadena medida a descartar; por defecto
+    todo lo que sigue a los len(secret_string) qubits de trabajo.
+    """
+    say = print if verbose else silent
+    
+    say(f"\n{'='*80}")
+    say(f"Buscando cadena secreta: s = \"{secret_string}\"")
+    say(f"{'='*80}")
+    
+    if exact:
+        # Modo exacto: vector de estado y suma sobre el auxiliar, sin shots
+        start = time.perf_counter()
+        probs, width = exact_probabilities(kernel_func, kernel_args)
+        if ancilla_qubits is None:
+            ancilla_qubits = range(len(secret_string), width)
+        probs, kept = marginal_probabilities(probs, width, ancilla_qubits)
+        elapsed = time.perf_counter() - start
+        say("\nProbabilidades exactas (qubits de trabajo):")
+        say(format_probabilities(probs, kept))
+        
+        measured_state = index_to_bits(probs.argmax(), kept)
+        say(f"\nEstado más probable (qubits de trabajo): |{measured_state}⟩")
+        say(f"Probabilidad exacta: {probs.max():.4f}")
+        
+        if measured_state == secret_string:
+            say(f"✓ ¡ÉXITO! Cadena recuperada: s = \"{measured_state}\"")
+        else:
+            say(f"✗ ERROR: Esperaba \"{secret_string}\" pero midió \"{measured_state}\"")
+        record = probability_record(probs, kept, "bv", kept, secret_string,
+                                    kernel_variant(kernel_func, kernel_args, "ancilla"), elapsed,
+                                    measured_state)
+        if sink is not None:
+            sink.write(record)
+        return record
+    
+    # El registro guarda el motor usado, no "auto"
+    engine = resolve_engine(kernel_func, kernel_args, engine)
+    start = time.perf_counter()
+    result = sample_kernel(kernel_func, kernel_args, shots, engine, seed)
+    elapsed = time.perf_counter() - start
+    say(f"\nResultados ({shots} shots):")
+    if verbose:
+        say(summarize_counts(result))
+    
+    # Analizar (solo los qubits de trabajo)
+    indices, counts, width = counts_to_arrays(result)
+    if ancilla_qubits is None:
+        ancilla_qubits = range(len(secret_string), width)
+    indices, counts, kept = marginalize(indices, counts, width, ancilla_qubits)
+    
+    best = int(np.argmax(counts))
+    max_count = int(counts[best])
+    measured_state = index_to_bits(indices[best], kept)
     
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
+    probability = max_count / shots
     
-    # Oráculo: s₀ = 1 → CNOT de q0 a auxiliar
-    cx(qubits[0], qubits[2])
+    say(f"\nEstado medido más frecuente (qubits de trabajo): |{measured_state}⟩")
+    say(f"Probabilidad: {probability:.4f} ({max_count}/{shots})")
     
-    h(qubits[0])
-    h(qubits[1])
+    if measured_state == secret_string:
+        say(f"✓ ¡ÉXITO! Cadena recuperada: s = \"{measured_state}\"")
+    else:
+        say(f"✗ ERROR: Esperaba \"{secret_string}\" pero midió \"{measured_state}\"")
     
-    mz(qubits[0])
-    mz(qubits[1])
+    record = run_record(result, "bv", kept, secret_string,
+                        kernel_variant(kernel_func, kernel_args, "ancilla"), engine, shots,
+                        elapsed_s=elapsed, verdict=measured_state)
+    if sink is not None:
+        sink.write(record)
+    return record
 
 
-@cudaq.kernel
-def bv_aux_s11():
-    """BV con auxiliar: s = "11" → f(x) = x₀ ⊕ x₁"""
-    qubits = cudaq.qvector(3)
-    
-    x(qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    h(qubits[2])
-    
-    # Oráculo: s₀ = 1 y s₁ = 1 → CNOT de ambos a auxiliar
-    cx(qubits[0], qubits[2])
-    cx(qubits[1], qubits[2])
-    
-    h(qubits[0])
-    h(qubits[1])
-    
-    mz(qubits[0])
-    mz(qubits[1])
+# Nombres de kernel resueltos bajo demanda (dj_aux_constant_0, bv_aux_s11, ...)
+_KERNEL_NAMES = {f"dj_aux_{name}": ("dj", 2, name, True) for name in DJ_AUX_ORACLES}
+_KERNEL_NAMES.update({f"bv_aux_s{secret}": ("bv", 2, secret, True)
+                      for secret in all_secrets(2)})
 
-
-def run_bernstein_vazirani_auxiliar(kernel_func, secret_string, shots=1000):
-    """Ejecuta y analiza Bernstein-Vazirani CON qubit auxiliar"""
-    
-    print(f"\n{'='*80}")
-    print(f"Buscando cadena secreta: s = \"{secret_string}\"")
-    print(f"{'='*80}")
-    
-    result = cudaq.sample(kernel_func, shots_count=shots)
-    print(f"\nResultados ({shots} shots):")
-    print(result)
-    
-    # Analizar (solo los 2 primeros bits)
-    result_dict = {}
-    max_count = 0
-    measured_state = ""
-    
-    for bits, count in result.items():
-        work_bits = bits[:2] if len(bits) >= 2 else bits
-        result_dict[work_bits] = result_dict.get(work_bits, 0) + count
-        if result_dict[work_bits] > max_count:
-            max_count = result_dict[work_bits]
-            measured_state = work_bits
-    
-    probability = max_count / shots
-    
-    print(f"\nEstado medido más frecuente (qubits de trabajo): |{measured_state}⟩")
-    print(f"Probabilidad: {probability:.4f} ({max_count}/{shots})")
-    
-    if measured_state == secret_string:
-        print(f"✓ ¡ÉXITO! Cadena recuperada: s = \"{measured_state}\"")
-    else:
-        print(f"✗ ERROR: Esperaba \"{secret_string}\" pero midió \"{measured_state}\"")
+__getattr__ = lazy_kernels(_KERNEL_NAMES)
 
 
 # ============================================================================
 # COMPARACIÓN: CON vs SIN QUBIT AUXILIAR
 # ============================================================================
 
-def print_comparison_table():
-    """Imprime tabla comparativa de recursos"""
+def print_comparison_table(n_values=(2, 3)):
+    """Imprime tabla comparativa de recursos (medidos sobre los kernels de BV
+    con s = 11...1)"""
     
     print("\n" + "="*80)
     print("COMPARACIÓN: CON QUBIT AUXILIAR vs SIN QUBIT AUXILIAR")
     print("="*80)
     
+    measured = resource_comparison(n_values)
+    
     print("\n┌─────────────────────┬──────────────────┬──────────────────┬─────────────┐")
     print("│ Aspecto             │ CON Auxiliar     │ SIN Auxiliar     │ Mejora      │")
+    for n in n_values:
+        for label, field in [("Qubits", "qubits"), ("Compuertas", "total_gates"),
+                             ("Profundidad", "depth"), ("Dos qubits", "two_qubit_gates")]:
+            con, sin = measured[n]["ancilla"][field], measured[n]["phase"][field]
+            change = f"{(sin - con) / con:+.0%}" if con else "="
+            print("├─────────────────────┼──────────────────┼──────────────────┼─────────────┤")
+            print(f"│ {f'{label} (n={n})':<19} │ {con:^16} │ {sin:^16} │ {change:^11} │")
     print("├─────────────────────┼──────────────────┼──────────────────┼─────────────┤")
-    print("│ Qubits (n=2)        │        3         │        2         │   -33%      │")
-    print("├─────────────────────┼──────────────────┼──────────────────┼─────────────┤")
-    print("│ Qubits (n=3)        │        4         │        3         │   -25%      │")
-    print("├─────────────────────┼──────────────────┼──────────────────┼─────────────┤")
-    print("│ Compuertas típicas  │    CNOT, H, X    │      Z, H        │  Más simple │")
+    con, sin = [", ".join(GATE_LABELS[name] for name in measured[n_values[0]][variant]["gates"])
+                for variant in ("ancilla", "phase")]
+    print(f"│ Compuertas típicas  │ {con:^16} │ {sin:^16} │  Más simple │")
     print("├─────────────────────┼──────────────────┼──────────────────┼─────────────┤")
     print("│ Complejidad oráculo │    Mayor         │     Menor        │    Mejor    │")
     print("├─────────────────────┼──────────────────┼──────────────────┼─────────────┤")
@@ -367,28 +276,39 @@ def print_comparison_table():
 # ============================================================================
 
 if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("ALGORITMOS CUÁNTICOS CON QUBIT AUXILIAR (Versión Tradicional)")
+    print("="*80)
     
     # EJECUTAR DEUTSCH-JOZSA CON AUXILIAR
     print("\n" + "="*80)
     print("EJECUTANDO DEUTSCH-JOZSA CON QUBIT AUXILIAR")
     print("="*80)
-    
-    run_deutsch_jozsa_auxiliar(dj_aux_constant_0, "Constante: f(x) = 0")
-    run_deutsch_jozsa_auxiliar(dj_aux_constant_1, "Constante: f(x) = 1")
-    run_deutsch_jozsa_auxiliar(dj_aux_balanced_x0, "Balanceada: f(x) = x₀")
-    run_deutsch_jozsa_auxiliar(dj_aux_balanced_x1, "Balanceada: f(x) = x₁")
-    run_deutsch_jozsa_auxiliar(dj_aux_balanced_xor, "Balanceada: f(x) = x₀⊕x₁")
-    run_deutsch_jozsa_auxiliar(dj_aux_balanced_xnor, "Balanceada: f(x) = NOT(x₀⊕x₁)")
+    print("\nEsquema: 2 qubits de trabajo + 1 qubit auxiliar = 3 qubits totales")
+    
+    run_deutsch_jozsa_auxiliar(get_kernel("dj", 2, "constant_0", ancilla=True),
+                               "Constante: f(x) = 0")
+    run_deutsch_jozsa_auxiliar(get_kernel("dj", 2, "constant_1", ancilla=True),
+                               "Constante: f(x) = 1")
+    run_deutsch_jozsa_auxiliar(get_kernel("dj", 2, "balanced_x0", ancilla=True),
+                               "Balanceada: f(x) = x₀")
+    run_deutsch_jozsa_auxiliar(get_kernel("dj", 2, "balanced_x1", ancilla=True),
+                               "Balanceada: f(x) = x₁")
+    run_deutsch_jozsa_auxiliar(get_kernel("dj", 2, "balanced_xor", ancilla=True),
+                               "Balanceada: f(x) = x₀⊕x₁")
+    run_deutsch_jozsa_auxiliar(get_kernel("dj", 2, "balanced_xnor", ancilla=True),
+                               "Balanceada: f(x) = NOT(x₀⊕x₁)")
     
     # EJECUTAR BERNSTEIN-VAZIRANI CON AUXILIAR
     print("\n\n" + "="*80)
     print("EJECUTANDO BERNSTEIN-VAZIRANI CON QUBIT AUXILIAR")
     print("="*80)
+    print("\nEsquema: 2 qubits de trabajo + 1 qubit auxiliar = 3 qubits totales")
     
-    run_bernstein_vazirani_auxiliar(bv_aux_s00, "00")
-    run_bernstein_vazirani_auxiliar(bv_aux_s01, "01")
-    run_bernstein_vazirani_auxiliar(bv_aux_s10, "10")
-    run_bernstein_vazirani_auxiliar(bv_aux_s11, "11")
+    run_bernstein_vazirani_auxiliar(get_kernel("bv", 2, "00", ancilla=True), "00")
+    run_bernstein_vazirani_auxiliar(get_kernel("bv", 2, "01", ancilla=True), "01")
+    run_bernstein_vazirani_auxiliar(get_kernel("bv", 2, "10", ancilla=True), "10")
+    run_bernstein_vazirani_auxiliar(get_kernel("bv", 2, "11", ancilla=True), "11")
     
     # TABLA COMPARATIVA
     print_comparison_table()
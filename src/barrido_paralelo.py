@@ -0,0 +1,156 @@
+import contextlib
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import get_context
+
+from oraculos import all_secrets
+
+# ============================================================================
+# BARRIDO PARALELO DE ORÁCULOS EN VARIOS NÚCLEOS
+# ============================================================================
+#
+# Verificar BV sobre las 2^n cadenas secretas, o DJ sobre muchas funciones,
+# es trivialmente paralelo. Cada trabajo es (algoritmo, n, oráculo, variante)
+# con variante "phase" (kernel paramétrico, sin auxiliar) o "ancilla"
+# (kernel del registro); se reparten en bloques
+# entre procesos, cada uno con su propio simulador de CPU inicializado una
+# vez, y los resultados vuelven en orden de finalización.
+# ============================================================================
+
+VARIANTS = ("phase", "ancilla")
+
+
+@contextlib.contextmanager
+def _single_thread_environment():
+    """OMP_NUM_THREADS=1 (si no está fijado) solo mientras dura el bloque
+
+    Los hijos de "spawn" copian os.environ al arrancar, dentro de
+    pool.submit; envolviendo solo esa llamada (sin yield dentro) el entorno
+    del proceso padre vuelve enseguida a su estado.
+    """
+    if "OMP_NUM_THREADS" in os.environ:
+        yield
+        return
+    os.environ["OMP_NUM_THREADS"] = "1"
+    try:
+        yield
+    finally:
+        os.environ.pop("OMP_NUM_THREADS", None)
+
+
+def _init_worker(target):
+    # Un hilo por proceso: el paralelismo lo dan los procesos
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    import cudaq
+    cudaq.set_target(target)
+
+
+def _run_chunk(jobs, shots):
+    from ejecucion import sample_kernel
+    from marginales import marginal_counts
+    from oraculo_parametrico import phase_oracle_kernel
+    from oraculos import oracle_gates, phase_oracle_args
+    from registro_kernels import get_kernel
+
+    records = []
+    for algorithm, n, oracle, variant in jobs:
+        start = time.perf_counter()
+        if variant == "phase":
+            # Kernel paramétrico: una sola compilación por proceso
+            kernel = phase_oracle_kernel
+            args = phase_oracle_args(n, oracle_gates(algorithm, n, oracle))
+        else:
+            kernel, args = get_kernel(algorithm, n, oracle, ancilla=True), ()
+        result = sample_kernel(kernel, args, shots)
+        indices, counts, width = marginal_counts(result, ())
+
+        if algorithm == "dj":
+            outcome = counts[indices == 0].sum() / shots > 0.9
+        else:
+            outcome = format(int(indices[counts.argmax()]), f"0{width}b")
+
+        records.append({
+            "algorithm": algorithm,
+            "n": n,
+            "oracle": oracle,
+            "variant": variant,
+            "shots": shots,
+            "outcome": bool(outcome) if algorithm == "dj" else outcome,
+            "ok": outcome == oracle if algorithm == "bv" else None,
+            "elapsed_s": time.perf_counter() - start,
+            "pid": os.getpid(),
+        })
+    return records
+
+
+def bv_exhaustive_jobs(n, variant="phase"):
+    """Un trabajo BV por cada una de las 2^n cadenas secretas"""
+    return [("bv", n, secret, variant) for secret in all_secrets(n)]
+
+
+def sweep(jobs, workers=None, target="qpp-cpu", shots=1000, chunk_size=16,
+          max_pending=None):
+    """Ejecuta los trabajos en un pool de procesos y entrega resultados en
+    orden de finalización (generador)
+
+    Los trabajos se envían en bloques de chunk_size y como mucho max_pending
+    bloques en vuelo (por defecto 2 por proceso), así que la lista de
+    trabajos puede ser un iterador arbitrariamente largo.
+    """
+    workers = workers or os.cpu_count()
+    max_pending = max_pending or 2 * workers
+    jobs = iter(jobs)
+
+    def next_chunk():
+        chunk = []
+        for job in jobs:
+            chunk.append(job)
+            if len(chunk) == chunk_size:
+                break
+        return chunk
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                             initializer=_init_worker, initargs=(target,)) as pool:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_pending:
+                chunk = next_chunk()
+                if not chunk:
+                    exhausted = True
+                    break
+                # Los procesos arrancan dentro de submit: heredan OMP_NUM_THREADS=1
+                with _single_thread_environment():
+                    pending.add(pool.submit(_run_chunk, chunk, shots))
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("BARRIDO PARALELO: BERNSTEIN-VAZIRANI EXHAUSTIVO")
+    print("="*80)
+
+    n = 8
+    jobs = bv_exhaustive_jobs(n) + bv_exhaustive_jobs(n, "ancilla")
+    print(f"\n{len(jobs)} trabajos (BV n={n}, todas las cadenas, con y sin auxiliar)")
+
+    print("\n┌───────────┬──────────────┬──────────────┬──────────────┐")
+    print("│ Procesos  │ Tiempo (s)   │ Trabajos/s   │ Aceleración  │")
+    print("├───────────┼──────────────┼──────────────┼──────────────┤")
+    baseline = None
+    counts = [1, 2, 4, os.cpu_count()]
+    for workers in sorted({w for w in counts if w <= os.cpu_count()}):
+        start = time.perf_counter()
+        records = list(sweep(jobs, workers=workers))
+        elapsed = time.perf_counter() - start
+        assert len(records) == len(jobs) and all(r["ok"] for r in records)
+        baseline = baseline or elapsed
+        speedup = f"{baseline / elapsed:.2f}x"
+        print(f"│ {workers:^9} │ {elapsed:^12.2f} │ {len(jobs) / elapsed:^12.1f} │ "
+              f"{speedup:^12} │")
+    print("└───────────┴──────────────┴──────────────┴──────────────┘")
+    print("\n💡 El tiempo incluye el arranque de los procesos (importar CUDA-Q).")
+    print("="*80 + "\n")
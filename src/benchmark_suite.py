@@ -0,0 +1,141 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import cudaq
+
+from oraculo_parametrico import phase_oracle_kernel
+from oraculos import bv_oracle, phase_oracle_args
+from registro_kernels import clear_registry, get_kernel
+
+# ============================================================================
+# SUITE DE BENCHMARKS: COMPILACIÓN, LATENCIA Y SHOTS/SEGUNDO
+# ============================================================================
+#
+# Mide las rutas calientes del proyecto en una máquina Linux solo con CPU:
+#
+#   compile_s   primera llamada a cudaq.sample menos la latencia estable
+#               (construcción + JIT del kernel; el kernel paramétrico solo
+#               se compila una vez por proceso, así que después marca ~0)
+#   latency_s   mediana de cudaq.sample con pocos shots
+#   shots_per_s shots / tiempo con muchos shots
+#
+# Barre n, la variante de oráculo (fase del registro, auxiliar del registro,
+# kernel paramétrico) y los targets de CPU disponibles, y emite JSON para
+# comparar ejecuciones a lo largo del tiempo:
+#
+#   python benchmark_suite.py --n 2 4 8 --output resultados_benchmark.json
+# ============================================================================
+
+CPU_TARGETS = ("qpp-cpu", "density-matrix-cpu")
+VARIANTS = ("phase", "ancilla", "parametric")
+
+# La matriz densidad ocupa 4^n: se limita el tamaño en ese target
+MAX_QUBITS = {"qpp-cpu": 24, "density-matrix-cpu": 10}
+
+
+def _secret(n):
+    """Cadena secreta fija y no trivial para cada n (1010...)"""
+    return ("10" * n)[:n]
+
+
+def _kernel_and_args(variant, n):
+    if variant == "parametric":
+        return phase_oracle_kernel, phase_oracle_args(n, bv_oracle(_secret(n)))
+    return get_kernel("bv", n, _secret(n), ancilla=(variant == "ancilla")), ()
+
+
+def bench_case(target, variant, n, repeats=20, latency_shots=100, throughput_shots=100000):
+    """Un registro de benchmark para (target, variante, n)"""
+    clear_registry()
+
+    start = time.perf_counter()
+    kernel, args = _kernel_and_args(variant, n)
+    cudaq.sample(kernel, *args, shots_count=latency_shots)
+    first_call = time.perf_counter() - start
+
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        cudaq.sample(kernel, *args, shots_count=latency_shots)
+        latencies.append(time.perf_counter() - start)
+    latency = statistics.median(latencies)
+
+    start = time.perf_counter()
+    cudaq.sample(kernel, *args, shots_count=throughput_shots)
+    throughput = throughput_shots / (time.perf_counter() - start)
+
+    return {
+        "target": target,
+        "variant": variant,
+        "n": n,
+        "qubits": n + 1 if variant == "ancilla" else n,
+        "compile_s": max(first_call - latency, 0.0),
+        "first_call_s": first_call,
+        "latency_s": latency,
+        "latency_p90_s": sorted(latencies)[int(0.9 * (len(latencies) - 1))],
+        "latency_shots": latency_shots,
+        "shots_per_s": throughput,
+        "throughput_shots": throughput_shots,
+    }
+
+
+def run_suite(n_values, variants=VARIANTS, targets=CPU_TARGETS, **options):
+    """Ejecuta el barrido completo y devuelve el documento JSON (dict)"""
+    records = []
+    for target in targets:
+        if not cudaq.has_target(target):
+            print(f"⚠ Target {target} no disponible, se omite", file=sys.stderr)
+            continue
+        cudaq.set_target(target)
+        for variant in variants:
+            for n in n_values:
+                qubits = n + 1 if variant == "ancilla" else n
+                if qubits > MAX_QUBITS.get(target, 24):
+                    continue
+                record = bench_case(target, variant, n, **options)
+                records.append(record)
+                print(f"{target:<20} {variant:<11} n={n:<3} "
+                      f"compila {record['compile_s']*1e3:8.2f} ms | "
+                      f"latencia {record['latency_s']*1e3:8.3f} ms | "
+                      f"{record['shots_per_s']:12.0f} shots/s", file=sys.stderr)
+    cudaq.reset_target()
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "cudaq_version": cudaq.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "records": records,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks de DJ/BV en CUDA-Q (CPU)")
+    parser.add_argument("--n", type=int, nargs="+", default=[2, 3, 4, 8, 12, 16])
+    parser.add_argument("--variants", nargs="+", default=list(VARIANTS), choices=VARIANTS)
+    parser.add_argument("--targets", nargs="+", default=list(CPU_TARGETS))
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--latency-shots", type=int, default=100)
+    parser.add_argument("--throughput-shots", type=int, default=100000)
+    parser.add_argument("--output", help="archivo JSON de salida (por defecto stdout)")
+    options = parser.parse_args()
+
+    document = run_suite(options.n, options.variants, options.targets,
+                         repeats=options.repeats,
+                         latency_shots=options.latency_shots,
+                         throughput_shots=options.throughput_shots)
+
+    if options.output:
+        with open(options.output, "w") as output:
+            json.dump(document, output, indent=2)
+        print(f"✓ Resultados guardados en: {options.output}", file=sys.stderr)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        print()
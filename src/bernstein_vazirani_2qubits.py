@@ -1,5 +1,12 @@
+import time
+
 import cudaq
 
+from ejecucion import resolve_engine, sample_kernel
+from motor_exacto import exact_probabilities, format_probabilities
+from sumidero_resultados import (kernel_variant, probability_record, run_record, silent,
+                                 summarize_counts)
+
 # ============================================================================
 # ALGORITMO BERNSTEIN-VAZIRANI DE 2 QUBITS SIN QUBIT AUXILIAR
 # ============================================================================
@@ -109,19 +116,50 @@ def bernstein_vazirani_s11():
 # FUNCIÓN PARA EJECUTAR Y ANALIZAR
 # ============================================================================
 
-def run_bernstein_vazirani(kernel_func, secret_string, shots=1000):
+def run_bernstein_vazirani(kernel_func, secret_string, shots=1000, kernel_args=(),
+                           engine="cudaq", seed=None, exact=False, sink=None, verbose=True):
     """Ejecuta el algoritmo y verifica si recupera la cadena secreta"""
-    
-    print(f"\n{'='*70}")
-    print(f"Buscando cadena secreta: s = \"{secret_string}\"")
-    print(f"{'='*70}")
+    say = print if verbose else silent
+    
+    say(f"\n{'='*70}")
+    say(f"Buscando cadena secreta: s = \"{secret_string}\"")
+    say(f"{'='*70}")
+    
+    if exact:
+        # Modo exacto: probabilidades del vector de estado, sin shots
+        start = time.perf_counter()
+        probs, width = exact_probabilities(kernel_func, kernel_args)
+        elapsed = time.perf_counter() - start
+        say("\nProbabilidades exactas (vector de estado):")
+        say(format_probabilities(probs, width))
+        
+        measured_state = format(int(probs.argmax()), f"0{width}b")
+        say(f"\nAnálisis:")
+        say(f"Estado más probable: |{measured_state}⟩")
+        say(f"Probabilidad exacta: {probs.max():.4f}")
+        
+        if measured_state == secret_string:
+            say(f"✓ ¡ÉXITO! Cadena secreta recuperada: s = \"{measured_state}\"")
+        else:
+            say(f"✗ ERROR: Se esperaba s = \"{secret_string}\" pero se midió |{measured_state}⟩")
+        record = probability_record(probs, width, "bv", width, secret_string,
+                                    kernel_variant(kernel_func, kernel_args), elapsed,
+                                    measured_state)
+        if sink is not None:
+            sink.write(record)
+        return record
     
     # Ejecutar el circuito
-    result = cudaq.sample(kernel_func, shots_count=shots)
+    # El registro guarda el motor usado, no "auto"
+    engine = resolve_engine(kernel_func, kernel_args, engine)
+    start = time.perf_counter()
+    result = sample_kernel(kernel_func, kernel_args, shots, engine, seed)
+    elapsed = time.perf_counter() - start
     
-    # Mostrar resultados
-    print(f"\nResultados de medición ({shots} shots):")
-    print(result)
+    # Mostrar resultados (el resumen solo se construye si se va a imprimir)
+    say(f"\nResultados de medición ({shots} shots):")
+    if verbose:
+        say(summarize_counts(result))
     
     # Analizar cuál estado se midió con mayor probabilidad
     result_dict = {}
@@ -136,17 +174,22 @@ def run_bernstein_vazirani(kernel_func, secret_string, shots=1000):
     
     probability = max_count / shots
     
-    print(f"\nAnálisis:")
-    print(f"Estado medido con mayor frecuencia: |{measured_state}⟩")
-    print(f"Probabilidad: {probability:.4f} ({max_count}/{shots})")
+    say(f"\nAnálisis:")
+    say(f"Estado medido con mayor frecuencia: |{measured_state}⟩")
+    say(f"Probabilidad: {probability:.4f} ({max_count}/{shots})")
     
     # Verificar si encontramos la cadena secreta
     if measured_state == secret_string:
-        print(f"✓ ¡ÉXITO! Cadena secreta recuperada: s = \"{measured_state}\"")
+        say(f"✓ ¡ÉXITO! Cadena secreta recuperada: s = \"{measured_state}\"")
     else:
-        print(f"✗ ERROR: Se esperaba s = \"{secret_string}\" pero se midió |{measured_state}⟩")
-    
-    return result
+        say(f"✗ ERROR: Se esperaba s = \"{secret_string}\" pero se midió |{measured_state}⟩")
+    
+    record = run_record(result, "bv", len(measured_state), secret_string,
+                        kernel_variant(kernel_func, kernel_args), engine, shots,
+                        elapsed_s=elapsed, verdict=measured_state)
+    if sink is not None:
+        sink.write(record)
+    return record
 
 
 # ============================================================================
@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from resultados import SampleCounts
+
+# ============================================================================
+# CACHÉ PERSISTENTE DE RESULTADOS EN DISCO
+# ============================================================================
+#
+# Cada llamada a sample_kernel() con el motor "cudaq" puede pasar por esta
+# caché direccionada por contenido. La clave es el SHA-256 de:
+#
+#   IR (Quake) del kernel + argumentos + shots + semilla + target activo
+#
+# Los kernels del constructor reciben un nombre aleatorio en cada proceso
+# (__nvqppBuilderKernel_XXXX), que se normaliza antes de calcular el hash,
+# igual que el atributo llvm.data_layout que CUDA-Q añade al módulo tras la
+# primera ejecución (si no, la segunda llamada tendría otra clave).
+#
+# Cada entrada es un archivo JSON {cadena: conteo}. Se escribe en un archivo
+# temporal del mismo directorio y se publica con os.replace (atómico), así que
+# varios procesos pueden compartir el directorio sin leer entradas a medias.
+# Una lectura actualiza la fecha de modificación y, al superar max_bytes, se
+# borran las entradas usadas hace más tiempo (LRU por mtime).
+#
+# La caché está desactivada por defecto: se activa con enable_cache() o con
+# la variable de entorno DJBV_CACHE_DIR. Solo se cachean las ejecuciones con
+# semilla: sin semilla cada llamada debe dar una muestra nueva (p. ej. los
+# bloques sucesivos del SPRT de clasificacion_adaptativa.py), así que esas
+# llamadas van siempre a cudaq.sample.
+# ============================================================================
+
+DEFAULT_MAX_BYTES = 256 * 1024**2
+
+_BUILDER_NAME = re.compile(r"__nvqppBuilderKernel_\w+")
+_DATA_LAYOUT = re.compile(r'llvm\.data_layout = "[^"]*", ')
+
+_config = {"directory": os.environ.get("DJBV_CACHE_DIR"), "max_bytes": DEFAULT_MAX_BYTES}
+
+
+def enable_cache(directory, max_bytes=DEFAULT_MAX_BYTES):
+    os.makedirs(directory, exist_ok=True)
+    _config["directory"] = directory
+    _config["max_bytes"] = max_bytes
+
+
+def disable_cache():
+    _config["directory"] = None
+
+
+def cache_directory():
+    return _config["directory"]
+
+
+def kernel_ir(kernel_func):
+    """IR del kernel con el nombre generado por el constructor normalizado"""
+    ir = _DATA_LAYOUT.sub("", str(kernel_func))
+    return _BUILDER_NAME.sub("__nvqppBuilderKernel", ir)
+
+
+def cache_key(kernel_func, kernel_args, shots, seed, target):
+    payload = json.dumps([kernel_ir(kernel_func), list(kernel_args), shots, seed, target],
+                         default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _entry_path(key):
+    return os.path.join(_config["directory"], f"{key}.json")
+
+
+def load(key):
+    """Conteos guardados para la clave, o None si no hay entrada válida"""
+    path = _entry_path(key)
+    try:
+        with open(path) as entry:
+            counts = json.load(entry)
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return SampleCounts(counts)
+
+
+def store(key, result):
+    directory = _config["directory"]
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "w") as entry:
+            json.dump(dict(result.items()), entry)
+        os.replace(temporary, _entry_path(key))
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    evict(_config["max_bytes"])
+
+
+def evict(max_bytes):
+    """Borra las entradas menos usadas hasta quedar por debajo de max_bytes"""
+    entries = []
+    with os.scandir(_config["directory"]) as listing:
+        for item in listing:
+            if item.name.endswith(".json"):
+                try:
+                    stat = item.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, item.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def cached_sample(kernel_func, kernel_args, shots, seed=None):
+    """cudaq.sample a través de la caché (si está activa y hay semilla)"""
+    import cudaq
+
+    if seed is not None:
+        cudaq.set_random_seed(seed)
+    if seed is None or _config["directory"] is None:
+        return cudaq.sample(kernel_func, *kernel_args, shots_count=shots)
+
+    key = cache_key(kernel_func, kernel_args, shots, seed, cudaq.get_target().name)
+    result = load(key)
+    if result is None:
+        result = cudaq.sample(kernel_func, *kernel_args, shots_count=shots)
+        store(key, result)
+    return result
+
+
+if __name__ == "__main__":
+    import time
+
+    from registro_kernels import clear_registry, get_kernel
+
+    print("\n" + "="*80)
+    print("CACHÉ DE RESULTADOS EN DISCO")
+    print("="*80)
+
+    with tempfile.TemporaryDirectory() as directory:
+        enable_cache(directory)
+        cases = [("dj", 3, "balanced_majority", False), ("bv", 4, "1011", False),
+                 ("dj", 2, "balanced_xor", True), ("bv", 3, "101", True)]
+
+        print("\n┌──────────────────────────────┬──────────────┬──────────────┐")
+        print("│ Circuito                     │ Fallo (ms)   │ Acierto (ms) │")
+        print("├──────────────────────────────┼──────────────┼──────────────┤")
+        for key in cases:
+            start = time.perf_counter()
+            first = cached_sample(get_kernel(*key), (), 1000, seed=7)
+            miss = time.perf_counter() - start
+
+            # Kernel reconstruido (nombre distinto): misma clave
+            clear_registry()
+            start = time.perf_counter()
+            second = cached_sample(get_kernel(*key), (), 1000, seed=7)
+            hit = time.perf_counter() - start
+
+            assert dict(first.items()) == dict(second.items())
+            label = f"{key[0]} n={key[1]} {key[2]}" + (" aux" if key[3] else "")
+            print(f"│ {label:<28} │ {miss*1e3:^12.2f} │ {hit*1e3:^12.3f} │")
+        print("└──────────────────────────────┴──────────────┴──────────────┘")
+
+        evict(0)
+        assert not os.listdir(directory)
+        print("\n✓ Entradas idénticas entre kernels reconstruidos; evict(0) vacía la caché")
+
+        # Sin semilla no se cachea: cada llamada es una muestra nueva
+        from circuito_ir import Circuit
+
+        kernel = Circuit.from_gates(2, [("h", 0), ("h", 1)]).to_kernel()
+        samples = [dict(cached_sample(kernel, (), 1).items()) for _ in range(20)]
+        assert not os.listdir(directory) and len({str(s) for s in samples}) > 1
+        print("✓ Sin semilla: muestras nuevas en cada llamada, nada escrito en disco")
+    print("="*80 + "\n")
@@ -0,0 +1,262 @@
+import time
+
+import numpy as np
+
+from oraculos import build_circuit, oracle_gates
+from planificador_capas import asap_schedule
+
+# ============================================================================
+# REPRESENTACIÓN INTERMEDIA (IR) DE CIRCUITOS EN ARRAYS
+# ============================================================================
+#
+# Un circuito se guarda como tres arrays paralelos, una fila por operación:
+#
+#   opcodes  uint8    índice en OPCODES ("h", "cz", "mcx", "barrier", ...)
+#   qubits   int32    qubits de la operación, controles primero; -1 rellena
+#   params   float64  ángulo de rx/ry/rz (0 en el resto)
+#
+# más la lista de qubits medidos y las etiquetas de las barreras. De esta
+# única descripción salen:
+#
+#   to_kernel()   kernel de cudaq.make_kernel (las barreras no se emiten)
+#   schedule()    capas ASAP, profundidad y paralelismo (planificador_capas)
+#   layout()      columna de cada operación para dibujarla
+#   to_gates()    tuplas (nombre, qubit, ...) de oraculos.py para los motores
+#
+# La disposición se calcula sola: la capa ASAP de cada operación es su
+# coordenada x. Si dos compuertas de la misma capa se cruzan en vertical (la
+# línea de una controlada atraviesa los qubits intermedios) ocupan huecos
+# contiguos de esa capa, y cada barrera tiene su propia columna.
+# ============================================================================
+
+OPCODES = ("h", "x", "z", "rx", "ry", "rz", "cz", "cx", "mcz", "mcx", "barrier")
+PARAMETRIC = frozenset({"rx", "ry", "rz"})
+_CODE = {name: code for code, name in enumerate(OPCODES)}
+_BARRIER = _CODE["barrier"]
+
+# Cómo se emite cada operación en el constructor de kernels
+_SINGLE_QUBIT = ("h", "x", "z")
+_TWO_QUBIT = ("cz", "cx")
+_MULTI_CONTROLLED = {"mcz": "cz", "mcx": "cx"}
+
+# Etiquetas de las barreras entre las fases de los algoritmos
+PHASE_LABELS = ("Superposición", "Oráculo", "Interferencia")
+
+
+class Circuit:
+    """Circuito como arrays de opcodes, qubits y parámetros"""
+
+    def __init__(self, num_qubits, measured=None, capacity=16):
+        self.num_qubits = num_qubits
+        self.measured = list(range(num_qubits)) if measured is None else list(measured)
+        self.labels = {}      # índice de barrera → etiqueta
+        self.size = 0
+        self._opcodes = np.zeros(capacity, dtype=np.uint8)
+        self._qubits = np.full((capacity, 2), -1, dtype=np.int32)
+        self._params = np.zeros(capacity, dtype=np.float64)
+
+    @property
+    def opcodes(self):
+        return self._opcodes[:self.size]
+
+    @property
+    def qubits(self):
+        return self._qubits[:self.size]
+
+    @property
+    def params(self):
+        return self._params[:self.size]
+
+    def _reserve(self, width):
+        # Crecimiento amortizado: se duplican las filas o se ensanchan las columnas
+        capacity, columns = self._qubits.shape
+        if self.size < capacity and width <= columns:
+            return
+        if self.size == capacity:
+            capacity *= 2
+            self._opcodes = np.resize(self._opcodes, capacity)
+            self._params = np.resize(self._params, capacity)
+        qubits = np.full((capacity, max(width, columns)), -1, dtype=np.int32)
+        qubits[:self.size, :columns] = self._qubits[:self.size]
+        self._qubits = qubits
+
+    def append(self, name, *qubits, param=0.0):
+        """Añade una operación; devuelve el circuito para encadenar"""
+        if name not in _CODE:
+            raise ValueError(f"Operación desconocida: {name!r} (opciones: {', '.join(OPCODES)})")
+        for q in qubits:
+            if not 0 <= q < self.num_qubits:
+                raise ValueError(f"Qubit {q} fuera de rango para {self.num_qubits} qubits")
+        self._reserve(len(qubits))
+        self._opcodes[self.size] = _CODE[name]
+        self._qubits[self.size, :len(qubits)] = qubits
+        self._params[self.size] = param
+        self.size += 1
+        return self
+
+    def extend(self, gates):
+        for gate in gates:
+            self.append(*gate)
+        return self
+
+    def barrier(self, label=""):
+        if label:
+            self.labels[self.size] = label
+        return self.append("barrier")
+
+    @classmethod
+    def from_gates(cls, num_qubits, gates, measured=None):
+        """IR de una lista de tuplas (nombre, qubit, ...) como las de oraculos.py"""
+        return cls(num_qubits, measured, capacity=max(16, len(gates))).extend(gates)
+
+    @classmethod
+    def for_algorithm(cls, algorithm, n, oracle, ancilla=False, barriers=True):
+        """Circuito DJ/BV completo, con barreras etiquetadas entre las fases"""
+        oracle = oracle_gates(algorithm, n, oracle, ancilla)
+        num_qubits, gates, measured = build_circuit(n, oracle, ancilla)
+        # build_circuit: preparación (X del auxiliar y H), oráculo, H finales
+        prepare = num_qubits + (1 if ancilla else 0)
+        phases = [gates[:prepare], gates[prepare:prepare + len(oracle)],
+                  gates[prepare + len(oracle):]]
+
+        circuit = cls(num_qubits, measured, capacity=len(gates) + 3)
+        for label, phase in zip(PHASE_LABELS, phases):
+            circuit.extend(phase)
+            if barriers:
+                circuit.barrier(label)
+        return circuit
+
+    def operations(self):
+        """Itera (nombre, qubits, parámetro) incluyendo las barreras"""
+        for code, row, param in zip(self.opcodes, self.qubits, self.params):
+            yield OPCODES[code], [int(q) for q in row if q >= 0], float(param)
+
+    def to_gates(self):
+        """Tuplas (nombre, qubit, ...) sin barreras, para los motores de simulación"""
+        gates = []
+        for name, qubits, _ in self.operations():
+            if name in PARAMETRIC:
+                raise ValueError(f"La compuerta {name} lleva parámetro: los motores que "
+                                 "usan tuplas no la soportan")
+            if name != "barrier":
+                gates.append((name, *qubits))
+        return gates
+
+    def emit(self, builder, qubits):
+        """Emite las operaciones sobre un constructor de kernels (sin medir)"""
+        for name, targets, param in self.operations():
+            if name in _SINGLE_QUBIT:
+                getattr(builder, name)(qubits[targets[0]])
+            elif name in PARAMETRIC:
+                getattr(builder, name)(param, qubits[targets[0]])
+            elif name in _TWO_QUBIT:
+                getattr(builder, name)(qubits[targets[0]], qubits[targets[1]])
+            elif name in _MULTI_CONTROLLED:
+                controls = [qubits[q] for q in targets[:-1]]
+                getattr(builder, _MULTI_CONTROLLED[name])(controls, qubits[targets[-1]])
+
+    def to_kernel(self):
+        """Kernel de cudaq.make_kernel con las operaciones y las mediciones"""
+        import cudaq
+
+        kernel = cudaq.make_kernel()
+        qubits = kernel.qalloc(self.num_qubits)
+        self.emit(kernel, qubits)
+        if len(self.measured) == self.num_qubits:
+            kernel.mz(qubits)
+        else:
+            for q in self.measured:
+                kernel.mz(qubits[q])
+        return kernel
+
+    def schedule(self):
+        """Planificación ASAP por capas (planificador_capas.asap_schedule)"""
+        return asap_schedule(self.num_qubits,
+                             [(name, *qubits) for name, qubits, _ in self.operations()])
+
+    def layout(self):
+        """Columna de cada operación y número total de columnas
+
+        La capa ASAP da el orden de las columnas; dentro de una capa, las
+        compuertas cuyos tramos verticales se cruzan van en huecos contiguos.
+        """
+        schedule = self.schedule()
+        low = np.where(self.qubits >= 0, self.qubits, self.num_qubits).min(axis=1)
+        high = self.qubits.max(axis=1)
+
+        slots = [[] for _ in range(schedule.depth)]   # tramos ocupados por hueco
+        slot = np.zeros(self.size, dtype=np.int64)
+        for i, layer in enumerate(schedule.layers):
+            if layer < 0:
+                continue
+            for s, spans in enumerate(slots[layer]):
+                if all(high[i] < a or low[i] > b for a, b in spans):
+                    break
+            else:
+                s = len(slots[layer])
+                slots[layer].append([])
+            slots[layer][s].append((low[i], high[i]))
+            slot[i] = s
+
+        barriers = {}
+        for i, boundary in schedule.boundaries.items():
+            barriers.setdefault(boundary, []).append(i)
+        columns = np.zeros(self.size, dtype=np.int64)
+        start = np.zeros(schedule.depth, dtype=np.int64)
+        position = 0
+        for layer in range(schedule.depth + 1):
+            for i in barriers.get(layer, []):
+                columns[i] = position
+                position += 1
+            if layer < schedule.depth:
+                start[layer] = position
+                position += max(1, len(slots[layer]))
+        gates = schedule.layers >= 0
+        columns[gates] = start[schedule.layers[gates]] + slot[gates]
+        return columns, position
+
+if __name__ == "__main__":
+    from recursos_circuito import kernel_circuit, trace_kernel
+
+    print("\n" + "="*80)
+    print("IR DE CIRCUITOS: UNA DESCRIPCIÓN PARA EL KERNEL Y PARA EL DIBUJO")
+    print("="*80)
+
+    # El kernel bajado desde el IR ejecuta exactamente las tuplas de oraculos.py
+    for algorithm, n, oracle, ancilla in [("dj", 3, "balanced_majority", False),
+                                          ("bv", 4, "1011", True)]:
+        circuit = Circuit.for_algorithm(algorithm, n, oracle, ancilla)
+        expected = build_circuit(n, oracle_gates(algorithm, n, oracle, ancilla), ancilla)
+        assert kernel_circuit(circuit.to_kernel()) == expected
+        key = (algorithm, n, oracle, ancilla)
+        columns, width = circuit.layout()
+        print(f"\n{key}: {circuit.size} operaciones en {width} columnas")
+        print(f"  columnas: {columns.tolist()}")
+    print("\n✓ Los kernels del IR ejecutan las mismas compuertas y mediciones que build_circuit")
+
+    # Circuito aleatorio de 1000 compuertas: construcción, disposición y bajada
+    rng = np.random.default_rng(0)
+    n = 20
+    start = time.perf_counter()
+    circuit = Circuit(n, capacity=16)
+    for _ in range(1000):
+        kind = rng.choice(["h", "z", "x", "rz", "cz", "cx"])
+        if kind in ("cz", "cx"):
+            circuit.append(kind, *map(int, rng.choice(n, size=2, replace=False)))
+        else:
+            circuit.append(kind, int(rng.integers(n)), param=float(rng.random()))
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns, width = circuit.layout()
+    placed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    kernel = circuit.to_kernel()
+    lowered = time.perf_counter() - start
+    operations, _ = trace_kernel(kernel)
+    assert sum(op[0] != "mz" for op in operations) == 1000
+
+    print(f"\n1000 compuertas, {n} qubits: construir {built*1e3:.1f} ms, "
+          f"disponer {placed*1e3:.1f} ms ({width} columnas), make_kernel {lowered*1e3:.1f} ms")
+    print("="*80 + "\n")
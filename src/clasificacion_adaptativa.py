@@ -0,0 +1,100 @@
+import math
+
+from ejecucion import resolve_engine, sample_kernel
+from marginales import marginal_counts
+
+# ============================================================================
+# CLASIFICACIÓN DEUTSCH-JOZSA ADAPTATIVA (SPRT)
+# ============================================================================
+#
+# En lugar de disparar siempre 1000 shots y umbralizar P(0...0) > 0.9, se
+# muestrea en bloques pequeños y se aplica el test secuencial de razón de
+# probabilidades de Wald:
+#
+#   H0 (constante):  P(0...0) = 1 - ε
+#   H1 (balanceada): P(0...0) = ε
+#
+# ε modela el ruido (en el caso ideal una función balanceada nunca produce
+# 0...0 y una constante siempre lo produce). Cada resultado 0...0 suma
+# log(ε/(1-ε)) a la razón de log-verosimilitud y cada resultado no nulo
+# suma log((1-ε)/ε). Se decide en cuanto la suma cruza
+#
+#   log((1-β)/α)  → BALANCEADA      log(β/(1-α))  → CONSTANTE
+#
+# con α = P(decir balanceada | constante) y β = P(decir constante | balanceada).
+# ============================================================================
+
+def sprt_dj(sample_chunk, alpha=1e-3, beta=1e-3, epsilon=0.01, chunk_shots=2,
+            max_shots=1000, drop_qubits=()):
+    """Clasifica un oráculo DJ muestreando por bloques hasta estar seguro
+
+    sample_chunk(shots) devuelve conteos (cualquier objeto con items()).
+    Devuelve (constante, shots_usados); si se agota max_shots decide por el
+    signo de la razón acumulada.
+    """
+    if not 0 < epsilon < 0.5:
+        raise ValueError(f"epsilon debe estar en (0, 0.5), recibido {epsilon}")
+
+    upper = math.log((1 - beta) / alpha)
+    lower = math.log(beta / (1 - alpha))
+    step = math.log((1 - epsilon) / epsilon)
+
+    llr = 0.0
+    used = 0
+    while used < max_shots:
+        shots = min(chunk_shots, max_shots - used)
+        indices, counts, _ = marginal_counts(sample_chunk(shots), drop_qubits)
+        zeros = int(counts[indices == 0].sum())
+        used += shots
+        llr += step * ((shots - zeros) - zeros)
+        if llr >= upper:
+            return False, used
+        if llr <= lower:
+            return True, used
+    return llr < 0, used
+
+
+def classify_dj_adaptive(kernel_func, kernel_args=(), engine="cudaq", tally=None,
+                         **sprt_options):
+    """sprt_dj sobre un kernel, con el mismo despacho que las funciones run_*
+
+    tally: Counter opcional donde se acumulan los conteos de todos los
+    bloques (los shots realmente usados), p. ej. para run_record.
+    """
+    # "auto" se resuelve una vez, no en cada bloque
+    engine = resolve_engine(kernel_func, kernel_args, engine)
+
+    def sample_chunk(shots):
+        result = sample_kernel(kernel_func, kernel_args, shots, engine)
+        if tally is not None:
+            tally.update(dict(result.items()))
+        return result
+
+    return sprt_dj(sample_chunk, **sprt_options)
+
+
+if __name__ == "__main__":
+    from oraculos import DJ3_ORACLES, DJ_AUX_ORACLES
+    from registro_kernels import get_kernel
+
+    print("\n" + "="*80)
+    print("DEUTSCH-JOZSA ADAPTATIVO: SHOTS USADOS POR ORÁCULO")
+    print("="*80)
+
+    print("\n┌──────────────────────────────┬──────────────┬──────────────┐")
+    print("│ Oráculo                      │ Conclusión   │ Shots usados │")
+    print("├──────────────────────────────┼──────────────┼──────────────┤")
+    total = 0
+    cases = [(f"dj3_{name}", ("dj", 3, name, False)) for name in DJ3_ORACLES]
+    cases += [(f"dj_aux_{name}", ("dj", 2, name, True)) for name in DJ_AUX_ORACLES]
+    for label, key in cases:
+        constant, used = classify_dj_adaptive(get_kernel(*key))
+        total += used
+        verdict = "CONSTANTE" if constant else "BALANCEADA"
+        print(f"│ {label:<28} │ {verdict:^12} │ {used:^12} │")
+    print("└──────────────────────────────┴──────────────┴──────────────┘")
+
+    fixed = 1000 * len(cases)
+    print(f"\nTotal: {total} shots adaptativos vs {fixed} fijos "
+          f"({fixed / total:.0f}x menos)")
+    print("="*80 + "\n")
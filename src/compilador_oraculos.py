@@ -0,0 +1,184 @@
+import hashlib
+import time
+
+import numpy as np
+
+# ============================================================================
+# COMPILADOR DE FUNCIONES BOOLEANAS A ORÁCULOS
+# ============================================================================
+#
+# Toda función f: {0,1}^n → {0,1} tiene una única forma normal algebraica
+# (ANF, polinomio de Reed-Muller sobre GF(2)):
+#
+#     f(x) = ⊕_m  a_m · Π_{i ∈ m} x_i
+#
+# Los coeficientes a_m salen de la tabla de verdad con la transformada de
+# Möbius, O(n·2^n) con mariposas XOR vectorizadas. Cada monomio con a_m = 1
+# es una compuerta del oráculo de fase (-1)^f(x):
+#
+#     {}      → fase global (se omite)
+#     {i}     → Z(i)
+#     {i, j}  → CZ(i, j)
+#     {i,…,k} → Z multicontrolada ("mcz")
+#
+# Como la ANF es única, esta es la síntesis mínima con {Z, CZ, MCZ}. La forma
+# con auxiliar (índice n, preparado en |−⟩) usa los mismos monomios con X,
+# CX y X multicontrolada sobre el auxiliar.
+#
+# Ejemplo: majority(x₀, x₁, x₂) = x₀x₁ ⊕ x₁x₂ ⊕ x₀x₂ → CZ(0,1) CZ(1,2) CZ(0,2),
+# que es justo el oráculo dj3 balanced_majority de oraculos.py.
+#
+# Convención: el índice de la tabla es int(cadena, 2) con el qubit 0 como bit
+# más significativo, igual que en motor_walsh.py.
+# ============================================================================
+
+# Oráculos sintetizados por (hash de la función, auxiliar)
+_SYNTHESIS_CACHE = {}
+
+
+def _num_variables(size):
+    n = int(size).bit_length() - 1
+    if size < 1 or 1 << n != size:
+        raise ValueError(f"La tabla de verdad debe tener 2^n entradas (recibido {size})")
+    return n
+
+
+def function_key(truth_table):
+    """Hash de la función (n, SHA-1 de la tabla empaquetada)"""
+    table = np.ascontiguousarray(truth_table, dtype=bool)
+    return _num_variables(table.size), hashlib.sha1(np.packbits(table).tobytes()).hexdigest()
+
+
+def mobius_transform(truth_table):
+    """Coeficientes ANF: coeficiente[m] del monomio con las variables de m"""
+    coefficients = np.array(truth_table, dtype=np.uint8).ravel() & 1
+    n = _num_variables(coefficients.size)
+    for bit in range(n):
+        view = coefficients.reshape(-1, 2, 1 << bit)
+        view[:, 1, :] ^= view[:, 0, :]
+    return coefficients
+
+
+def anf_monomials(truth_table):
+    """Monomios de la ANF como tuplas de variables (qubit 0 = bit más significativo)"""
+    coefficients = mobius_transform(truth_table)
+    n = _num_variables(coefficients.size)
+    monomials = []
+    for index in np.flatnonzero(coefficients):
+        monomials.append(tuple(q for q in range(n) if (index >> (n - 1 - q)) & 1))
+    return sorted(monomials, key=lambda m: (len(m), m))
+
+
+def truth_table_from_anf(n, monomials):
+    """Tabla de verdad de un polinomio ANF dado por sus monomios"""
+    x = np.arange(2**n, dtype=np.int64)
+    table = np.zeros(2**n, dtype=bool)
+    for monomial in monomials:
+        term = np.ones(2**n, dtype=bool)
+        for q in monomial:
+            if not 0 <= q < n:
+                raise ValueError(f"Variable {q} fuera de rango para n={n}")
+            term &= ((x >> (n - 1 - q)) & 1).astype(bool)
+        table ^= term
+    return table
+
+
+def oracle_from_monomials(n, monomials, ancilla=False):
+    """Compuertas del oráculo (de fase, o con auxiliar en el índice n)"""
+    gates = []
+    for monomial in monomials:
+        if ancilla:
+            if len(monomial) == 0:
+                gates.append(("x", n))
+            elif len(monomial) == 1:
+                gates.append(("cx", monomial[0], n))
+            else:
+                gates.append(("mcx", *monomial, n))
+        elif len(monomial) == 1:
+            gates.append(("z", monomial[0]))
+        elif len(monomial) == 2:
+            gates.append(("cz", *monomial))
+        elif len(monomial) > 2:
+            gates.append(("mcz", *monomial))
+    return gates
+
+
+def compile_oracle(function, ancilla=False, n=None):
+    """Oráculo mínimo para una función booleana, memorizado por su hash
+
+    function es una tabla de verdad (2^n valores) o, si se da n, una lista de
+    monomios ANF (tuplas de variables). Devuelve (n, compuertas).
+    """
+    if n is not None:
+        function = truth_table_from_anf(n, function)
+    key = (function_key(function), bool(ancilla))
+    if key not in _SYNTHESIS_CACHE:
+        n = key[0][0]
+        gates = oracle_from_monomials(n, anf_monomials(function), ancilla)
+        _SYNTHESIS_CACHE[key] = (n, tuple(gates))
+    return _SYNTHESIS_CACHE[key]
+
+
+def compiled_kernel(function, algorithm="dj", ancilla=False, n=None):
+    """Kernel del registro para la función compilada (memorizado por compuertas)"""
+    from registro_kernels import get_kernel
+
+    n, gates = compile_oracle(function, ancilla, n)
+    return get_kernel(algorithm, n, gates, ancilla=ancilla)
+
+
+def clear_synthesis_cache():
+    _SYNTHESIS_CACHE.clear()
+
+
+if __name__ == "__main__":
+    from motor_walsh import truth_table_from_gates
+    from oraculos import DJ2_ORACLES, DJ3_ORACLES
+
+    print("\n" + "="*80)
+    print("COMPILADOR DE FUNCIONES BOOLEANAS A ORÁCULOS")
+    print("="*80)
+
+    x = np.arange(8)
+    bits = [(x >> (2 - q)) & 1 for q in range(3)]
+    majority = (bits[0] + bits[1] + bits[2]) >= 2
+    n, gates = compile_oracle(majority)
+    print(f"\nmajority(x₀, x₁, x₂) → {list(gates)}")
+    print(f"con auxiliar        → {list(compile_oracle(majority, ancilla=True)[1])}")
+    assert sorted(gates) == sorted(DJ3_ORACLES["balanced_majority"])
+
+    # Cada oráculo escrito a mano frente a la función que realmente implementa
+    print("\n┌──────────────────────────┬──────────────────────┬──────────────┬───┐")
+    print("│ Oráculo                  │ ANF implementada     │ Tipo real    │   │")
+    print("├──────────────────────────┼──────────────────────┼──────────────┼───┤")
+    for label, table, size in [("dj2", DJ2_ORACLES, 2), ("dj3", DJ3_ORACLES, 3)]:
+        for name, oracle in table.items():
+            implemented = truth_table_from_gates(size, oracle)
+            anf = " ⊕ ".join("".join(f"x{q}" for q in m)
+                             for m in anf_monomials(implemented)) or "0"
+            weight = int(implemented.sum())
+            kind = ("constante" if weight in (0, 2**size) else
+                    "balanceada" if weight == 2**(size - 1) else "ninguno")
+            claimed = {"constant": "constante", "balanced": "balanceada"}[name.split("_")[0]]
+            mark = "✓" if kind == claimed else "✗"
+            print(f"│ {label + ' ' + name:<24} │ {anf:<20} │ {kind:<12} │ {mark} │")
+    print("└──────────────────────────┴──────────────────────┴──────────────┴───┘")
+    print("  ✗: el oráculo escrito a mano no implementa una función del tipo que dice")
+    print("  su nombre (p. ej. Z en todos los qubits es la paridad, que es balanceada;")
+    print("  la función constante f = 1 es solo una fase global)")
+
+    # Barrido: todas las funciones de 3 variables, dos veces (la segunda desde caché)
+    tables = ((np.arange(256)[:, None] >> np.arange(8)) & 1).astype(bool)
+    for attempt in ("síntesis", "caché"):
+        start = time.perf_counter()
+        for table in tables:
+            compile_oracle(table)
+        elapsed = time.perf_counter() - start
+        print(f"\n256 funciones de 3 variables ({attempt}): {elapsed*1e3:.2f} ms")
+
+    # El término constante de la ANF es f(0) y se omite como fase global
+    for table in tables:
+        n, gates = compile_oracle(table)
+        assert np.array_equal(truth_table_from_gates(n, gates), table ^ table[0])
+    print("\n✓ Los oráculos compilados reproducen la tabla (salvo fase global)")
+    print("="*80 + "\n")
@@ -0,0 +1,110 @@
+import contextlib
+import importlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+# ============================================================================
+# CONSTRUCCIÓN DE FIGURAS EN PARALELO, SIN PANTALLA (BACKEND AGG)
+# ============================================================================
+#
+# Cada figura del informe es independiente: se dibuja en un proceso del pool
+# con el backend Agg, con la resolución (dpi) y el formato (png, pdf, svg…)
+# elegidos. Los módulos de visualización importan matplotlib dentro de cada
+# función, así que el proceso principal no carga matplotlib y cada trabajador
+# lo importa una sola vez, ya con MPLBACKEND=Agg.
+#
+#   python construir_figuras.py                 # todas, png a 150 dpi
+#   build_figures(["comparacion_recursos"], dpi=300, fmt="pdf")
+# ============================================================================
+
+# Nombre de la figura → (módulo, función que la dibuja)
+FIGURES = {
+    "deutsch_jozsa_2qubits": ("visualizar_circuitos", "draw_deutsch_jozsa_2qubits"),
+    "deutsch_jozsa_3qubits": ("visualizar_circuitos", "draw_deutsch_jozsa_3qubits"),
+    "bernstein_vazirani_2qubits": ("visualizar_circuitos", "draw_bernstein_vazirani_2qubits"),
+    "bernstein_vazirani_3qubits": ("visualizar_circuitos", "draw_bernstein_vazirani_3qubits"),
+    "comparacion_complejidad": ("visualizar_circuitos", "draw_comparison_diagram"),
+    "comparacion_deutsch_jozsa": ("visualizar_comparacion_CON_SIN",
+                                  "create_comparison_deutsch_jozsa"),
+    "comparacion_bernstein_vazirani": ("visualizar_comparacion_CON_SIN",
+                                       "create_comparison_bernstein_vazirani"),
+    "comparacion_recursos": ("visualizar_comparacion_CON_SIN",
+                             "create_resource_comparison_chart"),
+}
+
+
+def _init_worker():
+    # Backend sin pantalla antes de que nada importe matplotlib
+    os.environ["MPLBACKEND"] = "Agg"
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+
+def _render(name, path, dpi):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    module, function = FIGURES[name]
+    start = time.perf_counter()
+    # Los mensajes "✓ ... guardado" los imprime build_figures en orden
+    with contextlib.redirect_stdout(io.StringIO()):
+        getattr(importlib.import_module(module), function)(path=path, dpi=dpi)
+    plt.close("all")
+    return name, path, time.perf_counter() - start
+
+
+def build_figures(names=None, output_dir=".", dpi=150, fmt="png", workers=None):
+    """Dibuja las figuras indicadas (todas por defecto) en un pool de procesos
+
+    Devuelve {nombre: (ruta, segundos)}. También con workers=1 se dibuja en
+    un proceso aparte (en serie): así el backend, las figuras abiertas y el
+    entorno del proceso que llama no cambian.
+    """
+    names = list(FIGURES) if names is None else list(names)
+    unknown = [name for name in names if name not in FIGURES]
+    if unknown:
+        raise ValueError(f"Figuras desconocidas: {unknown} (opciones: {', '.join(FIGURES)})")
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {name: os.path.join(output_dir, f"{name}.{fmt}") for name in names}
+
+    built = {}
+    workers = min(workers or os.cpu_count() or 1, len(names)) or 1
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                             initializer=_init_worker) as pool:
+        futures = [pool.submit(_render, name, paths[name], dpi) for name in names]
+        for future in as_completed(futures):
+            name, path, elapsed = future.result()
+            built[name] = (path, elapsed)
+    return built
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Construye las figuras del informe")
+    parser.add_argument("names", nargs="*", help="figuras a construir (todas por defecto)")
+    parser.add_argument("--output-dir", default=".")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--format", default="png", dest="fmt")
+    parser.add_argument("--workers", type=int, default=None)
+    options = parser.parse_args()
+
+    print("\n" + "="*80)
+    print("CONSTRUCCIÓN DE FIGURAS (AGG, EN PARALELO)")
+    print("="*80)
+
+    start = time.perf_counter()
+    built = build_figures(options.names or None, options.output_dir, options.dpi,
+                          options.fmt, options.workers)
+    elapsed = time.perf_counter() - start
+
+    for name, (path, seconds) in built.items():
+        print(f"✓ {path:<48} {seconds:6.2f} s")
+    print(f"\n{len(built)} figuras en {elapsed:.2f} s "
+          f"(dpi={options.dpi}, formato={options.fmt}, "
+          f"matplotlib en el proceso principal: {'matplotlib' in sys.modules})")
+    print("="*80 + "\n")
@@ -1,5 +1,14 @@
+import time
+from collections import Counter
+
 import cudaq
 
+from clasificacion_adaptativa import classify_dj_adaptive
+from ejecucion import resolve_engine, sample_kernel
+from motor_exacto import exact_probabilities, format_probabilities
+from sumidero_resultados import (kernel_variant, probability_record, run_record, silent,
+                                 summarize_counts)
+
 # ============================================================================
 # ALGORITMO DEUTSCH-JOZSA DE 2 QUBITS SIN QUBIT AUXILIAR
 # ============================================================================
@@ -120,34 +129,86 @@ def deutsch_jozsa_balanced_xnor():
 # FUNCIÓN PARA EJECUTAR Y ANALIZAR
 # ============================================================================
 
-def run_and_analyze(kernel_func, oracle_name, shots=1000):
+def run_and_analyze(kernel_func, oracle_name, shots=1000, kernel_args=(),
+                    engine="cudaq", seed=None, adaptive=False, exact=False, sink=None,
+                    verbose=True):
     """Ejecuta el kernel y analiza los resultados"""
-    
-    print(f"\n{'='*70}")
-    print(f"Ejecutando: {oracle_name}")
-    print(f"{'='*70}")
+    say = print if verbose else silent
+    
+    say(f"\n{'='*70}")
+    say(f"Ejecutando: {oracle_name}")
+    say(f"{'='*70}")
+    
+    if adaptive:
+        # Modo adaptativo: bloques pequeños + SPRT, con `shots` como máximo
+        engine = resolve_engine(kernel_func, kernel_args, engine)
+        tally = Counter()
+        start = time.perf_counter()
+        constant, used = classify_dj_adaptive(kernel_func, kernel_args, engine, tally,
+                                              max_shots=shots)
+        elapsed = time.perf_counter() - start
+        say(f"\nModo adaptativo (SPRT): {used} de {shots} shots usados")
+        say("✓ Conclusión: CONSTANTE" if constant else "✓ Conclusión: BALANCEADA")
+        record = run_record(tally, "dj", len(next(iter(tally))), oracle_name,
+                            kernel_variant(kernel_func, kernel_args), engine, used,
+                            elapsed_s=elapsed, verdict="constant" if constant else "balanced",
+                            max_shots=shots)
+        if sink is not None:
+            sink.write(record)
+        return record
+    
+    if exact:
+        # Modo exacto: probabilidades del vector de estado, sin shots
+        start = time.perf_counter()
+        probs, width = exact_probabilities(kernel_func, kernel_args)
+        elapsed = time.perf_counter() - start
+        say("\nProbabilidades exactas (vector de estado):")
+        say(format_probabilities(probs, width))
+        say(f"\nAnálisis:")
+        say(f"Probabilidad de medir |00⟩: {probs[0]:.4f}")
+        say("✓ Conclusión: La función es CONSTANTE" if probs[0] > 0.9
+              else "✓ Conclusión: La función es BALANCEADA")
+        record = probability_record(probs, width, "dj", width, oracle_name,
+                                    kernel_variant(kernel_func, kernel_args), elapsed,
+                                    "constant" if probs[0] > 0.9 else "balanced")
+        if sink is not None:
+            sink.write(record)
+        return record
     
     # Ejecutar el circuito
-    result = cudaq.sample(kernel_func, shots_count=shots)
-    
-    # Mostrar resultados
-    print(f"\nResultados de medición ({shots} shots):")
-    print(result)
-    
-    # Analizar
+    # El registro guarda el motor usado, no "auto"
+    engine = resolve_engine(kernel_func, kernel_args, engine)
+    start = time.perf_counter()
+    result = sample_kernel(kernel_func, kernel_args, shots, engine, seed)
+    elapsed = time.perf_counter() - start
+    
+    # Mostrar resultados (el resumen solo se construye si se va a imprimir)
+    say(f"\nResultados de medición ({shots} shots):")
+    if verbose:
+        say(summarize_counts(result))
+    
+    # Analizar (n sale del ancho del resultado: vale para cualquier kernel)
     result_dict = {}
     for bits, count in result.items():
         result_dict[bits] = count
+    n = len(result.most_probable())
     
-    prob_00 = result_dict.get('00', 0) / shots
+    prob_00 = result_dict.get("0" * n, 0) / shots
     
-    print(f"\nAnálisis:")
-    print(f"Probabilidad de medir |00⟩: {prob_00:.4f}")
+    say(f"\nAnálisis:")
+    say(f"Probabilidad de medir |{'0' * n}⟩: {prob_00:.4f}")
     
-    if prob_00 > 0.9:
-        print("✓ Conclusión: La función es CONSTANTE")
+    constant = prob_00 > 0.9
+    if constant:
+        say("✓ Conclusión: La función es CONSTANTE")
     else:
-        print("✓ Conclusión: La función es BALANCEADA")
+        say("✓ Conclusión: La función es BALANCEADA")
+    
+    record = run_record(result, "dj", n, oracle_name, kernel_variant(kernel_func, kernel_args),
+                        engine, shots, elapsed_s=elapsed, verdict="constant" if constant else "balanced")
+    if sink is not None:
+        sink.write(record)
+    return record
 
 
 # ============================================================================
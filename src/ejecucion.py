@@ -0,0 +1,83 @@
+# ============================================================================
+# DESPACHO DE EJECUCIÓN: CUDA-Q O MOTORES PROPIOS
+# ============================================================================
+#
+# Las funciones run_* llaman a sample_kernel() en lugar de cudaq.sample()
+# directamente; el parámetro engine elige el motor:
+#
+#   "cudaq"      → cudaq.sample sobre el target activo, a través de la caché
+#                  de resultados en disco si está activa (cache_resultados)
+#   "analytic"   → motor_analitico (solo kernel paramétrico de fase {Z, CZ})
+#   "factorized" → motor_factorizado: cada componente conexa del grafo de
+#                  interacción por separado (kernels lineales o paramétrico)
+#   "stabilizer" → motor_estabilizador: tableau de Clifford, polinómico en n
+#   "noisy"      → motor_ruido: trayectorias de Monte Carlo con el ruido por
+#                  compuerta DEFAULT_NOISE (despolarizante, desfase, lectura)
+#   "auto"       → "stabilizer" si el circuito es solo de Clifford, se puede
+#                  trazar y el target activo es un simulador local sin ruido
+#                  (AUTO_STABILIZER_TARGETS); si no, "cudaq"
+#
+# Las funciones run_* usan "cudaq" por defecto y "auto" hay que pedirlo: un
+# modelo de ruido puesto con cudaq.set_noise no se puede consultar desde
+# Python, así que "auto" no sabe si el target es ruidoso y, con ruido activo,
+# mandaría los circuitos de Clifford al tableau ideal en silencio.
+#
+# CUDA-Q y los motores se importan al primer uso, para que importar los
+# módulos de algoritmos no tenga coste de arranque.
+# ============================================================================
+
+ENGINES = ("cudaq", "analytic", "factorized", "stabilizer", "noisy", "auto")
+
+# Targets cuyo muestreo equivale al del tableau para circuitos de Clifford
+AUTO_STABILIZER_TARGETS = frozenset({"qpp-cpu", "nvidia", "nvidia-fp64", "nvidia-mgpu",
+                                     "nvidia-mqpu", "nvidia-mqpu-fp64", "stim"})
+
+
+def resolve_engine(kernel_func, kernel_args=(), engine="auto"):
+    """Motor concreto que usará sample_kernel ("auto" se resuelve aquí)"""
+    if engine != "auto":
+        return engine
+    import cudaq
+
+    from motor_estabilizador import kernel_is_clifford
+
+    if cudaq.get_target().name not in AUTO_STABILIZER_TARGETS:
+        return "cudaq"
+    return "stabilizer" if kernel_is_clifford(kernel_func, kernel_args) else "cudaq"
+
+
+def sample_kernel(kernel_func, kernel_args=(), shots=1000, engine="cudaq", seed=None):
+    """Ejecuta el kernel con el motor elegido y devuelve los conteos"""
+
+    engine = resolve_engine(kernel_func, kernel_args, engine)
+
+    if engine == "cudaq":
+        from cache_resultados import cached_sample
+        return cached_sample(kernel_func, kernel_args, shots, seed)
+
+    if engine == "analytic":
+        from motor_analitico import analytic_sample
+        from oraculo_parametrico import phase_oracle_kernel
+
+        if kernel_func is not phase_oracle_kernel:
+            name = getattr(kernel_func, "name", None) or repr(kernel_func)
+            raise ValueError(
+                f"El motor analítico no puede ejecutar '{name}': solo acepta "
+                "phase_oracle_kernel (H^n · oráculo {Z, CZ} · H^n) con sus "
+                "argumentos de phase_oracle_args()"
+            )
+        return analytic_sample(*kernel_args, shots=shots, seed=seed)
+
+    if engine == "factorized":
+        from motor_factorizado import factorized_sample
+        return factorized_sample(kernel_func, kernel_args, shots, seed)
+
+    if engine == "stabilizer":
+        from motor_estabilizador import stabilizer_sample
+        return stabilizer_sample(kernel_func, kernel_args, shots, seed)
+
+    if engine == "noisy":
+        from motor_ruido import trajectory_sample
+        return trajectory_sample(kernel_func, kernel_args, shots, seed=seed)
+
+    raise ValueError(f"Motor desconocido: {engine!r} (opciones: {', '.join(ENGINES)})")
@@ -0,0 +1,194 @@
+import asyncio
+import itertools
+import threading
+import time
+import weakref
+
+# ============================================================================
+# EJECUCIÓN ASÍNCRONA (ASYNCIO) SOBRE cudaq.sample_async
+# ============================================================================
+#
+# cudaq.sample_async lanza el muestreo en el hilo de ejecución de la QPU y
+# devuelve un futuro con get() bloqueante. AsyncRunner lo convierte en una
+# corrutina: el lanzamiento se hace en el hilo del bucle y solo la espera
+# (future.get) va a un hilo del ejecutor, así que el bucle sigue libre para
+# analizar resultados, escribir a disco o lanzar otros circuitos.
+#
+#   runner = AsyncRunner(limit=2)
+#   result = await runner.sample(kernel)
+#   async for key, result in runner.as_completed(jobs):
+#       ...
+#
+# La concurrencia se acota con un semáforo por (target, qpu_id): como mucho
+# `limit` trabajos en vuelo por QPU. Sin qpu_id se reparten en turno rotatorio
+# entre las QPU del target. Los motores propios (engine distinto de "cudaq")
+# se ejecutan con sample_kernel en un hilo del ejecutor, bajo un semáforo por
+# motor con el mismo límite.
+#
+# Un asyncio.Semaphore queda ligado al primer bucle que lo usa, así que los
+# semáforos se guardan por bucle (WeakKeyDictionary): el mismo AsyncRunner
+# sirve en varias llamadas a asyncio.run o en un bucle por test.
+#
+# Como en sample_kernel, con semilla y la caché de resultados activa
+# (cache_resultados) un acierto no llega a lanzar el kernel. cudaq.sample_async
+# no respeta cudaq.set_random_seed, así que los trabajos con semilla no usan
+# sample_async: en un hilo del ejecutor se fija la semilla y se llama a
+# cudaq.sample (en la QPU por defecto, qpu_id no aplica). La semilla es global
+# al proceso, así que un cerrojo impide que dos trabajos con semilla se
+# intercalen. Sin semilla se usa sample_async como arriba.
+# ============================================================================
+
+# La semilla de CUDA-Q es global: fijarla y muestrear debe ser atómico
+_SEED_LOCK = threading.Lock()
+
+
+def _seeded_sample(kernel_func, kernel_args, shots, seed):
+    import cudaq
+
+    with _SEED_LOCK:
+        cudaq.set_random_seed(seed)
+        return cudaq.sample(kernel_func, *kernel_args, shots_count=shots)
+
+
+class AsyncRunner:
+    """Muestreo asyncio con concurrencia acotada por QPU"""
+
+    def __init__(self, limit=2, engine="cudaq", executor=None):
+        if limit < 1:
+            raise ValueError(f"limit debe ser al menos 1 (recibido {limit})")
+        self.limit = limit
+        self.engine = engine
+        self.executor = executor
+        self._semaphores = weakref.WeakKeyDictionary()   # bucle → {clave: semáforo}
+        self._next_qpu = itertools.count()
+
+    def _semaphore(self, target, qpu_id):
+        semaphores = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        key = (target, qpu_id)
+        if key not in semaphores:
+            semaphores[key] = asyncio.Semaphore(self.limit)
+        return semaphores[key]
+
+    async def sample(self, kernel_func, kernel_args=(), shots=1000, qpu_id=None, seed=None):
+        """Conteos del kernel; espera a que haya hueco en la QPU (o en el motor)"""
+        loop = asyncio.get_running_loop()
+        if self.engine != "cudaq":
+            from ejecucion import sample_kernel
+            async with self._semaphore(f"engine:{self.engine}", 0):
+                return await loop.run_in_executor(
+                    self.executor,
+                    lambda: sample_kernel(kernel_func, kernel_args, shots, self.engine, seed))
+
+        import cudaq
+
+        from cache_resultados import cache_directory, cache_key, load, store
+
+        target = cudaq.get_target()
+        if qpu_id is None:
+            qpu_id = next(self._next_qpu) % target.num_qpus()
+        key = None
+        if seed is not None and cache_directory() is not None:
+            key = cache_key(kernel_func, kernel_args, shots, seed, target.name)
+            result = load(key)
+            if result is not None:
+                return result
+
+        async with self._semaphore(target.name, qpu_id):
+            if seed is not None:
+                result = await loop.run_in_executor(
+                    self.executor, _seeded_sample, kernel_func, kernel_args, shots, seed)
+            else:
+                future = cudaq.sample_async(kernel_func, *kernel_args, shots_count=shots,
+                                            qpu_id=qpu_id)
+                result = await loop.run_in_executor(self.executor, future.get)
+        if key is not None:
+            store(key, result)
+        return result
+
+    async def as_completed(self, jobs, shots=1000):
+        """Itera (clave, resultado) según terminan los trabajos
+
+        jobs: iterable de (clave, kernel, argumentos[, semilla[, qpu_id]]).
+        """
+        async def run(key, kernel_func, kernel_args, seed=None, qpu_id=None):
+            return key, await self.sample(kernel_func, kernel_args, shots, qpu_id, seed)
+
+        tasks = [asyncio.ensure_future(run(*job)) for job in jobs]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+async def sample_all(jobs, shots=1000, limit=2, engine="cudaq"):
+    """{clave: resultado} de todos los trabajos (clave, kernel, argumentos[, semilla[, qpu_id]])"""
+    runner = AsyncRunner(limit, engine)
+    return {key: result async for key, result in runner.as_completed(jobs, shots)}
+
+
+if __name__ == "__main__":
+    import cudaq
+
+    from oraculos import all_secrets
+    from registro_kernels import get_kernel
+
+    print("\n" + "="*80)
+    print("EJECUCIÓN ASÍNCRONA: cudaq.sample_async CON ASYNCIO")
+    print("="*80)
+
+    n = 14
+    secrets = all_secrets(n)[1:9]
+    jobs = [(secret, get_kernel("bv", n, secret, ancilla=True), ()) for secret in secrets]
+    for _, kernel, _ in jobs:
+        cudaq.sample(kernel, shots_count=1)
+
+    start = time.perf_counter()
+    blocking = {secret: cudaq.sample(kernel, shots_count=500) for secret, kernel, _ in jobs}
+    sequential = time.perf_counter() - start
+
+    async def main():
+        # Latido del bucle: cuenta cuántas veces corre mientras se muestrea
+        ticks = 0
+        running = True
+
+        async def heartbeat():
+            nonlocal ticks
+            while running:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        beat = asyncio.create_task(heartbeat())
+        order = []
+        start = time.perf_counter()
+        async for secret, result in AsyncRunner(limit=2).as_completed(jobs, shots=500):
+            assert result.most_probable() == secret
+            order.append(secret)
+        elapsed = time.perf_counter() - start
+        running = False
+        await beat
+        return order, elapsed, ticks
+
+    order, elapsed, ticks = asyncio.run(main())
+    assert sorted(order) == sorted(blocking)
+    print(f"\n{len(jobs)} kernels BV n={n} con auxiliar, 500 shots, "
+          f"{cudaq.get_target().name} ({cudaq.get_target().num_qpus()} QPU)")
+    print(f"  cudaq.sample en serie:        {sequential:.2f} s (bucle bloqueado)")
+    print(f"  AsyncRunner (limit=2):        {elapsed:.2f} s, "
+          f"el bucle corrió {ticks} veces mientras tanto")
+    print(f"\n✓ Todas las cadenas secretas recuperadas; orden de llegada: {order[:3]} ...")
+
+    # Motores propios: mismo API, en hilos del ejecutor
+    results = asyncio.run(sample_all(jobs, shots=500, engine="stabilizer"))
+    assert all(results[secret].most_probable() == secret for secret in results)
+    print(f"✓ engine=\"stabilizer\" por el mismo API: {len(results)} resultados")
+
+    # Con semilla: misma muestra en cada trabajo (sample_async ignoraría la semilla)
+    from circuito_ir import Circuit
+
+    uniform = Circuit.from_gates(6, [("h", q) for q in range(6)]).to_kernel()
+    results = asyncio.run(sample_all([(i, uniform, (), 7) for i in range(4)], shots=200))
+    assert len({tuple(sorted(result.items())) for result in results.values()}) == 1
+    print("✓ Trabajos con semilla reproducibles (cudaq.sample en el ejecutor)")
+    print("="*80 + "\n")
@@ -0,0 +1,176 @@
+import time
+
+import numpy as np
+
+# ============================================================================
+# ELIMINACIÓN DEL QUBIT AUXILIAR: ORÁCULOS CX → ORÁCULOS DE FASE
+# ============================================================================
+#
+# Un auxiliar preparado en |−⟩ = H·X|0⟩ es autoestado de X con valor propio
+# -1, así que una X controlada sobre él devuelve la fase a los controles
+# (phase kickback) y el auxiliar no cambia:
+#
+#   cx(q, aux)          → z(q)
+#   mcx(a, b, aux)      → cz(a, b)
+#   mcx(a, b, c, aux)   → mcz(a, b, c)
+#   x(aux)              → fase global -1 (se omite)
+#
+# Un qubit es auxiliar eliminable si no se mide, empieza con la preparación
+# x, h (o h, z), después solo es objetivo de x/cx/mcx y como mucho termina
+# con una h. Cualquier otro uso (control, medición, z o h en medio) lo deja
+# en el circuito. Los qubits restantes se renumeran en orden.
+#
+# Sin el auxiliar el vector de estado ocupa la mitad y desaparecen la X y
+# las dos H de preparación y deshacer.
+# ============================================================================
+
+# Preparaciones de |−⟩ reconocidas
+_PREPARATIONS = (("x", "h"), ("h", "z"))
+
+
+def _is_kickback_ancilla(q, gates, measured):
+    if q in measured:
+        return False
+    touching = [gate for gate in gates if q in gate[1:]]
+    names = tuple(gate[0] for gate in touching[:2])
+    if names not in _PREPARATIONS or any(len(gate) != 2 for gate in touching[:2]):
+        return False
+    oracle = touching[2:]
+    if oracle and oracle[-1] == ("h", q):
+        oracle = oracle[:-1]
+    for gate in oracle:
+        name, qubits = gate[0], gate[1:]
+        if name not in ("x", "cx", "mcx") or qubits[-1] != q or q in qubits[:-1]:
+            return False
+    return True
+
+
+def kickback_ancillas(num_qubits, gates, measured):
+    """Qubits que siguen el patrón de auxiliar en |−⟩ con phase kickback"""
+    return [q for q in range(num_qubits) if _is_kickback_ancilla(q, gates, measured)]
+
+
+def eliminate_ancillas(num_qubits, gates, measured):
+    """Circuito equivalente sin auxiliares en |−⟩
+
+    Devuelve (num_qubits, compuertas, medidos, auxiliares eliminados); si no
+    hay ninguno, el circuito sale igual.
+    """
+    ancillas = set(kickback_ancillas(num_qubits, gates, measured))
+    if not ancillas:
+        return num_qubits, list(gates), list(measured), []
+
+    kept = [q for q in range(num_qubits) if q not in ancillas]
+    index = {q: i for i, q in enumerate(kept)}
+    rewritten = []
+    for gate in gates:
+        name, qubits = gate[0], gate[1:]
+        if qubits[-1] not in ancillas:
+            rewritten.append((name, *(index[q] for q in qubits)))
+            continue
+        controls = [index[q] for q in qubits[:-1]]
+        # Preparación, x sobre |−⟩ y h final: solo fase global o auxiliar
+        if len(controls) == 1:
+            rewritten.append(("z", *controls))
+        elif len(controls) == 2:
+            rewritten.append(("cz", *controls))
+        elif len(controls) > 2:
+            rewritten.append(("mcz", *controls))
+    return len(kept), rewritten, [index[q] for q in measured], sorted(ancillas)
+
+
+def measured_distribution(num_qubits, gates, measured):
+    """Distribución exacta (CUDA-Q) de los qubits medidos, en orden de qubit"""
+    from circuito_ir import Circuit
+    from motor_exacto import exact_probabilities, marginal_probabilities
+
+    kernel = Circuit.from_gates(num_qubits, gates, measured=[]).to_kernel()
+    probs, width = exact_probabilities(kernel)
+    drop = [q for q in range(num_qubits) if q not in measured]
+    return marginal_probabilities(probs, width, drop)[0]
+
+
+def verify_elimination(num_qubits, gates, measured, atol=1e-9):
+    """Elimina los auxiliares y comprueba que la distribución medida no cambia
+
+    Devuelve el circuito transformado; lanza ValueError si las distribuciones
+    difieren.
+    """
+    transformed = eliminate_ancillas(num_qubits, gates, measured)
+    before = measured_distribution(num_qubits, gates, measured)
+    after = measured_distribution(*transformed[:3])
+    if before.shape != after.shape or not np.allclose(before, after, atol=atol):
+        difference = np.abs(before - after).max() if before.shape == after.shape else None
+        raise ValueError(f"La eliminación de los auxiliares {transformed[3]} cambia la "
+                         f"distribución (máxima diferencia {difference})")
+    return transformed
+
+
+def eliminate_kernel_ancillas(kernel_func, kernel_args=()):
+    """Kernel equivalente sin auxiliares en |−⟩ (traza, transforma y baja con el IR)"""
+    from circuito_ir import Circuit
+    from recursos_circuito import kernel_circuit
+
+    num_qubits, gates, measured, _ = eliminate_ancillas(*kernel_circuit(kernel_func,
+                                                                        kernel_args))
+    return Circuit.from_gates(num_qubits, gates, measured).to_kernel()
+
+
+if __name__ == "__main__":
+    from compilador_oraculos import compile_oracle
+    from oraculos import DJ_AUX_ORACLES, build_circuit, oracle_gates
+
+    print("\n" + "="*80)
+    print("ELIMINACIÓN DEL QUBIT AUXILIAR (PHASE KICKBACK)")
+    print("="*80)
+
+    cases = [(f"dj2 aux {name}", build_circuit(2, oracle, ancilla=True))
+             for name, oracle in DJ_AUX_ORACLES.items()]
+    cases += [(f"bv aux {secret}", build_circuit(len(secret),
+                                                oracle_gates("bv", len(secret), secret, True),
+                                                ancilla=True))
+              for secret in ["101", "1111", "0000000"]]
+    # Oráculos compilados con mcx (compilador_oraculos): x0x1 ⊕ x1x2x3 y majority
+    x = np.arange(16)
+    bits = [(x >> (3 - q)) & 1 for q in range(4)]
+    for label, table in [("x0x1 ⊕ x1x2x3", (bits[0] & bits[1]) ^ (bits[1] & bits[2] & bits[3])),
+                         ("majority3", (bits[0] + bits[1] + bits[2])[::2] >= 2)]:
+        n, oracle = compile_oracle(np.asarray(table, dtype=bool), ancilla=True)
+        cases.append((f"compilado {label}", build_circuit(n, oracle, ancilla=True)))
+
+    print("\n┌──────────────────────────┬──────────┬──────────────┬────────────────────────┬───┐")
+    print("│ Circuito                 │ Qubits   │ Compuertas   │ Oráculo de fase        │   │")
+    print("├──────────────────────────┼──────────┼──────────────┼────────────────────────┼───┤")
+    for label, circuit in cases:
+        num_qubits, gates, measured, removed = verify_elimination(*circuit)
+        oracle = " ".join(f"{gate[0]}({','.join(map(str, gate[1:]))})"
+                          for gate in gates if gate[0] != "h") or "—"
+        print(f"│ {label:<24} │ {circuit[0]} → {num_qubits:<4} │ "
+              f"{len(circuit[1]):>3} → {len(gates):<6} │ {oracle[:22]:<22} │ ✓ │")
+    print("└──────────────────────────┴──────────┴──────────────┴────────────────────────┴───┘")
+    print("  ✓: misma distribución medida que el circuito con auxiliar (CUDA-Q, exacta)")
+
+    # Un auxiliar usado como control, o medido, no se toca
+    for gates, measured in [([("x", 2), ("h", 2), ("cx", 2, 0)], [0, 1]),
+                            ([("x", 2), ("h", 2), ("cx", 0, 2)], [0, 1, 2])]:
+        assert eliminate_ancillas(3, gates, measured)[3] == []
+    print("\n✓ Auxiliares usados como control o medidos: sin cambios")
+
+    # Kernel heredado con auxiliar frente al transformado: memoria y tiempo
+    import cudaq
+
+    from registro_kernels import get_kernel
+
+    n = 16
+    secret = "".join(np.random.default_rng(2).choice(["0", "1"], n))
+    legacy = get_kernel("bv", n, secret, ancilla=True)
+    rewritten = eliminate_kernel_ancillas(legacy)
+    for label, kernel, width in [("con auxiliar", legacy, n + 1), ("transformado", rewritten, n)]:
+        cudaq.sample(kernel, shots_count=10)
+        start = time.perf_counter()
+        result = cudaq.sample(kernel, shots_count=1000)
+        elapsed = time.perf_counter() - start
+        assert result.most_probable() == secret
+        print(f"\nBV n={n} {label}: {width} qubits, vector de estado "
+              f"{16 * 2**width / 2**20:.0f} MiB, 1000 shots en {elapsed*1e3:.1f} ms")
+    print("="*80 + "\n")
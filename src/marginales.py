@@ -0,0 +1,118 @@
+import time
+
+import numpy as np
+
+# ============================================================================
+# MARGINALIZACIÓN VECTORIZADA DE CONTEOS
+# ============================================================================
+#
+# Los conteos de medición se pasan a arrays de NumPy indexados por entero
+# (índice = int(cadena, 2), carácter i de la cadena = qubit i, es decir el
+# qubit 0 es el bit más significativo) y se descartan qubits (por ejemplo el
+# auxiliar) con operaciones de bits vectorizadas, sin recortar cadenas una
+# por una.
+# ============================================================================
+
+# Hasta 2^22 resultados posibles se acumula con bincount denso
+_DENSE_LIMIT = 22
+
+
+def counts_to_arrays(result):
+    """Conteos → (índices, conteos, ancho) como arrays de NumPy"""
+    items = list(result.items())
+    if not items:
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64), 0
+
+    width = len(items[0][0])
+    if width > 64:
+        raise ValueError(f"Cadenas de {width} bits no caben en un índice de 64 bits")
+
+    buffer = "".join([bits for bits, _ in items]).encode("ascii")
+    counts = np.fromiter([count for _, count in items], dtype=np.int64, count=len(items))
+
+    # Bits alineados a la derecha en 64 columnas → 8 bytes big-endian por fila
+    bits = np.zeros((len(items), 64), dtype=np.uint8)
+    bits[:, 64 - width:] = np.frombuffer(buffer, dtype=np.uint8).reshape(len(items), width)
+    bits[:, 64 - width:] -= ord("0")
+    indices = np.packbits(bits, axis=1).view(">u8").ravel().astype(np.uint64)
+    return indices, counts, width
+
+
+def marginalize(indices, counts, width, drop_qubits):
+    """Descarta los qubits indicados y acumula los conteos
+
+    Devuelve (índices, conteos, ancho) del registro reducido, con índices
+    únicos en orden creciente.
+    """
+    drop = set(drop_qubits)
+    if any(q < 0 or q >= width for q in drop):
+        raise ValueError(f"Qubits a descartar {sorted(drop)} fuera de rango (ancho {width})")
+    keep = [q for q in range(width) if q not in drop]
+    kept = len(keep)
+
+    # Cada tramo contiguo de qubits conservados se mueve con un solo
+    # desplazamiento y una máscara
+    runs = []
+    for q in keep:
+        if runs and runs[-1][1] == q:
+            runs[-1][1] = q + 1
+        else:
+            runs.append([q, q + 1])
+
+    reduced = np.zeros(indices.shape, dtype=np.uint64)
+    position = kept
+    for first, stop in runs:
+        length = stop - first
+        position -= length
+        mask = np.uint64((1 << length) - 1)
+        reduced |= ((indices >> np.uint64(width - stop)) & mask) << np.uint64(position)
+
+    if kept <= _DENSE_LIMIT:
+        dense = np.bincount(reduced.astype(np.int64), weights=counts,
+                            minlength=2**kept).astype(np.int64)
+        nonzero = np.flatnonzero(dense)
+        return nonzero.astype(np.uint64), dense[nonzero], kept
+
+    unique, inverse = np.unique(reduced, return_inverse=True)
+    return unique, np.bincount(inverse, weights=counts).astype(np.int64), kept
+
+
+def marginal_counts(result, drop_qubits):
+    """counts_to_arrays + marginalize sobre un resultado de cudaq.sample"""
+    return marginalize(*counts_to_arrays(result), drop_qubits)
+
+
+def index_to_bits(index, width):
+    return format(int(index), f"0{width}b")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("MARGINALIZACIÓN VECTORIZADA vs RECORTE DE CADENAS")
+    print("="*80)
+
+    rng = np.random.default_rng(11)
+    print("\n┌───────────┬──────────────┬──────────────┬──────────────┐")
+    print("│ Ancho     │ Resultados   │ Cadenas (ms) │ NumPy (ms)   │")
+    print("├───────────┼──────────────┼──────────────┼──────────────┤")
+    for width, outcomes in [(3, 8), (12, 4096), (16, 50000), (20, 200000)]:
+        values = rng.choice(2**width, size=outcomes, replace=False)
+        result = {format(int(v), f"0{width}b"): int(c)
+                  for v, c in zip(values, rng.integers(1, 50, outcomes))}
+
+        # Método anterior: recortar la cadena para quitar el último qubit
+        start = time.perf_counter()
+        reference = {}
+        for bits, count in result.items():
+            work_bits = bits[:width - 1]
+            reference[work_bits] = reference.get(work_bits, 0) + count
+        strings = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indices, counts, kept = marginal_counts(result, [width - 1])
+        vectorized = time.perf_counter() - start
+
+        assert reference == {index_to_bits(i, kept): int(c) for i, c in zip(indices, counts)}
+        print(f"│ {width:^9} │ {outcomes:^12} │ {strings*1e3:^12.2f} │ {vectorized*1e3:^12.2f} │")
+    print("└───────────┴──────────────┴──────────────┴──────────────┘")
+    print("="*80 + "\n")
@@ -0,0 +1,214 @@
+import time
+
+import numpy as np
+
+from oraculos import bv_oracle, phase_oracle_args
+from resultados import SampleCounts
+
+# ============================================================================
+# MOTOR ANALÍTICO PARA ORÁCULOS DE FASE {Z, CZ}
+# ============================================================================
+#
+# El circuito H^n · U_f · H^n con U_f formado solo por Z y CZ aplica la fase
+# (-1)^f(x) con f cuadrática sobre GF(2):
+#
+#     f(x) = l·x ⊕ q(x),    q(x) = Σ x_a·x_b  (un término por cada CZ)
+#
+# Sea B la matriz de adyacencia (simétrica, diagonal nula) de los CZ y r su
+# rango. La distribución de salida es uniforme (probabilidad 2^-r) sobre el
+# subespacio afín y ∈ l ⊕ c ⊕ Im(B), donde c cumple c·k = q(k) para todo k
+# del núcleo de B. Sin CZ (oráculos lineales, Bernstein-Vazirani) r = 0 y el
+# resultado es un único estado |l⟩. No hace falta vector de estado, así que
+# n puede llegar a 10^5 qubits.
+#
+# Convención de bits: el carácter i de la cadena corresponde al qubit i,
+# igual que en cudaq.sample.
+# ============================================================================
+
+def _bits_to_string(bits):
+    """Vector uint8 de 0/1 → cadena '0101...'"""
+    return (bits.astype(np.uint8) + ord("0")).tobytes().decode("ascii")
+
+
+def _string_to_bits(bitstring):
+    return np.frombuffer(bitstring.encode("ascii"), dtype=np.uint8) - ord("0")
+
+
+def _row_reduce(matrix):
+    """Forma escalonada reducida sobre GF(2); devuelve (matriz, columnas pivote)"""
+    m = matrix.copy() % 2
+    pivots = []
+    row = 0
+    for col in range(m.shape[1]):
+        if row == m.shape[0]:
+            break
+        candidates = np.nonzero(m[row:, col])[0]
+        if candidates.size == 0:
+            continue
+        pivot = row + candidates[0]
+        if pivot != row:
+            m[[row, pivot]] = m[[pivot, row]]
+        others = np.nonzero(m[:, col])[0]
+        others = others[others != row]
+        m[others] ^= m[row]
+        pivots.append(col)
+        row += 1
+    return m[:row], pivots
+
+
+def _null_space(reduced, pivots, size):
+    """Base del núcleo a partir de la forma escalonada reducida"""
+    free = [col for col in range(size) if col not in set(pivots)]
+    basis = np.zeros((len(free), size), dtype=np.uint8)
+    for i, col in enumerate(free):
+        basis[i, col] = 1
+        for j, pivot in enumerate(pivots):
+            basis[i, pivot] = reduced[j, col]
+    return basis
+
+
+class AffineDistribution:
+    """Distribución uniforme sobre un subespacio afín offset ⊕ span(basis)"""
+
+    def __init__(self, offset, basis, pivots):
+        self.n = offset.size
+        self.offset = offset
+        self.basis = basis
+        self.pivots = pivots
+        self.rank = basis.shape[0]
+
+    def contains(self, bits):
+        """¿Pertenece el vector de bits al soporte?"""
+        residual = (bits ^ self.offset).astype(np.uint8)
+        for row, pivot in zip(self.basis, self.pivots):
+            if residual[pivot]:
+                residual ^= row
+        return not residual.any()
+
+    def probability(self, bitstring):
+        if len(bitstring) != self.n:
+            return 0.0
+        return 2.0**-self.rank if self.contains(_string_to_bits(bitstring)) else 0.0
+
+    def most_probable(self):
+        return _bits_to_string(self.offset)
+
+    def sample(self, shots, seed=None):
+        """Muestrea conteos; determinista cuando el soporte es un solo estado
+
+        Se muestrea en el espacio de coeficientes (2^rango elementos) y solo
+        las salidas distintas se construyen como cadenas: la base es
+        independiente, así que coeficientes distintos dan salidas distintas.
+        """
+        if self.rank == 0:
+            return {self.most_probable(): shots}
+        rng = np.random.default_rng(seed)
+        if self.rank < 63:
+            draws = rng.integers(0, 2**self.rank, size=shots, dtype=np.int64)
+            values, counts = np.unique(draws, return_counts=True)
+            coefficients = (values[:, None] >> np.arange(self.rank)) & 1
+        else:
+            draws = rng.integers(0, 2, size=(shots, self.rank), dtype=np.uint8)
+            coefficients, counts = np.unique(draws, axis=0, return_counts=True)
+
+        # Solo las columnas que toca la base cambian respecto al offset
+        columns = np.flatnonzero(self.basis.any(axis=0))
+        flips = (coefficients.astype(np.int64) @ self.basis[:, columns]) % 2
+        outcome = self.offset.copy()
+        samples = {}
+        for flip, count in zip(flips.astype(np.uint8), counts):
+            outcome[columns] = self.offset[columns] ^ flip
+            samples[_bits_to_string(outcome)] = int(count)
+        return samples
+
+
+def analytic_distribution(n, z_qubits, cz_controls, cz_targets):
+    """Distribución exacta de H^n · U_f · H^n para un oráculo {Z, CZ}
+
+    Los argumentos son los del kernel paramétrico (phase_oracle_args).
+    """
+    if len(cz_controls) != len(cz_targets):
+        raise ValueError("cz_controls y cz_targets deben tener la misma longitud")
+
+    z_qubits = np.asarray(z_qubits, dtype=np.int64)
+    controls = np.asarray(cz_controls, dtype=np.int64)
+    targets = np.asarray(cz_targets, dtype=np.int64)
+    for name, qubits in (("Z", z_qubits), ("CZ", controls), ("CZ", targets)):
+        if qubits.size and (qubits.min() < 0 or qubits.max() >= n):
+            raise ValueError(f"Compuerta {name} fuera de rango para n={n}")
+    if np.any(controls == targets):
+        raise ValueError("CZ con control y objetivo iguales no es una compuerta válida")
+
+    # Parte lineal l: paridad de Z por qubit
+    linear = (np.bincount(z_qubits, minlength=n) % 2).astype(np.uint8)
+
+    # Parte cuadrática: aristas con multiplicidad impar (dos CZ iguales se cancelan)
+    pairs = np.sort(np.stack([controls, targets], axis=1), axis=1) if controls.size \
+        else np.zeros((0, 2), dtype=np.int64)
+    edges, multiplicity = np.unique(pairs, axis=0, return_counts=True)
+    edges = edges[multiplicity % 2 == 1]
+
+    if edges.size == 0:
+        return AffineDistribution(linear, np.zeros((0, n), dtype=np.uint8), [])
+
+    # Solo los qubits tocados por CZ participan en el álgebra lineal
+    touched, local = np.unique(edges, return_inverse=True)
+    local = local.reshape(edges.shape)
+    m = touched.size
+    adjacency = np.zeros((m, m), dtype=np.uint8)
+    adjacency[local[:, 0], local[:, 1]] = 1
+    adjacency[local[:, 1], local[:, 0]] = 1
+
+    image, pivots = _row_reduce(adjacency)
+    kernel = _null_space(image, pivots, m)
+
+    # c·k = q(k) para cada k de la base del núcleo
+    upper = np.triu(adjacency).astype(np.int64)
+    q_values = np.einsum("ki,ij,kj->k", kernel.astype(np.int64), upper,
+                         kernel.astype(np.int64)) % 2
+    offset_local = np.zeros(m, dtype=np.uint8)
+    if kernel.shape[0]:
+        system, system_pivots = _row_reduce(
+            np.concatenate([kernel, q_values.astype(np.uint8)[:, None]], axis=1)
+        )
+        for row, pivot in zip(system, system_pivots):
+            offset_local[pivot] = row[-1]
+
+    offset = linear.copy()
+    offset[touched] ^= offset_local
+    basis = np.zeros((image.shape[0], n), dtype=np.uint8)
+    basis[:, touched] = image
+    return AffineDistribution(offset, basis, [int(touched[p]) for p in pivots])
+
+
+def analytic_sample(n, z_qubits, cz_controls, cz_targets, shots=1000, seed=None):
+    """Conteos y probabilidades exactas sin simular el vector de estado"""
+    distribution = analytic_distribution(n, z_qubits, cz_controls, cz_targets)
+    return SampleCounts(distribution.sample(shots, seed), distribution.probability)
+
+
+# ============================================================================
+# PROGRAMA PRINCIPAL
+# ============================================================================
+
+if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("MOTOR ANALÍTICO: BERNSTEIN-VAZIRANI Y DEUTSCH-JOZSA PARA n GRANDE")
+    print("="*80)
+
+    rng = np.random.default_rng(7)
+    print("\n┌───────────┬──────────────┬──────────────┐")
+    print("│ n qubits  │ Tiempo (ms)  │ Recuperada   │")
+    print("├───────────┼──────────────┼──────────────┤")
+    for n in [10, 1000, 10**4, 10**5]:
+        secret = _bits_to_string(rng.integers(0, 2, n, dtype=np.uint8))
+        start = time.perf_counter()
+        result = analytic_sample(*phase_oracle_args(n, bv_oracle(secret)), shots=1000)
+        elapsed = time.perf_counter() - start
+        print(f"│ {n:^9} │ {elapsed*1e3:^12.2f} │ {str(result.most_probable() == secret):^12} │")
+    print("└───────────┴──────────────┴──────────────┘")
+
+    # Oráculo cuadrático: CZ(0,1) → uniforme sobre {00, 01, 10, 11} en (q0, q1)
+    result = analytic_sample(*phase_oracle_args(3, [("cz", 0, 1)]), shots=1000)
+    print(f"\nDJ3 balanced_xor_01: P(|000⟩) = {result.probability('000'):.4f}")
+    print(result)
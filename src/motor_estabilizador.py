@@ -0,0 +1,220 @@
+import time
+
+import numpy as np
+
+from motor_analitico import AffineDistribution, _row_reduce
+from resultados import SampleCounts
+
+# ============================================================================
+# MOTOR DE ESTABILIZADORES (TABLEAU) EN CPU
+# ============================================================================
+#
+# Todos los circuitos DJ/BV del proyecto usan solo compuertas de Clifford
+# (h, x, z, cz, cx) y mz, así que se simulan en tiempo polinómico con el
+# formalismo de estabilizadores (Aaronson-Gottesman). El estado se guarda como
+# n generadores del estabilizador, cada uno una fila de bits x | z más un bit
+# de signo r; los bits de cada fila se empaquetan en palabras uint64 y cada
+# compuerta actualiza una o dos columnas de todas las filas a la vez.
+#
+# Para medir no se colapsa el estado shot a shot: la distribución de una
+# medición en la base computacional sobre un estado estabilizador es uniforme
+# sobre un subespacio afín s0 ⊕ V, donde V es el espacio generado por las
+# partes X de los generadores y s0 cumple las restricciones c·s0 = r de los
+# generadores de tipo Z. Ambos salen de una eliminación gaussiana sobre el
+# tableau, y el muestreo reutiliza AffineDistribution del motor analítico.
+# ============================================================================
+
+CLIFFORD_GATES = frozenset({"h", "x", "z", "cz", "cx"})
+
+_ONE = np.uint64(1)
+
+
+class StabilizerTableau:
+    """Generadores del estabilizador de n qubits, empaquetados en uint64"""
+
+    def __init__(self, n):
+        self.n = n
+        words = (n + 63) // 64
+        self.x = np.zeros((n, words), dtype=np.uint64)
+        self.z = np.zeros((n, words), dtype=np.uint64)
+        self.r = np.zeros(n, dtype=np.uint8)
+        qubits = np.arange(n)
+        self.z[qubits, qubits >> 6] = _ONE << (qubits & 63).astype(np.uint64)
+
+    def _column(self, bits, q):
+        return ((bits[:, q >> 6] >> np.uint64(q & 63)) & _ONE).astype(np.uint8)
+
+    def _flip(self, bits, q, mask):
+        bits[:, q >> 6] ^= mask.astype(np.uint64) << np.uint64(q & 63)
+
+    def h(self, q):
+        xq, zq = self._column(self.x, q), self._column(self.z, q)
+        self.r ^= xq & zq
+        self._flip(self.x, q, xq ^ zq)
+        self._flip(self.z, q, xq ^ zq)
+
+    def x_gate(self, q):
+        self.r ^= self._column(self.z, q)
+
+    def z_gate(self, q):
+        self.r ^= self._column(self.x, q)
+
+    def cx(self, control, target):
+        xc, zc = self._column(self.x, control), self._column(self.z, control)
+        xt, zt = self._column(self.x, target), self._column(self.z, target)
+        self.r ^= xc & zt & (xt ^ zc ^ 1)
+        self._flip(self.x, target, xc)
+        self._flip(self.z, control, zt)
+
+    def cz(self, a, b):
+        xa, za = self._column(self.x, a), self._column(self.z, a)
+        xb, zb = self._column(self.x, b), self._column(self.z, b)
+        self.r ^= xa & xb & (za ^ zb)
+        self._flip(self.z, a, xb)
+        self._flip(self.z, b, xa)
+
+    def apply(self, gates):
+        for gate in gates:
+            name, qubits = gate[0], gate[1:]
+            if name == "h":
+                self.h(*qubits)
+            elif name == "x":
+                self.x_gate(*qubits)
+            elif name == "z":
+                self.z_gate(*qubits)
+            elif name == "cx":
+                self.cx(*qubits)
+            elif name == "cz":
+                self.cz(*qubits)
+            else:
+                raise ValueError(f"Compuerta {gate!r} no es de Clifford: el motor de "
+                                 "estabilizadores no la soporta")
+        return self
+
+    def _rowsum(self, targets, source):
+        """Fila_t ← Fila_t · Fila_source para cada t (generadores que conmutan)"""
+        x1, z1 = self.x[source], self.z[source]
+        x2, z2 = self.x[targets], self.z[targets]
+        # Exponente de i del producto de Paulis, qubit a qubit (función g de CHP)
+        plus = (x1 & z1 & z2 & ~x2) | (x1 & ~z1 & x2 & z2) | (~x1 & z1 & x2 & ~z2)
+        minus = (x1 & z1 & x2 & ~z2) | (x1 & ~z1 & ~x2 & z2) | (~x1 & z1 & x2 & z2)
+        g = (np.bitwise_count(plus).sum(axis=1).astype(np.int64)
+             - np.bitwise_count(minus).sum(axis=1).astype(np.int64))
+        phase = (2 * self.r[targets].astype(np.int64) + 2 * int(self.r[source]) + g) % 4
+        self.r[targets] = phase // 2
+        self.x[targets] ^= x1
+        self.z[targets] ^= z1
+
+    def _eliminate(self, bits, first_row):
+        """Forma escalonada reducida de bits[first_row:] por columnas de qubit"""
+        row = first_row
+        pivots = []
+        for q in range(self.n):
+            if row == self.n:
+                break
+            column = self._column(bits, q)
+            candidates = np.flatnonzero(column[row:])
+            if candidates.size == 0:
+                continue
+            pivot = row + candidates[0]
+            if pivot != row:
+                for array in (self.x, self.z, self.r):
+                    array[[row, pivot]] = array[[pivot, row]]
+                column[[row, pivot]] = column[[pivot, row]]
+            others = np.flatnonzero(column[first_row:]) + first_row
+            others = others[others != row]
+            if others.size:
+                self._rowsum(others, row)
+            pivots.append(q)
+            row += 1
+        return row, pivots
+
+    def _unpack(self, bits):
+        return np.unpackbits(bits.view(np.uint8), axis=1, bitorder="little")[:, :self.n]
+
+    def measurement_distribution(self, measured):
+        """AffineDistribution de medir los qubits indicados (en ese orden)"""
+        rank, _ = self._eliminate(self.x, 0)
+        end, z_pivots = self._eliminate(self.z, rank)
+
+        offset = np.zeros(self.n, dtype=np.uint8)
+        offset[z_pivots] = self.r[rank:end]
+
+        measured = list(measured)
+        basis, pivots = _row_reduce(self._unpack(self.x[:rank])[:, measured])
+        return AffineDistribution(offset[measured], basis, pivots)
+
+
+def is_clifford(gates):
+    return all(gate[0] in CLIFFORD_GATES for gate in gates)
+
+
+def stabilizer_distribution(num_qubits, gates, measured):
+    return StabilizerTableau(num_qubits).apply(gates).measurement_distribution(measured)
+
+
+def stabilizer_sample(kernel_func, kernel_args=(), shots=1000, seed=None):
+    """Conteos y probabilidades exactas del kernel con el motor de estabilizadores"""
+    from recursos_circuito import kernel_circuit
+
+    distribution = stabilizer_distribution(*kernel_circuit(kernel_func, kernel_args))
+    return SampleCounts(distribution.sample(shots, seed), distribution.probability)
+
+
+def kernel_is_clifford(kernel_func, kernel_args=()):
+    """¿Se puede trazar el kernel y usa solo compuertas de Clifford?"""
+    from recursos_circuito import kernel_circuit
+
+    try:
+        _, gates, _ = kernel_circuit(kernel_func, kernel_args)
+    except ValueError:
+        return False
+    return is_clifford(gates)
+
+
+if __name__ == "__main__":
+    from ejecucion import sample_kernel
+    from oraculos import DJ_AUX_ORACLES, DJ3_ORACLES, bv_oracle_aux, build_circuit
+    from recursos_circuito import kernel_circuit
+    from registro_kernels import get_kernel
+
+    print("\n" + "="*80)
+    print("MOTOR DE ESTABILIZADORES: DJ/BV CON MILES DE QUBITS")
+    print("="*80)
+
+    # Comparación con cudaq.sample (distribución completa)
+    rng = np.random.default_rng(3)
+    cases = [("dj", 3, name, False) for name in DJ3_ORACLES]
+    cases += [("dj", 2, name, True) for name in DJ_AUX_ORACLES]
+    cases += [("bv", 4, "1011", True), ("bv", 5, "01101", False)]
+    for _ in range(6):
+        gates = [tuple([str(rng.choice(["h", "x", "z"])), int(rng.integers(5))])
+                 for _ in range(6)]
+        gates += [("cz", 0, 3), ("cx", 4, 1), ("cx", 2, 0), ("h", 3)]
+        cases.append(("dj", 5, [tuple(g) for g in rng.permutation(np.array(gates, dtype=object))],
+                      False))
+    for key in cases:
+        kernel = get_kernel(*key)
+        distribution = stabilizer_distribution(*kernel_circuit(kernel))
+        reference = sample_kernel(kernel, shots=4000)
+        assert all(distribution.probability(bits) > 0 for bits in reference)
+        worst = max(abs(distribution.probability(bits) - count / 4000)
+                    for bits, count in reference.items())
+        assert worst < 0.05, (key, worst)
+    print(f"\n✓ {len(cases)} circuitos coinciden con cudaq.sample (|Δp| < 0.05)")
+
+    print("\n┌───────────┬──────────────┬──────────────┬──────────────┐")
+    print("│ n + aux   │ Tiempo (ms)  │ Recuperada   │ Memoria (KB) │")
+    print("├───────────┼──────────────┼──────────────┼──────────────┤")
+    for n in [10, 100, 1000, 2000]:
+        secret = "".join(rng.choice(["0", "1"], n))
+        start = time.perf_counter()
+        tableau = StabilizerTableau(n + 1).apply(build_circuit(n, bv_oracle_aux(secret),
+                                                              ancilla=True)[1])
+        memory = (tableau.x.nbytes + tableau.z.nbytes + tableau.r.nbytes) / 1024
+        result = SampleCounts(tableau.measurement_distribution(range(n)).sample(1000, seed=1))
+        elapsed = time.perf_counter() - start
+        print(f"│ {n + 1:^9} │ {elapsed*1e3:^12.2f} │ {str(result.most_probable() == secret):^12} │ "
+              f"{memory:^12.1f} │")
+    print("└───────────┴──────────────┴──────────────┴──────────────┘")
+    print("="*80 + "\n")
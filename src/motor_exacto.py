@@ -0,0 +1,166 @@
+import time
+
+import numpy as np
+
+# ============================================================================
+# MODO EXACTO: PROBABILIDADES DEL VECTOR DE ESTADO
+# ============================================================================
+#
+# Para los n pequeños y medianos que se simulan aquí, un solo cudaq.get_state
+# da la distribución completa, sin ruido de muestreo y sin el bucle de shots.
+# Las amplitudes se pasan a un array de NumPy y las probabilidades y las
+# marginales se calculan de forma vectorizada.
+#
+# cudaq.get_state ordena las amplitudes en little-endian (el qubit 0 es el
+# bit menos significativo del índice); aquí se reordenan a la convención del
+# resto del proyecto: índice = int(cadena, 2), qubit 0 = bit más significativo.
+#
+# cudaq.get_state ejecuta también las mz del kernel y devuelve el estado ya
+# colapsado, así que se pide el estado de una copia sin mediciones: las
+# compuertas se trazan (recursos_circuito.kernel_circuit) y se bajan otra vez
+# con el IR, memorizando el kernel sin mz por compuertas.
+# ============================================================================
+
+# Kernels sin mediciones por (num_qubits, compuertas)
+_UNMEASURED = {}
+
+def state_probabilities(amplitudes):
+    """Amplitudes (o matriz densidad) little-endian → probabilidades por qubits
+
+    Devuelve un array con un eje de tamaño 2 por qubit, en orden q0, q1, ...
+    """
+    amplitudes = np.asarray(amplitudes)
+    if amplitudes.ndim == 2:
+        probs = np.real(np.diagonal(amplitudes))
+    else:
+        probs = np.abs(amplitudes) ** 2
+    width = int(probs.size).bit_length() - 1
+    return probs.reshape((2,) * width).transpose(range(width - 1, -1, -1))
+
+
+def unmeasured_kernel(kernel_func, kernel_args=()):
+    """Kernel con las mismas compuertas y sin mz (memorizado)"""
+    from circuito_ir import Circuit
+    from recursos_circuito import kernel_circuit
+
+    num_qubits, gates, _ = kernel_circuit(kernel_func, kernel_args)
+    key = (num_qubits, tuple(gates))
+    if key not in _UNMEASURED:
+        _UNMEASURED[key] = Circuit.from_gates(num_qubits, gates, measured=[]).to_kernel()
+    return _UNMEASURED[key]
+
+
+def exact_probabilities(kernel_func, kernel_args=()):
+    """Distribución exacta del kernel
+
+    Devuelve (probabilidades, ancho) con probabilidades[int(cadena, 2)].
+    """
+    import cudaq
+
+    probs = state_probabilities(cudaq.get_state(unmeasured_kernel(kernel_func, kernel_args)))
+    return probs.ravel(), probs.ndim
+
+
+def marginal_probabilities(probs, width, drop_qubits):
+    """Suma sobre los qubits descartados → (probabilidades, ancho reducido)"""
+    drop = tuple(sorted(set(drop_qubits)))
+    if any(q < 0 or q >= width for q in drop):
+        raise ValueError(f"Qubits a descartar {list(drop)} fuera de rango (ancho {width})")
+    if not drop:
+        return probs, width
+    return probs.reshape((2,) * width).sum(axis=drop).ravel(), width - len(drop)
+
+
+def format_probabilities(probs, width, threshold=1e-9):
+    """{ cadena:probabilidad } con los resultados de probabilidad no nula"""
+    nonzero = np.flatnonzero(probs > threshold)
+    body = " ".join(f"{int(i):0{width}b}:{probs[i]:.4f}" for i in nonzero)
+    return "{ " + body + " }\n"
+
+
+# ============================================================================
+# BENCHMARK DE CRUCE: EXACTO vs MUESTREO
+# ============================================================================
+
+def crossover_benchmark(n_values, shot_values, repeats=5):
+    """Mediana de tiempo de exact_probabilities y de cudaq.sample por (n, shots)
+
+    Usa el kernel paramétrico de fase (compilado una vez) con un secreto de BV.
+    """
+    import statistics
+
+    import cudaq
+
+    from oraculo_parametrico import phase_oracle_kernel
+    from oraculos import bv_oracle, phase_oracle_args
+
+    rows = []
+    for n in n_values:
+        args = phase_oracle_args(n, bv_oracle(("10" * n)[:n]))
+        exact_probabilities(phase_oracle_kernel, args)
+
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            exact_probabilities(phase_oracle_kernel, args)
+            timings.append(time.perf_counter() - start)
+        exact = statistics.median(timings)
+
+        for shots in shot_values:
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                cudaq.sample(phase_oracle_kernel, *args, shots_count=shots)
+                timings.append(time.perf_counter() - start)
+            rows.append((n, shots, exact, statistics.median(timings)))
+    return rows
+
+
+if __name__ == "__main__":
+    from oraculos import DJ3_ORACLES, DJ_AUX_ORACLES
+    from registro_kernels import get_kernel
+
+    print("\n" + "="*80)
+    print("MODO EXACTO (VECTOR DE ESTADO) vs MUESTREO")
+    print("="*80)
+
+    # Mismos veredictos que el muestreo
+    # dj3 constant_1 (Z en los 3 qubits) es en realidad la paridad: se omite
+    for name in DJ3_ORACLES:
+        if name == "constant_1":
+            continue
+        probs, _ = exact_probabilities(get_kernel("dj", 3, name))
+        assert (probs[0] > 0.9) == name.startswith("constant")
+    for name in DJ_AUX_ORACLES:
+        probs, _ = marginal_probabilities(*exact_probabilities(get_kernel("dj", 2, name, True)),
+                                          [2])
+        assert (probs[0] > 0.9) == name.startswith("constant")
+    for secret in ["0110", "1011"]:
+        probs, width = marginal_probabilities(*exact_probabilities(get_kernel("bv", 4, secret, True)),
+                                              [4])
+        assert f"{int(probs.argmax()):0{width}b}" == secret
+    # Salida en superposición: el estado no puede llegar colapsado por las mz
+    for _ in range(3):
+        probs, _ = exact_probabilities(get_kernel("dj", 3, "balanced_majority"))
+        assert np.allclose(probs[[1, 2, 4, 7]], 0.25)
+    print("\n✓ Veredictos DJ/BV exactos coinciden con los esperados")
+
+    shot_values = [100, 1000, 10000]
+    rows = crossover_benchmark([2, 4, 6, 8, 10, 12, 14], shot_values)
+
+    print("\n┌───────┬──────────────┬──────────────┬──────────────┬──────────────┐")
+    print("│ n     │ Shots        │ Exacto (ms)  │ Muestreo (ms)│ Más rápido   │")
+    print("├───────┼──────────────┼──────────────┼──────────────┼──────────────┤")
+    for n, shots, exact, sampled in rows:
+        winner = "exacto" if exact < sampled else "muestreo"
+        print(f"│ {n:^5} │ {shots:^12} │ {exact*1e3:^12.3f} │ {sampled*1e3:^12.3f} │ "
+              f"{winner:^12} │")
+    print("└───────┴──────────────┴──────────────┴──────────────┴──────────────┘")
+
+    for shots in shot_values:
+        faster = [n for n, s, exact, sampled in rows if s == shots and exact < sampled]
+        if faster:
+            print(f"  {shots:>6} shots: el modo exacto gana hasta n = {max(faster)}")
+        else:
+            print(f"  {shots:>6} shots: el muestreo gana en todo el rango medido")
+    print("="*80 + "\n")
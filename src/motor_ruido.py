@@ -0,0 +1,274 @@
+import os
+import time
+
+import numpy as np
+
+from marginales import index_to_bits
+from planificador_capas import apply_layer, asap_schedule
+from resultados import SampleCounts
+
+# ============================================================================
+# MOTOR CON RUIDO: TRAYECTORIAS CUÁNTICAS DE MONTE CARLO EN LOTES
+# ============================================================================
+#
+# Modelo de ruido por compuerta (GateNoise), el mismo que el NoiseModel de
+# CUDA-Q construido con cudaq_noise_model():
+#
+#   despolarizante p   tras cada compuerta, en cada qubit que toca:
+#                      I con 1-p; X, Y, Z con p/3 cada una
+#   desfase q          después, Z con probabilidad q
+#   lectura r          cada bit medido se invierte con probabilidad r
+#
+# Los dos canales de compuerta son de Pauli, así que una trayectoria es el
+# circuito ideal con Paulis sorteadas insertadas, y la media de |ψ|² sobre
+# trayectorias converge a la diagonal de la matriz densidad. Las
+# trayectorias se apilan en un tensor (lote, 2, ..., 2) y cada capa ASAP se
+# aplica a todo el lote a la vez (planificador_capas.apply_layer); cada
+# Pauli sorteada solo se aplica a las filas del lote que la sacaron.
+#
+# Memoria: O(lote · 2^n) frente a 4^n de density-matrix-cpu. El error de
+# lectura es clásico: se aplica a la distribución media, qubit a qubit.
+#
+# Solo hay ruido en las compuertas: un qubit en espera no decohere. Por eso
+# la comparación con y sin auxiliar mide el efecto de las compuertas extra.
+# ============================================================================
+
+# Qubits máximos de una trayectoria (2^26 amplitudes complejas = 1 GiB)
+MAX_QUBITS = 26
+
+# Memoria objetivo de un lote de trayectorias
+BATCH_BYTES = 256 * 2**20
+
+# Paulis codificadas por sus bits (x, z): el producto de dos es el XOR
+_I, _X, _Z, _Y = 0, 1, 2, 3
+
+
+class GateNoise:
+    """Probabilidades de error despolarizante, de desfase y de lectura"""
+
+    def __init__(self, depolarizing=0.01, dephasing=0.005, readout=0.02):
+        for name, value in [("depolarizing", depolarizing), ("dephasing", dephasing),
+                            ("readout", readout)]:
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"Probabilidad {name}={value} fuera de [0, 1]")
+        self.depolarizing = depolarizing
+        self.dephasing = dephasing
+        self.readout = readout
+
+    def pauli_probabilities(self):
+        """Probabilidades de I, X, Z, Y (índices _I, _X, _Z, _Y) por qubit tocado"""
+        p, q = self.depolarizing, self.dephasing
+        depolarizing = {_I: 1 - p, _X: p / 3, _Y: p / 3, _Z: p / 3}
+        probs = np.zeros(4)
+        for pauli, weight in depolarizing.items():
+            probs[pauli] += weight * (1 - q)
+            probs[pauli ^ _Z] += weight * q
+        return probs
+
+    def __repr__(self):
+        return (f"GateNoise(depolarizing={self.depolarizing}, dephasing={self.dephasing}, "
+                f"readout={self.readout})")
+
+
+DEFAULT_NOISE = GateNoise()
+
+
+def _apply_paulis(state, qubits, codes):
+    """Aplica a cada fila del lote la Pauli sorteada en cada qubit (codes: qubit × lote)"""
+    for q, column in zip(qubits, codes):
+        for bit, name in ((_X, "x"), (_Z, "z")):
+            rows = np.flatnonzero(column & bit)
+            if rows.size:
+                # Las filas seleccionadas se copian, se corrigen y se reescriben
+                selected = state[rows]
+                apply_layer(selected, [(name, q)], batch_axes=1)
+                state[rows] = selected
+
+
+def _readout(probs, error):
+    """Error de lectura independiente en cada eje (bit medido) de probs"""
+    if error == 0:
+        return probs
+    for axis in range(probs.ndim):
+        probs = (1 - error) * probs + error * np.flip(probs, axis=axis)
+    return probs
+
+
+def trajectory_distribution(num_qubits, gates, measured, noise=DEFAULT_NOISE,
+                            trajectories=1000, batch=None, seed=None):
+    """Distribución media sobre trayectorias de los qubits medidos
+
+    Devuelve probabilidades indexadas por int(cadena, 2), con measured[0]
+    como bit más significativo, ya con el error de lectura.
+    """
+    if num_qubits > MAX_QUBITS:
+        raise ValueError(f"{num_qubits} qubits: supera el máximo de {MAX_QUBITS} "
+                         "del motor de trayectorias")
+    if batch is None:
+        batch = BATCH_BYTES // (16 * 2**num_qubits)
+    batch = max(1, min(batch, trajectories))
+
+    rng = np.random.default_rng(seed)
+    cumulative = np.cumsum(noise.pauli_probabilities())
+    layers = asap_schedule(num_qubits, gates).grouped(gates)
+    drop = tuple(1 + q for q in range(num_qubits) if q not in measured)
+    kept = sorted(measured)
+
+    total = np.zeros((2,) * len(measured))
+    for start in range(0, trajectories, batch):
+        size = min(batch, trajectories - start)
+        state = np.zeros((size,) + (2,) * num_qubits, dtype=np.complex128)
+        state[(slice(None),) + (0,) * num_qubits] = 1.0
+        for layer in layers:
+            apply_layer(state, layer, batch_axes=1)
+            touched = [q for gate in layer for q in gate[1:]]
+            codes = np.searchsorted(cumulative, rng.random((len(touched), size)), side="right")
+            _apply_paulis(state, touched, np.minimum(codes, _Y))
+
+        probs = np.abs(state) ** 2
+        probs = probs.sum(axis=(0,) + drop)
+        # Ejes en orden de qubit → orden de measured
+        total += probs.transpose([kept.index(q) for q in measured])
+
+    return _readout(total / trajectories, noise.readout).ravel()
+
+
+def trajectory_sample(kernel_func, kernel_args=(), shots=1000, noise=DEFAULT_NOISE,
+                      trajectories=1000, seed=None):
+    """Conteos con ruido del kernel y probabilidades estimadas por trayectorias"""
+    from recursos_circuito import kernel_circuit
+
+    num_qubits, gates, measured = kernel_circuit(kernel_func, kernel_args)
+    probs = trajectory_distribution(num_qubits, gates, measured, noise, trajectories,
+                                    seed=seed)
+    counts = np.random.default_rng(seed).multinomial(shots, probs / probs.sum())
+    width = len(measured)
+    result = {index_to_bits(i, width): int(counts[i]) for i in np.flatnonzero(counts)}
+    return SampleCounts(result, lambda bits: float(probs[int(bits, 2)]))
+
+
+def success_probability(num_qubits, gates, measured, noise=DEFAULT_NOISE,
+                        trajectories=2000, seed=0):
+    """Probabilidad con ruido de obtener un resultado que el circuito ideal da"""
+    ideal = trajectory_distribution(num_qubits, gates, measured, GateNoise(0, 0, 0),
+                                    trajectories=1)
+    noisy = trajectory_distribution(num_qubits, gates, measured, noise, trajectories,
+                                    seed=seed)
+    return float(noisy[ideal > 1e-12].sum())
+
+
+def cudaq_noise_model(noise, gates):
+    """NoiseModel de CUDA-Q equivalente a GateNoise para estas compuertas
+
+    Los canales de compuerta se registran por (nombre, controles); el de una
+    compuerta de k qubits es el producto tensorial del canal de un qubit. El
+    error de lectura no se incluye (se aplica sobre la distribución).
+    """
+    import cudaq
+
+    paulis = {_I: np.eye(2), _X: np.array([[0, 1], [1, 0]]),
+              _Z: np.diag([1, -1]), _Y: np.array([[0, -1j], [1j, 0]])}
+    probs = noise.pauli_probabilities()
+    single = [np.sqrt(probs[p]) * paulis[p] for p in paulis if probs[p] > 0]
+
+    model = cudaq.NoiseModel()
+    names = {"cz": "z", "cx": "x", "mcz": "z", "mcx": "x"}
+    registered = set()
+    for gate in gates:
+        key = (names.get(gate[0], gate[0]), len(gate) - 2)
+        if key in registered:
+            continue
+        registered.add(key)
+        operators = single
+        for _ in range(key[1]):
+            operators = [np.kron(a, b) for a in operators for b in single]
+        channel = cudaq.KrausChannel([op.astype(np.complex128) for op in operators])
+        model.add_all_qubit_channel(key[0], channel, num_controls=key[1])
+    return model
+
+
+def density_matrix_distribution(num_qubits, gates, measured, noise=DEFAULT_NOISE):
+    """Misma distribución que trajectory_distribution, con density-matrix-cpu"""
+    import cudaq
+
+    from circuito_ir import Circuit
+    from motor_exacto import state_probabilities
+
+    # set_noise no retiene el modelo: la referencia local lo mantiene vivo
+    model = cudaq_noise_model(noise, gates)
+    previous = cudaq.get_target().name
+    cudaq.set_target("density-matrix-cpu")
+    cudaq.set_noise(model)
+    try:
+        kernel = Circuit.from_gates(num_qubits, gates, measured=[]).to_kernel()
+        probs = state_probabilities(cudaq.get_state(kernel))
+    finally:
+        cudaq.unset_noise()
+        cudaq.set_target(previous)
+
+    drop = tuple(q for q in range(num_qubits) if q not in measured)
+    probs = probs.sum(axis=drop) if drop else probs
+    kept = sorted(measured)
+    probs = probs.transpose([kept.index(q) for q in measured])
+    return _readout(probs, noise.readout).ravel()
+
+
+if __name__ == "__main__":
+    from oraculos import bv_oracle, build_circuit, oracle_gates
+
+    print("\n" + "="*80)
+    print("MOTOR CON RUIDO: TRAYECTORIAS EN LOTES vs density-matrix-cpu")
+    print("="*80)
+
+    noise = GateNoise(depolarizing=0.01, dephasing=0.005, readout=0.02)
+    print(f"\n{noise}")
+
+    # Con y sin auxiliar: probabilidad de obtener la respuesta correcta
+    print("\n┌──────────────────────────────┬──────────────┬──────────────┐")
+    print("│ Circuito                     │ Sin auxiliar │ Con auxiliar │")
+    print("├──────────────────────────────┼──────────────┼──────────────┤")
+    for algorithm, n, oracle in [("dj", 2, "balanced_x0"), ("bv", 3, "101"),
+                                 ("bv", 2, "11"), ("bv", 4, "1111"), ("bv", 8, "11111111")]:
+        success = [success_probability(*build_circuit(n, oracle_gates(algorithm, n, oracle,
+                                                                      ancilla), ancilla),
+                                       noise)
+                   for ancilla in (False, True)]
+        label = f"{algorithm} n={n} {oracle}"
+        print(f"│ {label:<28} │ {success[0]:^12.2%} │ {success[1]:^12.2%} │")
+    print("└──────────────────────────────┴──────────────┴──────────────┘")
+
+    # Trayectorias frente a matriz densidad, BV con oráculo de fase
+    # density-matrix-cpu crece ~16× cada 2 qubits (unos 70 s a n=10 en un núcleo)
+    ram = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    density_max_qubits = 10
+    trajectories = 1000
+    rng = np.random.default_rng(3)
+    print(f"\n{trajectories} trayectorias; density-matrix-cpu hasta n={density_max_qubits} "
+          f"y si 2·16·4^n B caben en la mitad de la RAM ({ram / 2**31:.1f} GiB)")
+    print("┌──────┬───────────────┬──────────────┬───────────────┬──────────────┬──────────┐")
+    print("│  n   │ Trayect. (s)  │ Lote (MiB)   │ Densidad (s)  │ ρ (MiB)      │ TVD      │")
+    print("├──────┼───────────────┼──────────────┼───────────────┼──────────────┼──────────┤")
+    for n in range(4, 15, 2):
+        secret = "".join(rng.choice(["0", "1"], n))
+        circuit = build_circuit(n, bv_oracle(secret))
+        batch = max(1, min(trajectories, BATCH_BYTES // (16 * 2**n)))
+
+        start = time.perf_counter()
+        estimate = trajectory_distribution(*circuit, noise, trajectories, seed=1)
+        sampled = time.perf_counter() - start
+
+        density_bytes = 16 * 4**n
+        if 2 * density_bytes > ram / 2:
+            dense, distance = f"{'sin memoria':^13}", f"{'—':^8}"
+        elif n > density_max_qubits:
+            dense, distance = f"{'omitida':^13}", f"{'—':^8}"
+        else:
+            start = time.perf_counter()
+            exact = density_matrix_distribution(*circuit, noise)
+            dense = f"{time.perf_counter() - start:^13.2f}"
+            distance = f"{0.5 * np.abs(exact - estimate).sum():^8.4f}"
+        print(f"│ {n:^4} │ {sampled:^13.2f} │ {batch * 16 * 2**n / 2**20:^12.1f} │ "
+              f"{dense} │ {density_bytes / 2**20:^12.1f} │ {distance} │")
+    print("└──────┴───────────────┴──────────────┴───────────────┴──────────────┴──────────┘")
+    print("  TVD: distancia de variación total entre ambas distribuciones")
+    print("="*80 + "\n")
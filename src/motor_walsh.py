@@ -0,0 +1,197 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from oraculos import DJ3_ORACLES, all_secrets, bv_oracle
+
+# ============================================================================
+# MOTOR WALSH-HADAMARD PARA ORÁCULOS DADOS POR TABLA DE VERDAD
+# ============================================================================
+#
+# Con un oráculo de fase, Deutsch-Jozsa y Bernstein-Vazirani preparan
+#
+#     H^n · (-1)^f(x) · H^n |0⟩ = Σ_y  Ŝ(y)/2^n |y⟩,
+#     Ŝ(y) = Σ_x (-1)^(f(x) ⊕ x·y)
+#
+# es decir, la transformada de Walsh-Hadamard de (-1)^f. Se calcula con una
+# FWHT en el sitio, O(n·2^n), sin simular compuerta por compuerta.
+#
+# Convención: el índice x de la tabla de verdad es int(cadena, 2) con la
+# cadena de bits en el orden de cudaq.sample (carácter i = qubit i), es decir,
+# el qubit 0 es el bit más significativo.
+# ============================================================================
+
+# Elementos procesados por bloque: acota el temporal de cada mariposa
+_BLOCK = 1 << 22
+
+# Espectros recientes, indexados por el hash de la tabla de verdad
+_SPECTRUM_CACHE = OrderedDict()
+_SPECTRUM_CACHE_BYTES = 1 << 30
+
+
+def fwht_inplace(values):
+    """Transformada rápida de Walsh-Hadamard (sin normalizar), en el sitio"""
+
+    size = values.size
+    if size & (size - 1):
+        raise ValueError(f"La longitud debe ser potencia de 2 (recibido {size})")
+
+    h = 1
+    while h < size:
+        view = values.reshape(-1, 2, h)
+        rows = max(1, _BLOCK // h)
+        cols = min(h, _BLOCK)
+        for r in range(0, view.shape[0], rows):
+            for c in range(0, h, cols):
+                top = view[r:r + rows, 0, c:c + cols]
+                bottom = view[r:r + rows, 1, c:c + cols]
+                saved = top.copy()
+                top += bottom
+                np.subtract(saved, bottom, out=bottom)
+        h *= 2
+    return values
+
+
+def _table_key(truth_table):
+    table = np.ascontiguousarray(truth_table, dtype=bool)
+    return table.size, hashlib.sha1(np.packbits(table).tobytes()).hexdigest()
+
+
+def walsh_spectrum(truth_table):
+    """Espectro Ŝ(y) de (-1)^f, memorizado por oráculo
+
+    truth_table: array bool/uint8 de longitud 2^n.
+    """
+    truth_table = np.asarray(truth_table)
+    key = _table_key(truth_table)
+    if key in _SPECTRUM_CACHE:
+        _SPECTRUM_CACHE.move_to_end(key)
+        return _SPECTRUM_CACHE[key]
+
+    size = truth_table.size
+    # |Ŝ(y)| ≤ 2^n: int32 alcanza hasta n = 30
+    dtype = np.int32 if size <= 2**30 else np.int64
+    spectrum = np.ones(size, dtype=dtype)
+    spectrum[truth_table.astype(bool).ravel()] = -1
+    fwht_inplace(spectrum)
+    spectrum.flags.writeable = False
+
+    _SPECTRUM_CACHE[key] = spectrum
+    while sum(s.nbytes for s in _SPECTRUM_CACHE.values()) > _SPECTRUM_CACHE_BYTES \
+            and len(_SPECTRUM_CACHE) > 1:
+        _SPECTRUM_CACHE.popitem(last=False)
+    return spectrum
+
+
+def clear_spectrum_cache():
+    _SPECTRUM_CACHE.clear()
+
+
+def walsh_probabilities(truth_table, dtype=np.float64):
+    """Distribución de salida completa: P(y) = (Ŝ(y) / 2^n)^2"""
+    spectrum = walsh_spectrum(truth_table)
+    amplitudes = spectrum.astype(dtype) / spectrum.size
+    return np.square(amplitudes, out=amplitudes)
+
+
+def dj_is_constant(truth_table):
+    """Deutsch-Jozsa: constante ⇔ P(0...0) = 1 ⇔ |Ŝ(0)| = 2^n"""
+    spectrum = walsh_spectrum(truth_table)
+    return abs(int(spectrum[0])) == spectrum.size
+
+
+def bv_secret(truth_table):
+    """Bernstein-Vazirani: cadena s con |Ŝ(s)| máximo (exacta si f es lineal)"""
+    spectrum = walsh_spectrum(truth_table)
+    n = spectrum.size.bit_length() - 1
+    index = int(np.argmax(np.abs(spectrum)))
+    return format(index, f"0{n}b")
+
+
+def walsh_sample(truth_table, shots=1000, seed=None):
+    """Conteos muestreados de la distribución exacta (solo soporte no nulo)"""
+    spectrum = walsh_spectrum(truth_table)
+    n = spectrum.size.bit_length() - 1
+    support = np.flatnonzero(spectrum)
+    weights = np.square(spectrum[support].astype(np.float64))
+    weights /= weights.sum()
+    rng = np.random.default_rng(seed)
+    outcomes, counts = np.unique(rng.choice(support, size=shots, p=weights),
+                                 return_counts=True)
+    return {format(int(y), f"0{n}b"): int(c) for y, c in zip(outcomes, counts)}
+
+
+def truth_table_from_gates(n, gates):
+    """Tabla de verdad de la fase aplicada por un oráculo {Z, CZ, MCZ}"""
+    x = np.arange(2**n, dtype=np.int64)
+    table = np.zeros(2**n, dtype=bool)
+    for gate in gates:
+        name, qubits = gate[0], gate[1:]
+        if name not in ("z", "cz", "mcz"):
+            raise ValueError(f"Compuerta {gate!r} no es un oráculo de fase")
+        term = np.ones(2**n, dtype=bool)
+        for q in qubits:
+            term &= ((x >> (n - 1 - q)) & 1).astype(bool)
+        table ^= term
+    return table
+
+
+# ============================================================================
+# VERIFICACIÓN CONTRA cudaq.sample
+# ============================================================================
+
+def cross_check_cudaq(shots=4000, tolerance=0.05):
+    """Compara la FWHT con cudaq.sample sobre los kernels dj3_* y bv3_*"""
+    import cudaq
+    import algoritmos_3qubits
+
+    cases = [(f"dj3_{name}", gates) for name, gates in DJ3_ORACLES.items()]
+    cases += [(f"bv3_s{secret}", bv_oracle(secret)) for secret in all_secrets(3)]
+
+    all_ok = True
+    for kernel_name, gates in cases:
+        kernel = getattr(algoritmos_3qubits, kernel_name)
+        result = cudaq.sample(kernel, shots_count=shots)
+        probabilities = walsh_probabilities(truth_table_from_gates(3, gates))
+        distance = 0.5 * sum(
+            abs(result.count(format(y, "03b")) / shots - probabilities[y])
+            for y in range(8)
+        )
+        ok = distance < tolerance
+        all_ok &= ok
+        print(f"{kernel_name:<24} distancia TV = {distance:.4f} {'✓' if ok else '✗'}")
+    return all_ok
+
+
+if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("MOTOR WALSH-HADAMARD: DJ Y BV DESDE LA TABLA DE VERDAD")
+    print("="*80 + "\n")
+
+    cross_check_cudaq()
+
+    print("\n┌───────────┬──────────────┬──────────────┬──────────────┐")
+    print("│ n qubits  │ FWHT (s)     │ Caché (ms)   │ DJ / BV      │")
+    print("├───────────┼──────────────┼──────────────┼──────────────┤")
+    rng = np.random.default_rng(3)
+    for n in [10, 16, 20, 24]:
+        secret = format(int(rng.integers(0, 2**n)), f"0{n}b")
+        table = truth_table_from_gates(n, bv_oracle(secret))
+
+        start = time.perf_counter()
+        walsh_spectrum(table)
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        constant = dj_is_constant(table)
+        recovered = bv_secret(table)
+        cached = time.perf_counter() - start
+
+        verdict = f"{'C' if constant else 'B'} / {'✓' if recovered == secret else '✗'}"
+        print(f"│ {n:^9} │ {first:^12.3f} │ {cached*1e3:^12.2f} │ {verdict:^12} │")
+    print("└───────────┴──────────────┴──────────────┴──────────────┘")
+
+    print("\n💡 n = 30 necesita ~4 GB (espectro int32) y se procesa por bloques.")
+    print("="*80 + "\n")
@@ -0,0 +1,110 @@
+import time
+
+import cudaq
+
+from ejecucion import sample_kernel
+from oraculo_parametrico import phase_oracle_kernel
+from oraculos import DJ3_ORACLES, all_secrets, bv_oracle, phase_oracle_args
+
+# ============================================================================
+# MUESTREO POR LOTES CON BROADCAST DE ARGUMENTOS
+# ============================================================================
+#
+# cudaq.sample acepta, para cada parámetro del kernel, una lista de valores
+# (un valor por circuito) y devuelve una lista de SampleResult. Con el kernel
+# paramétrico un lote completo de oráculos se despacha en una sola llamada,
+# lo que amortiza el coste fijo de despacho que domina en circuitos de 2-3
+# qubits.
+#
+# Un oráculo del lote se especifica como (n, gates), con gates en el formato
+# de oraculos.py.
+# ============================================================================
+
+def sample_batch(oracle_specs, shots=1000, engine="cudaq"):
+    """Ejecuta una lista de oráculos (n, gates) y devuelve un resultado por oráculo"""
+
+    oracle_specs = list(oracle_specs)
+    if not oracle_specs:
+        return []
+
+    arguments = [phase_oracle_args(n, gates) for n, gates in oracle_specs]
+
+    if engine != "cudaq":
+        return [sample_kernel(phase_oracle_kernel, args, shots, engine)
+                for args in arguments]
+
+    # Una columna por parámetro del kernel: [n...], [z_qubits...], ...
+    columns = [list(column) for column in zip(*arguments)]
+    return cudaq.sample(phase_oracle_kernel, *columns, shots_count=shots)
+
+
+def dj_verdicts(results, shots=1000, threshold=0.9):
+    """Conclusión DJ por resultado: True si la función es constante"""
+    verdicts = []
+    for result in results:
+        width = len(next(iter(result)))
+        verdicts.append(result.count("0" * width) / shots > threshold)
+    return verdicts
+
+
+def bv_secrets(results):
+    """Cadena secreta recuperada por resultado (estado más frecuente)"""
+    return [result.most_probable() for result in results]
+
+
+# ============================================================================
+# BENCHMARK: LOTE vs BUCLE SERIAL
+# ============================================================================
+
+def benchmark_batch_throughput(oracle_specs, shots=1000, repeats=5):
+    """Circuitos/segundo del bucle serial y del lote con broadcast"""
+
+    oracle_specs = list(oracle_specs)
+    arguments = [phase_oracle_args(n, gates) for n, gates in oracle_specs]
+
+    # Calentamiento: compilación JIT fuera de la medición
+    cudaq.sample(phase_oracle_kernel, *arguments[0], shots_count=shots)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for args in arguments:
+            cudaq.sample(phase_oracle_kernel, *args, shots_count=shots)
+    serial = len(arguments) * repeats / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        sample_batch(oracle_specs, shots)
+    batched = len(arguments) * repeats / (time.perf_counter() - start)
+
+    return serial, batched
+
+
+if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("MUESTREO POR LOTES: UNA LLAMADA A cudaq.sample PARA VARIOS ORÁCULOS")
+    print("="*80)
+
+    specs_dj = [(3, gates) for gates in DJ3_ORACLES.values()]
+    specs_bv = [(3, bv_oracle(secret)) for secret in all_secrets(3)]
+
+    results = sample_batch(specs_dj + specs_bv)
+    verdicts = dj_verdicts(results[:len(specs_dj)])
+    secrets = bv_secrets(results[len(specs_dj):])
+
+    print()
+    for name, constant in zip(DJ3_ORACLES, verdicts):
+        print(f"DJ3 {name:<20} → {'CONSTANTE' if constant else 'BALANCEADA'}")
+    for expected, measured in zip(all_secrets(3), secrets):
+        print(f"BV3 s={expected} → {measured} {'✓' if expected == measured else '✗'}")
+
+    print("\n┌──────────────────────────┬─────────────────┬─────────────────┬─────────┐")
+    print("│ Lote                     │ Serial (circ/s) │ Lote (circ/s)   │ Mejora  │")
+    print("├──────────────────────────┼─────────────────┼─────────────────┼─────────┤")
+    for label, specs in [("DJ3 + BV3 (15 oráculos)", specs_dj + specs_bv),
+                         ("BV n=6 (64 secretos)",
+                          [(6, bv_oracle(s)) for s in all_secrets(6)])]:
+        serial, batched = benchmark_batch_throughput(specs)
+        print(f"│ {label:<24} │ {serial:^15.1f} │ {batched:^15.1f} │ "
+              f"{batched / serial:^6.2f}x │")
+    print("└──────────────────────────┴─────────────────┴─────────────────┴─────────┘")
+    print("="*80 + "\n")
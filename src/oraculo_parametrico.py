@@ -0,0 +1,88 @@
+import time
+
+import cudaq
+
+from oraculos import DJ3_ORACLES, all_secrets, bv_oracle, phase_oracle_args
+
+# ============================================================================
+# KERNEL PARAMÉTRICO DE ORÁCULO DE FASE (n QUBITS, SIN AUXILIAR)
+# ============================================================================
+#
+# Un único kernel para Deutsch-Jozsa y Bernstein-Vazirani: el número de
+# qubits y el oráculo llegan como argumentos de ejecución, así que el kernel
+# se compila una sola vez y se reutiliza para cada cadena secreta o función.
+# Los argumentos se obtienen con oraculos.phase_oracle_args().
+# ============================================================================
+
+@cudaq.kernel
+def phase_oracle_kernel(n: int, z_qubits: list[int], cz_controls: list[int],
+                        cz_targets: list[int]):
+    qubits = cudaq.qvector(n)
+
+    # Hadamard inicial
+    h(qubits)
+
+    # Oráculo: Z en cada término lineal, CZ en cada término cuadrático
+    for q in z_qubits:
+        z(qubits[q])
+    for i in range(len(cz_controls)):
+        cz(qubits[cz_controls[i]], qubits[cz_targets[i]])
+
+    # Hadamard final
+    h(qubits)
+
+    mz(qubits)
+
+
+# ============================================================================
+# BENCHMARK: LATENCIA POR LLAMADA
+# ============================================================================
+
+def benchmark_parametric_latency(n, shots=100, max_secrets=256):
+    """Mide la primera llamada (compilación) y la latencia de las siguientes"""
+
+    secrets = all_secrets(n) if n <= 8 else [
+        format((i * 2654435761) % 2**n, f"0{n}b") for i in range(max_secrets)
+    ]
+    secrets = secrets[:max_secrets]
+
+    start = time.perf_counter()
+    cudaq.sample(phase_oracle_kernel, *phase_oracle_args(n, bv_oracle(secrets[0])),
+                 shots_count=shots)
+    first_call = time.perf_counter() - start
+
+    latencies = []
+    for secret in secrets[1:]:
+        args = phase_oracle_args(n, bv_oracle(secret))
+        start = time.perf_counter()
+        cudaq.sample(phase_oracle_kernel, *args, shots_count=shots)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    median = latencies[len(latencies) // 2] if latencies else 0.0
+    return first_call, median, len(latencies)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("KERNEL PARAMÉTRICO: UNA COMPILACIÓN PARA TODOS LOS ORÁCULOS")
+    print("="*80)
+
+    print("\n┌───────────┬────────────────────┬─────────────────────┬──────────┐")
+    print("│ n qubits  │ 1ª llamada (ms)    │ Mediana/llamada (ms)│ Llamadas │")
+    print("├───────────┼────────────────────┼─────────────────────┼──────────┤")
+    for n in [2, 3, 5, 8, 10, 12]:
+        first_call, median, calls = benchmark_parametric_latency(n)
+        print(f"│ {n:^9} │ {first_call*1e3:^18.2f} │ {median*1e3:^19.3f} │ {calls:^8} │")
+    print("└───────────┴────────────────────┴─────────────────────┴──────────┘")
+
+    # Verificación con los oráculos de 3 qubits, reutilizando el mismo kernel
+    print()
+    for name, gates in DJ3_ORACLES.items():
+        result = cudaq.sample(phase_oracle_kernel, *phase_oracle_args(3, gates),
+                              shots_count=1000)
+        print(f"DJ3 {name:<20} → {result.most_probable()}")
+
+    print("\n💡 La primera llamada incluye la compilación JIT; las siguientes")
+    print("   reutilizan el mismo kernel sin importar la cadena secreta.")
+    print("="*80 + "\n")
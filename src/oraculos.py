@@ -0,0 +1,141 @@
+# ============================================================================
+# DESCRIPCIÓN DE ORÁCULOS DE FASE
+# ============================================================================
+#
+# Un oráculo se describe como una lista de compuertas, cada una como tupla
+# (nombre, qubit, ...):
+#
+#     [("z", 0), ("cz", 0, 1)]
+#
+# Esta descripción no depende de CUDA-Q: se traduce a los argumentos de
+# ejecución del kernel paramétrico (oraculo_parametrico.py), de modo que un
+# único kernel compilado sirve para cualquier cadena secreta o función.
+# ============================================================================
+
+
+# Oráculos Deutsch-Jozsa de 2 qubits (deutsch_jozsa_2qubits.py)
+DJ2_ORACLES = {
+    "constant_0": [],
+    "constant_1": [("z", 0), ("z", 1)],
+    "balanced_x0": [("z", 0)],
+    "balanced_x1": [("z", 1)],
+    "balanced_xor": [("cz", 0, 1)],
+    "balanced_xnor": [("z", 0), ("z", 1), ("cz", 0, 1)],
+}
+
+# Oráculos Deutsch-Jozsa de 3 qubits (algoritmos_3qubits.py)
+DJ3_ORACLES = {
+    "constant_0": [],
+    "constant_1": [("z", 0), ("z", 1), ("z", 2)],
+    "balanced_x0": [("z", 0)],
+    "balanced_x1": [("z", 1)],
+    "balanced_x2": [("z", 2)],
+    "balanced_xor_01": [("cz", 0, 1)],
+    "balanced_majority": [("cz", 0, 1), ("cz", 1, 2), ("cz", 0, 2)],
+}
+
+
+# Oráculos Deutsch-Jozsa con qubit auxiliar (algoritmos_con_auxiliar.py):
+# 2 qubits de trabajo y el auxiliar en el índice 2, preparado en |−⟩
+DJ_AUX_ORACLES = {
+    "constant_0": [],
+    "constant_1": [("x", 2)],
+    "balanced_x0": [("cx", 0, 2)],
+    "balanced_x1": [("cx", 1, 2)],
+    "balanced_xor": [("cx", 0, 2), ("cx", 1, 2)],
+    "balanced_xnor": [("cx", 0, 2), ("cx", 1, 2), ("x", 2)],
+}
+
+# Tablas de oráculos DJ con nombre, por (n, auxiliar)
+DJ_ORACLES = {
+    (2, False): DJ2_ORACLES,
+    (3, False): DJ3_ORACLES,
+    (2, True): DJ_AUX_ORACLES,
+}
+
+
+def bv_oracle(secret_string):
+    """Oráculo de fase para Bernstein-Vazirani: Z en cada bit s_i = 1"""
+    return [("z", i) for i, bit in enumerate(secret_string) if bit == "1"]
+
+
+def bv_oracle_aux(secret_string):
+    """Oráculo con auxiliar (índice n) para Bernstein-Vazirani: CX desde cada s_i = 1"""
+    n = len(secret_string)
+    return [("cx", i, n) for i, bit in enumerate(secret_string) if bit == "1"]
+
+
+def oracle_gates(algorithm, n, oracle, ancilla=False):
+    """Compuertas del oráculo para ("dj" | "bv", n, oráculo, auxiliar)
+
+    oracle es el nombre de un oráculo DJ de las tablas, la cadena secreta de
+    BV, o directamente una secuencia de compuertas.
+    """
+    if not isinstance(oracle, str):
+        return [tuple(gate) for gate in oracle]
+    if algorithm == "bv":
+        if len(oracle) != n or set(oracle) - {"0", "1"}:
+            raise ValueError(f"Cadena secreta {oracle!r} inválida para n={n}")
+        return bv_oracle_aux(oracle) if ancilla else bv_oracle(oracle)
+    if algorithm == "dj":
+        table = DJ_ORACLES.get((n, ancilla))
+        if table is None or oracle not in table:
+            raise ValueError(
+                f"No hay oráculo DJ {oracle!r} para n={n} "
+                f"({'con' if ancilla else 'sin'} auxiliar)"
+            )
+        return list(table[oracle])
+    raise ValueError(f"Algoritmo desconocido: {algorithm!r} (opciones: 'dj', 'bv')")
+
+
+def build_circuit(n, gates, ancilla=False):
+    """Circuito completo del algoritmo alrededor de un oráculo
+
+    Devuelve (num_qubits, compuertas, qubits_medidos). Sin auxiliar:
+    H^n · oráculo · H^n y medición de todos los qubits. Con auxiliar (índice
+    n): X y H en el auxiliar para prepararlo en |−⟩, H en los de trabajo,
+    oráculo, H en los de trabajo y medición solo de los de trabajo, igual que
+    los kernels de algoritmos_con_auxiliar.py.
+    """
+    work = list(range(n))
+    circuit = []
+    if ancilla:
+        circuit.append(("x", n))
+        circuit += [("h", q) for q in work + [n]]
+    else:
+        circuit += [("h", q) for q in work]
+    circuit += list(gates)
+    circuit += [("h", q) for q in work]
+    return n + 1 if ancilla else n, circuit, work
+
+
+def all_secrets(n):
+    """Todas las cadenas secretas de n bits, en orden lexicográfico"""
+    return [format(value, f"0{n}b") for value in range(2**n)]
+
+
+def phase_oracle_args(n, gates):
+    """Traduce un oráculo a los argumentos del kernel paramétrico
+
+    Devuelve (n, z_qubits, cz_controls, cz_targets).
+    """
+    z_qubits = []
+    cz_controls = []
+    cz_targets = []
+
+    for gate in gates:
+        name, qubits = gate[0], gate[1:]
+        if name == "z" and len(qubits) == 1:
+            z_qubits.append(qubits[0])
+        elif name == "cz" and len(qubits) == 2:
+            cz_controls.append(qubits[0])
+            cz_targets.append(qubits[1])
+        else:
+            raise ValueError(
+                f"Compuerta {gate!r} no soportada por el oráculo de fase "
+                "(solo 'z' y 'cz')"
+            )
+        if any(q < 0 or q >= n for q in qubits):
+            raise ValueError(f"Compuerta {gate!r} fuera de rango para n={n}")
+
+    return n, z_qubits, cz_controls, cz_targets
@@ -0,0 +1,179 @@
+import time
+
+import numpy as np
+
+# ============================================================================
+# PLANIFICADOR ASAP POR CAPAS Y SIMULACIÓN CON CAPAS FUSIONADAS
+# ============================================================================
+#
+# Cada compuerta va a la primera capa posterior a la última que tocó alguno
+# de sus qubits (as soon as possible). Con un array frontera por qubit es un
+# solo recorrido, O(compuertas):
+#
+#   capa = max(frontera[q] for q in qubits);  frontera[qubits] = capa + 1
+#
+# Una barrera lleva la frontera de todos los qubits a su máximo y no ocupa
+# capa. La profundidad es el número de capas y el paralelismo de una capa es
+# cuántas compuertas caben en ella.
+#
+# Dentro de una capa las compuertas actúan sobre qubits distintos y conmutan,
+# así que la capa se aplica de una vez sobre el tensor de estado (un eje por
+# qubit), en sitio y sin reordenar ejes:
+#
+#   z, cz, mcz     → cambio de signo del corte con los qubits a 1
+#   x, cx, mcx     → intercambio de los cortes objetivo = 0 / objetivo = 1
+#   h              → mariposa sin normalizar; todas las H de la capa se
+#                    normalizan juntas con una única multiplicación
+#
+# motor_factorizado.py simula cada componente así, capa a capa.
+# ============================================================================
+
+_DIAGONAL = frozenset({"z", "cz", "mcz"})
+_PERMUTATION = frozenset({"x", "cx", "mcx"})
+
+
+class Schedule:
+    """Capa de cada operación (-1 en las barreras), profundidad y paralelismo"""
+
+    def __init__(self, layers, boundaries, depth):
+        self.layers = layers            # capa de cada operación
+        self.boundaries = boundaries    # capa antes de la que cae cada barrera
+        self.depth = depth
+
+    @property
+    def parallelism(self):
+        """Compuertas por capa"""
+        return np.bincount(self.layers[self.layers >= 0], minlength=self.depth)
+
+    def grouped(self, operations):
+        """Operaciones (sin barreras) agrupadas por capa, en orden de capa"""
+        layers = [[] for _ in range(self.depth)]
+        for layer, operation in zip(self.layers, operations):
+            if layer >= 0:
+                layers[layer].append(operation)
+        return layers
+
+
+def asap_schedule(num_qubits, operations):
+    """Planifica tuplas (nombre, qubit, ...); "barrier" sin qubits sincroniza todos"""
+    frontier = [0] * num_qubits
+    layers = np.full(len(operations), -1, dtype=np.int64)
+    boundaries = {}
+    depth = 0
+    for i, operation in enumerate(operations):
+        name, qubits = operation[0], operation[1:]
+        if name == "barrier":
+            frontier = [depth] * num_qubits
+            boundaries[i] = depth
+            continue
+        layer = max(frontier[q] for q in qubits)
+        for q in qubits:
+            frontier[q] = layer + 1
+        layers[i] = layer
+        depth = max(depth, layer + 1)
+    return Schedule(layers, boundaries, depth)
+
+
+def apply_layer(state, layer, batch_axes=0):
+    """Aplica en sitio una capa (compuertas sobre qubits distintos) al tensor de estado
+
+    state tiene un eje de tamaño 2 por qubit, precedido de batch_axes ejes de
+    lote (p. ej. trayectorias de motor_ruido.py). Cada compuerta toca solo la
+    porción del tensor que cambia (vistas por cortes) y las H de la capa se
+    normalizan juntas al final, en una sola pasada.
+    """
+    hadamards = 0
+    for gate in layer:
+        name, qubits = gate[0], gate[1:]
+        index = [slice(None)] * state.ndim
+        for c in qubits[:-1]:
+            index[batch_axes + c] = 1
+        zero, one = list(index), list(index)
+        zero[batch_axes + qubits[-1]], one[batch_axes + qubits[-1]] = 0, 1
+        # Con ... el corte es siempre una vista (también si fija todos los ejes)
+        zero, one = state[(*zero, ...)], state[(*one, ...)]
+        if name in _DIAGONAL:
+            one *= -1
+        elif name in _PERMUTATION:
+            previous = zero.copy()
+            zero[...] = one
+            one[...] = previous
+        elif name == "h":
+            # Mariposa sin normalizar
+            previous = zero.copy()
+            zero += one
+            np.subtract(previous, one, out=one)
+            hadamards += 1
+        else:
+            raise ValueError(f"Compuerta {gate!r} no soportada por la simulación por capas")
+    if hadamards:
+        state *= np.sqrt(0.5) ** hadamards
+    return state
+
+
+def layered_statevector(num_qubits, gates, fused=True):
+    """Tensor de estado (un eje por qubit); con fused=False cada compuerta es una capa"""
+    state = np.zeros((2,) * num_qubits, dtype=np.complex128)
+    state[(0,) * num_qubits] = 1.0
+    layers = (asap_schedule(num_qubits, gates).grouped(gates) if fused
+              else [[gate] for gate in gates])
+    for layer in layers:
+        apply_layer(state, layer)
+    return state
+
+
+if __name__ == "__main__":
+    from circuito_ir import Circuit
+    from motor_exacto import exact_probabilities
+    from recursos_circuito import circuit_resources
+    from registro_kernels import get_kernel
+
+    print("\n" + "="*80)
+    print("PLANIFICADOR ASAP: PROFUNDIDAD, PARALELISMO Y CAPAS FUSIONADAS")
+    print("="*80)
+
+    # Profundidad y paralelismo de los circuitos del proyecto
+    print("\n┌──────────────────────────────┬──────────────┬────────────────────────┐")
+    print("│ Circuito                     │ Profundidad  │ Compuertas por capa    │")
+    print("├──────────────────────────────┼──────────────┼────────────────────────┤")
+    for key in [("dj", 3, "balanced_majority", False), ("bv", 8, "10110111", False),
+                ("bv", 8, "10110111", True)]:
+        circuit = Circuit.for_algorithm(*key, barriers=False)
+        schedule = circuit.schedule()
+        gates = circuit.to_gates()
+        assert schedule.depth == circuit_resources(gates, circuit.num_qubits)["depth"]
+        label = f"{key[0]} n={key[1]} {'con' if key[3] else 'sin'} auxiliar"
+        print(f"│ {label:<28} │ {schedule.depth:^12} │ "
+              f"{str(schedule.parallelism.tolist())[:22]:<22} │")
+    print("└──────────────────────────────┴──────────────┴────────────────────────┘")
+
+    # Las capas fusionadas dan el mismo estado que cudaq.get_state
+    for key in [("dj", 3, "balanced_majority", False), ("dj", 2, "balanced_xnor", True),
+                ("bv", 5, "10110", True)]:
+        circuit = Circuit.for_algorithm(*key)
+        probs, width = exact_probabilities(get_kernel(*key))
+        fused = np.abs(layered_statevector(circuit.num_qubits, circuit.to_gates())) ** 2
+        fused = fused.ravel()
+        assert np.allclose(fused, np.ravel(probs), atol=1e-9), key
+    print("\n✓ Capas fusionadas = vector de estado de CUDA-Q")
+
+    # Capas fusionadas frente a compuerta a compuerta
+    rng = np.random.default_rng(1)
+    n = 20
+    gates = [("h", q) for q in range(n)]
+    for _ in range(300):
+        kind = str(rng.choice(["z", "x", "h", "cz", "cx"]))
+        qubits = rng.choice(n, size=1 if kind in ("z", "x", "h") else 2, replace=False)
+        gates.append((kind, *map(int, qubits)))
+    schedule = asap_schedule(n, gates)
+    for fused in (False, True):
+        start = time.perf_counter()
+        state = layered_statevector(n, gates, fused)
+        elapsed = time.perf_counter() - start
+        passes = schedule.depth if fused else len(gates)
+        print(f"\n{'Fusionado   ' if fused else 'Por compuerta'} (n={n}, {len(gates)} compuertas): "
+              f"{passes} capas, {elapsed:.2f} s")
+        if not fused:
+            reference = state
+    assert np.allclose(state, reference)
+    print("="*80 + "\n")
@@ -0,0 +1,168 @@
+import re
+from collections import Counter
+
+from planificador_capas import asap_schedule
+
+# ============================================================================
+# MEDICIÓN DE RECURSOS: COMPUERTAS, QUBITS Y PROFUNDIDAD
+# ============================================================================
+#
+# En lugar de números escritos a mano, los recursos se miden sobre el IR
+# (Quake) que CUDA-Q genera para cada kernel. Los kernels del registro y los
+# kernels decorados sin bucles son secuencias lineales de operaciones:
+#
+#   %1 = quake.extract_ref %0[2]        → %1 es el qubit 2
+#   quake.h %1                          → H sobre el qubit 2
+#   quake.x [%2] %1                     → CX con control 0… y objetivo 2
+#   quake.rz (%cst) %1                  → RZ sobre el qubit 2 (sin el ángulo)
+#   quake.mz %0                         → medición del registro completo
+#
+# De la traza se obtienen las compuertas por tipo, las de dos qubits, el
+# número de qubits y la profundidad del camino crítico (cada compuerta se
+# coloca una capa después de la última que tocó alguno de sus qubits; las
+# mediciones no cuentan para la profundidad).
+# ============================================================================
+
+_ALLOCA = re.compile(r"(%\w+) = quake\.alloca !quake\.veq<(\d+)>")
+_EXTRACT = re.compile(r"(%\w+) = quake\.extract_ref (%\w+)\[(\d+)\]")
+_OPERATION = re.compile(r"quake\.(\w+) (?:\([^)]*\) )?(?:\[([^\]]*)\] )?(%\w+(?:, %\w+)*) :")
+
+# Nombres en las etiquetas de las figuras y tablas
+GATE_LABELS = {"x": "X", "h": "H", "z": "Z", "cz": "CZ", "cx": "CNOT",
+               "mcz": "MCZ", "mcx": "MCX"}
+
+
+def trace_kernel(kernel_func):
+    """Operaciones del kernel como tuplas (nombre, qubit, ...)
+
+    Las compuertas controladas se nombran cz/cx (un control) o mcz/mcx
+    (varios), con los controles primero, igual que en oraculos.py. Las
+    mediciones aparecen como ("mz", qubit).
+    """
+    ir = str(kernel_func)
+    if "cc.loop" in ir or "cc.if" in ir:
+        raise ValueError("El kernel tiene control de flujo: solo se pueden trazar "
+                         "kernels lineales (por ejemplo los del registro)")
+
+    registers = {}
+    qubits = {}
+    operations = []
+    for line in ir.splitlines():
+        line = line.strip()
+        if match := _ALLOCA.match(line):
+            offset = sum(registers.values())
+            registers[match[1]] = int(match[2])
+            qubits[match[1]] = list(range(offset, offset + int(match[2])))
+        elif match := _EXTRACT.match(line):
+            qubits[match[1]] = [qubits[match[2]][int(match[3])]]
+        elif (match := _OPERATION.search(line)) and match[1] not in ("alloca", "extract_ref"):
+            name = match[1]
+            controls = [q for ref in (match[2] or "").split(", ") if ref
+                        for q in qubits[ref]]
+            targets = [q for ref in match[3].split(", ") for q in qubits[ref]]
+            if name == "mz":
+                operations += [("mz", q) for q in targets]
+            elif controls:
+                prefix = "c" if len(controls) == 1 else "mc"
+                operations.append((prefix + name, *controls, *targets))
+            else:
+                operations += [(name, q) for q in targets]
+    return operations, sum(registers.values())
+
+
+def kernel_circuit(kernel_func, kernel_args=()):
+    """(num_qubits, compuertas, medidos) de un kernel lineal o del paramétrico"""
+    from oraculo_parametrico import phase_oracle_kernel
+    from oraculos import build_circuit
+
+    if kernel_func is phase_oracle_kernel:
+        n, z_qubits, cz_controls, cz_targets = kernel_args
+        oracle = [("z", q) for q in z_qubits]
+        oracle += [("cz", c, t) for c, t in zip(cz_controls, cz_targets)]
+        return build_circuit(n, oracle)
+
+    operations, num_qubits = trace_kernel(kernel_func)
+    gates = [op for op in operations if op[0] != "mz"]
+    measured = [op[1] for op in operations if op[0] == "mz"]
+    return num_qubits, gates, measured
+
+
+def circuit_resources(operations, num_qubits):
+    """Recursos de una traza: compuertas por tipo, 2 qubits, qubits y profundidad
+
+    La profundidad es la del planificador ASAP (planificador_capas), sin
+    contar las medidas.
+    """
+    unitary = [operation for operation in operations if operation[0] != "mz"]
+    gates = Counter(operation[0] for operation in unitary if operation[0] != "barrier")
+    two_qubit = sum(len(operation) == 3 for operation in unitary)
+
+    return {
+        "qubits": num_qubits,
+        "gates": dict(gates),
+        "total_gates": sum(gates.values()),
+        "two_qubit_gates": two_qubit,
+        "multi_qubit_gates": sum(count for name, count in gates.items()
+                                 if name.startswith("mc")),
+        "measurements": len(operations) - len(unitary),
+        "depth": asap_schedule(num_qubits, unitary).depth,
+    }
+
+
+def kernel_resources(kernel_func):
+    """Traza el kernel y devuelve sus recursos medidos"""
+    return circuit_resources(*trace_kernel(kernel_func))
+
+
+def resources_label(resources):
+    """'3 qubits | 1X + 5H + 2CNOT | Profundidad: 5'"""
+    order = list(GATE_LABELS)
+    gates = sorted(resources["gates"].items(),
+                   key=lambda item: (order.index(item[0]) if item[0] in order else len(order)))
+    gates = " + ".join(f"{count}{GATE_LABELS.get(name, name.upper())}" for name, count in gates)
+    return f"{resources['qubits']} qubits | {gates or 'sin compuertas'} | " \
+           f"Profundidad: {resources['depth']}"
+
+
+def resource_comparison(n_values, algorithm="bv", oracle=None):
+    """Recursos medidos con y sin auxiliar para cada n
+
+    Por defecto usa BV con la cadena secreta 11...1 (el oráculo más costoso).
+    Devuelve {n: {"phase": recursos, "ancilla": recursos}}.
+    """
+    from registro_kernels import get_kernel
+
+    table = {}
+    for n in n_values:
+        name = oracle if oracle is not None else "1" * n
+        table[n] = {
+            "phase": kernel_resources(get_kernel(algorithm, n, name)),
+            "ancilla": kernel_resources(get_kernel(algorithm, n, name, ancilla=True)),
+        }
+    return table
+
+
+if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("RECURSOS MEDIDOS: BV CON s = 11…1, CON vs SIN AUXILIAR")
+    print("="*80)
+
+    n_values = [2, 3, 4, 8, 16, 32, 64]
+    table = resource_comparison(n_values)
+
+    print("\n┌───────┬─────────────────────────┬─────────────────────────┐")
+    print("│       │ SIN auxiliar            │ CON auxiliar            │")
+    print("│ n     │ qubits  compuertas prof │ qubits  compuertas prof │")
+    print("├───────┼─────────────────────────┼─────────────────────────┤")
+    for n in n_values:
+        cells = [f"{r['qubits']:^6}  {r['total_gates']:^10} {r['depth']:^4}"
+                 for r in (table[n]["phase"], table[n]["ancilla"])]
+        print(f"│ {n:^5} │ {cells[0]:<23} │ {cells[1]:<23} │")
+    print("└───────┴─────────────────────────┴─────────────────────────┘")
+
+    for n in [2, 64]:
+        print(f"\nn = {n}:")
+        print(f"  SIN auxiliar: {resources_label(table[n]['phase'])}")
+        print(f"  CON auxiliar: {resources_label(table[n]['ancilla'])} "
+              f"({table[n]['ancilla']['two_qubit_gates']} de dos qubits)")
+    print("="*80 + "\n")
@@ -0,0 +1,112 @@
+import os
+import subprocess
+import sys
+
+from circuito_ir import Circuit
+
+# ============================================================================
+# REGISTRO PEREZOSO DE KERNELS
+# ============================================================================
+#
+# Los kernels se construyen con cudaq.make_kernel() solo cuando se piden por
+# primera vez y quedan memorizados por (algoritmo, n, oráculo, auxiliar).
+# Importar este módulo (o los módulos de algoritmos que lo usan) no importa
+# CUDA-Q, no compila nada y no imprime nada.
+# ============================================================================
+
+_KERNELS = {}
+
+def _build_kernel(algorithm, n, oracle, ancilla):
+    # Sin barreras: el kernel es idéntico al de las tuplas de oraculos.py
+    return Circuit.for_algorithm(algorithm, n, oracle, ancilla, barriers=False).to_kernel()
+
+
+def get_kernel(algorithm, n, oracle, ancilla=False):
+    """Kernel memorizado para ("dj" | "bv", n, oráculo, auxiliar)
+
+    oracle es un nombre de oraculos.DJ_ORACLES, una cadena secreta de BV o una
+    tupla de compuertas.
+    """
+    if not isinstance(oracle, str):
+        oracle = tuple(tuple(gate) for gate in oracle)
+    key = (algorithm, n, oracle, bool(ancilla))
+    if key not in _KERNELS:
+        _KERNELS[key] = _build_kernel(*key)
+    return _KERNELS[key]
+
+
+def lazy_kernels(names):
+    """__getattr__ de módulo que resuelve nombres de kernel vía el registro
+
+    names: {nombre_de_kernel: (algoritmo, n, oráculo, auxiliar)}
+    """
+    def module_getattr(name):
+        if name in names:
+            return get_kernel(*names[name])
+        raise AttributeError(name)
+    return module_getattr
+
+
+def clear_registry():
+    _KERNELS.clear()
+
+
+# ============================================================================
+# PRESUPUESTO DE TIEMPO DE IMPORTACIÓN
+# ============================================================================
+
+def check_import_budget(module, budget_seconds=0.5):
+    """Importa el módulo en un proceso limpio y verifica tiempo y efectos
+
+    Lanza RuntimeError si la importación supera el presupuesto, imprime algo
+    o carga CUDA-Q; si no, devuelve el tiempo de importación en segundos.
+    """
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "sys.stderr.write(f'{elapsed} {\"cudaq\" in sys.modules}')\n"
+    )
+    # Desde el directorio de los módulos, sea cual sea el del proceso que llama
+    process = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                             text=True, check=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+    elapsed, cudaq_loaded = process.stderr.split()[-2:]
+    elapsed = float(elapsed)
+
+    if process.stdout != "":
+        raise RuntimeError(f"{module} imprime al importarse: {process.stdout!r}")
+    if cudaq_loaded != "False":
+        raise RuntimeError(f"{module} importa cudaq al importarse")
+    if elapsed >= budget_seconds:
+        raise RuntimeError(f"{module} tarda {elapsed:.3f} s en importarse "
+                           f"(presupuesto {budget_seconds} s)")
+    return elapsed
+
+
+if __name__ == "__main__":
+    import time
+
+    print("\n" + "="*80)
+    print("REGISTRO PEREZOSO DE KERNELS")
+    print("="*80 + "\n")
+
+    for module in ["algoritmos_3qubits", "algoritmos_con_auxiliar"]:
+        elapsed = check_import_budget(module)
+        print(f"✓ import {module}: {elapsed*1e3:.1f} ms, sin salida ni cudaq")
+
+    import cudaq
+
+    for key in [("dj", 3, "balanced_x0", False), ("bv", 2, "11", True)]:
+        start = time.perf_counter()
+        kernel = get_kernel(*key)
+        result = cudaq.sample(kernel, shots_count=100)
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        get_kernel(*key)
+        cached = time.perf_counter() - start
+        print(f"{str(key):<34} 1ª vez {first*1e3:7.2f} ms | memorizado "
+              f"{cached*1e6:6.2f} µs | {result.most_probable()}")
+    print("="*80 + "\n")
@@ -0,0 +1,41 @@
+# ============================================================================
+# RESULTADOS COMPATIBLES CON cudaq.SampleResult
+# ============================================================================
+#
+# Los motores propios (analítico, etc.) devuelven un SampleCounts, que expone
+# la misma interfaz que usan las funciones run_*: items(), count(),
+# probability(), most_probable() y print().
+# ============================================================================
+
+class SampleCounts:
+    """Conteos de medición con probabilidades exactas opcionales"""
+
+    def __init__(self, counts, probability_fn=None):
+        self.counts = dict(counts)
+        self.shots = sum(self.counts.values())
+        self._probability_fn = probability_fn
+
+    def items(self):
+        return self.counts.items()
+
+    def count(self, bitstring):
+        return self.counts.get(bitstring, 0)
+
+    def probability(self, bitstring):
+        """Probabilidad exacta si el motor la conoce; si no, frecuencia"""
+        if self._probability_fn is not None:
+            return self._probability_fn(bitstring)
+        return self.count(bitstring) / self.shots if self.shots else 0.0
+
+    def most_probable(self):
+        return max(self.counts, key=self.counts.get)
+
+    def __iter__(self):
+        return iter(self.counts)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __str__(self):
+        body = " ".join(f"{bits}:{count}" for bits, count in sorted(self.counts.items()))
+        return "{ " + body + " }\n"
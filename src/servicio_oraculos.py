@@ -0,0 +1,376 @@
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from compilador_oraculos import compile_oracle
+from oraculos import oracle_gates
+
+# ============================================================================
+# SERVICIO LOCAL DE EVALUACIÓN DE ORÁCULOS (SOCKET UNIX, JSON LINES)
+# ============================================================================
+#
+# Un proceso de larga vida importa CUDA-Q una vez y mantiene los kernels
+# compilados (registro_kernels y el kernel paramétrico). Los clientes se
+# conectan a un socket Unix y envían una petición JSON por línea:
+#
+#   {"id": 1, "algorithm": "bv", "n": 8, "secret": "10110111", "shots": 1000}
+#   {"id": 2, "algorithm": "dj", "n": 2, "oracle": "balanced_x0", "ancilla": true}
+#   {"id": 3, "algorithm": "dj", "truth_table": [0, 1, 1, 0, 1, 0, 0, 1]}
+#
+# y reciben una línea {"id", "counts", "most_probable", "batch"} (o
+# {"id", "error"}) por petición, en el orden en que terminan.
+#
+# Micro-lotes: las peticiones se encolan; el lote se cierra a los `window`
+# segundos de la primera o al llegar a `max_batch`. Los oráculos de fase
+# {Z, CZ} con los mismos shots van en una sola llamada con broadcast
+# (muestreo_lotes.sample_batch); el resto usa los kernels memorizados del
+# registro. CUDA-Q se llama siempre desde un único hilo, fuera del bucle.
+#
+# Cada petición se valida antes de encolarse (compuertas dentro de rango y
+# como mucho max_qubits qubits, para que el vector de estado quepa en
+# memoria), y un error al evaluar solo falla la petición que lo causa, no el
+# resto de su lote.
+#
+#   python servicio_oraculos.py serve --socket /tmp/oraculos.sock
+#   python servicio_oraculos.py once '{"algorithm": "bv", "n": 4, "secret": "1011"}'
+#   python servicio_oraculos.py loadtest
+# ============================================================================
+
+DEFAULT_SOCKET = "/tmp/oraculos.sock"
+
+# Qubits por petición (incluido el auxiliar): 2^24 amplitudes = 256 MiB
+MAX_QUBITS = 24
+
+_PHASE_GATES = frozenset({"z", "cz"})
+
+
+def oracle_spec(spec, max_qubits=MAX_QUBITS):
+    """(algoritmo, n, compuertas, auxiliar, shots) de una petición JSON
+
+    Lanza ValueError si la petición es inválida o pasa de max_qubits.
+    """
+    from circuito_ir import Circuit
+
+    algorithm = spec.get("algorithm", "bv")
+    if algorithm not in ("dj", "bv"):
+        raise ValueError(f"Algoritmo desconocido: {algorithm!r} (opciones: 'dj', 'bv')")
+    ancilla = spec.get("ancilla", False)
+    if not isinstance(ancilla, bool):
+        # bool("false") es True: solo se aceptan los booleanos de JSON
+        raise ValueError(f"'ancilla' debe ser true o false (recibido {ancilla!r})")
+    shots = int(spec.get("shots", 1000))
+    if shots < 1:
+        raise ValueError(f"shots debe ser positivo (recibido {shots})")
+    if "truth_table" in spec:
+        n, gates = compile_oracle(spec["truth_table"], ancilla)
+    else:
+        oracle = spec.get("secret", spec.get("oracle", spec.get("gates")))
+        if oracle is None:
+            raise ValueError("La petición necesita 'secret', 'oracle', 'gates' o 'truth_table'")
+        n = int(spec.get("n", len(oracle) if isinstance(oracle, str) else 0))
+        gates = oracle_gates(algorithm, n, oracle, ancilla)
+    if not 1 <= n + ancilla <= max_qubits:
+        raise ValueError(f"n={n}{' + auxiliar' if ancilla else ''} fuera del rango "
+                         f"admitido (1 a {max_qubits} qubits)")
+    gates = tuple(tuple(gate) for gate in gates)
+    try:
+        # Nombres y rangos de las compuertas, antes de encolar la petición
+        Circuit.from_gates(n + ancilla, gates)
+    except TypeError as error:
+        raise ValueError(f"Compuertas mal formadas: {error}") from error
+    return algorithm, n, gates, ancilla, shots
+
+
+def _evaluate_one(spec, engine):
+    """Resultado de una oracle_spec, o la excepción que lanza"""
+    from ejecucion import sample_kernel
+    from registro_kernels import get_kernel
+
+    algorithm, n, gates, ancilla, shots = spec
+    try:
+        return sample_kernel(get_kernel(algorithm, n, gates, ancilla), (), shots, engine)
+    except Exception as error:
+        return error
+
+
+def evaluate_batch(specs, engine="cudaq"):
+    """Resultados de una lista de oracle_spec, agrupando los oráculos de fase
+
+    Una petición que falla deja su excepción en su posición de la lista; el
+    resto del lote se evalúa igual.
+    """
+    from muestreo_lotes import sample_batch
+
+    results = [None] * len(specs)
+    phase = {}
+    for i, (algorithm, n, gates, ancilla, shots) in enumerate(specs):
+        if engine == "cudaq" and not ancilla and all(g[0] in _PHASE_GATES for g in gates):
+            phase.setdefault(shots, []).append(i)
+        else:
+            results[i] = _evaluate_one(specs[i], engine)
+    for shots, indices in phase.items():
+        try:
+            batch = sample_batch([(specs[i][1], specs[i][2]) for i in indices], shots)
+        except Exception:
+            # Una petición rompe la llamada con broadcast: una a una para aislarla
+            batch = [_evaluate_one(specs[i], engine) for i in indices]
+        for i, result in zip(indices, batch):
+            results[i] = result
+    return results
+
+
+def response(request_id, result, batch):
+    return {"id": request_id, "counts": dict(result.items()),
+            "most_probable": result.most_probable(), "batch": batch}
+
+
+class OracleService:
+    """Servidor asyncio con micro-lotes y un hilo único para CUDA-Q"""
+
+    def __init__(self, window=0.005, max_batch=64, engine="cudaq", max_qubits=MAX_QUBITS):
+        self.window = window
+        self.max_batch = max_batch
+        self.engine = engine
+        self.max_qubits = max_qubits
+        self.batches = 0
+        self._queue = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    async def evaluate(self, spec):
+        """Encola la petición ya validada y espera su resultado"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((spec, future))
+        return await future
+
+    async def _batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    if self._queue.empty():
+                        break
+                    batch.append(self._queue.get_nowait())
+                    continue
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            specs = [spec for spec, _ in batch]
+            self.batches += 1
+            try:
+                results = await loop.run_in_executor(self._executor, evaluate_batch, specs,
+                                                     self.engine)
+            except Exception as error:
+                for _, future in batch:
+                    future.set_exception(error)
+                continue
+            for (_, future), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result((result, len(batch)))
+
+    async def _answer(self, line, writer):
+        request = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            result, size = await self.evaluate(oracle_spec(request, self.max_qubits))
+            reply = response(request_id, result, size)
+        except Exception as error:
+            reply = {"id": request.get("id") if isinstance(request, dict) else None,
+                     "error": str(error)}
+        writer.write((json.dumps(reply) + "\n").encode())
+
+    async def _handle(self, reader, writer):
+        pending = set()
+        while line := await reader.readline():
+            task = asyncio.create_task(self._answer(line, writer))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        await asyncio.gather(*pending)
+        await writer.drain()
+        writer.close()
+
+    async def serve(self, path=DEFAULT_SOCKET, ready=None):
+        """Atiende el socket Unix hasta que se cancela la tarea (o llega SIGTERM)"""
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        self._queue = asyncio.Queue()
+        # Calentamiento: importar CUDA-Q y compilar el kernel paramétrico
+        warmup, = await loop.run_in_executor(
+            self._executor, evaluate_batch, [oracle_spec({"n": 1, "secret": "1"})], self.engine)
+        if isinstance(warmup, Exception):
+            raise warmup
+        batcher = asyncio.create_task(self._batcher())
+        if os.path.exists(path):
+            os.remove(path)
+        server = await asyncio.start_unix_server(self._handle, path=path)
+        if ready is not None:
+            ready()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            if os.path.exists(path):
+                os.remove(path)
+
+
+async def request_many(specs, path=DEFAULT_SOCKET):
+    """Envía las peticiones por una conexión y devuelve las respuestas por id"""
+    reader, writer = await asyncio.open_unix_connection(path)
+    for i, spec in enumerate(specs):
+        writer.write((json.dumps({"id": i, **spec}) + "\n").encode())
+    await writer.drain()
+    writer.write_eof()
+    replies = {}
+    while line := await reader.readline():
+        reply = json.loads(line)
+        replies[reply["id"]] = reply
+    writer.close()
+    return [replies[i] for i in range(len(specs))]
+
+
+# ============================================================================
+# PRUEBA DE CARGA: SERVICIO vs UN PROCESO POR PETICIÓN
+# ============================================================================
+
+def _percentiles(latencies):
+    import numpy as np
+
+    return np.percentile(latencies, 50), np.percentile(latencies, 99)
+
+
+async def _closed_loop(path, specs, clients):
+    """`clients` conexiones, cada una con una petición en vuelo a la vez"""
+    latencies, batches = [], []
+
+    async def client(own):
+        reader, writer = await asyncio.open_unix_connection(path)
+        for i, spec in own:
+            start = time.perf_counter()
+            writer.write((json.dumps({"id": i, **spec}) + "\n").encode())
+            await writer.drain()
+            reply = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - start)
+            if "error" in reply:
+                raise RuntimeError(reply["error"])
+            batches.append(reply["batch"])
+        writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(list(enumerate(specs))[c::clients]) for c in range(clients)))
+    return latencies, batches, time.perf_counter() - start
+
+
+def start_server(path, window, max_batch=64):
+    """Lanza `serve` en otro proceso y espera a que esté escuchando"""
+    process = subprocess.Popen([sys.executable, os.path.abspath(__file__), "serve",
+                                "--socket", path, "--window", str(window),
+                                "--max-batch", str(max_batch)],
+                               stdout=subprocess.PIPE, text=True)
+    if process.stdout.readline().strip() != "listo":
+        process.kill()
+        raise RuntimeError("El servicio no arrancó")
+    return process
+
+
+def load_test(requests=400, clients=16, baseline_requests=5, path=DEFAULT_SOCKET):
+    import numpy as np
+
+    rng = np.random.default_rng(7)
+    specs = []
+    for i in range(requests):
+        if i % 5 == 4:
+            specs.append({"algorithm": "dj", "n": 2, "oracle": "balanced_x1", "ancilla": True,
+                          "shots": 200})
+        else:
+            secret = "".join(rng.choice(["0", "1"], 8))
+            specs.append({"algorithm": "bv", "n": 8, "secret": secret, "shots": 200})
+
+    rows = []
+    # Ventana 0: el lote es lo que se acumuló mientras se ejecutaba el anterior
+    for label, window, max_batch in [("servicio, sin lotes", 0.0, 1),
+                                     ("servicio, lotes sin espera", 0.0, 64),
+                                     ("servicio, ventana 5 ms", 0.005, 64)]:
+        process = start_server(path, window, max_batch)
+        try:
+            latencies, batches, elapsed = asyncio.run(_closed_loop(path, specs, clients))
+        finally:
+            process.terminate()
+            process.wait()
+        rows.append((label, *_percentiles(latencies), requests / elapsed, np.mean(batches)))
+
+    latencies = []
+    for spec in specs[:baseline_requests]:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.abspath(__file__), "once", json.dumps(spec)],
+                       check=True, capture_output=True)
+        latencies.append(time.perf_counter() - start)
+    rows.append(("un proceso por petición", *_percentiles(latencies),
+                 len(latencies) / sum(latencies), 1.0))
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servicio local de evaluación de oráculos")
+    commands = parser.add_subparsers(dest="command")
+    serve = commands.add_parser("serve", help="atiende peticiones en un socket Unix")
+    serve.add_argument("--socket", default=DEFAULT_SOCKET)
+    serve.add_argument("--window", type=float, default=0.005,
+                       help="segundos de espera para llenar un micro-lote")
+    serve.add_argument("--max-batch", type=int, default=64)
+    serve.add_argument("--max-qubits", type=int, default=MAX_QUBITS,
+                       help="qubits máximos por petición (incluido el auxiliar)")
+    once = commands.add_parser("once", help="evalúa una petición JSON en este proceso")
+    once.add_argument("spec")
+    loadtest = commands.add_parser("loadtest", help="prueba de carga (por defecto)")
+    loadtest.add_argument("--requests", type=int, default=400)
+    loadtest.add_argument("--clients", type=int, default=16)
+    options = parser.parse_args()
+
+    if options.command == "serve":
+        service = OracleService(options.window, options.max_batch, max_qubits=options.max_qubits)
+        try:
+            asyncio.run(service.serve(options.socket, ready=lambda: print("listo", flush=True)))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            pass
+    elif options.command == "once":
+        spec = json.loads(options.spec)
+        result = evaluate_batch([oracle_spec(spec)])[0]
+        if isinstance(result, Exception):
+            raise result
+        print(json.dumps(response(spec.get("id"), result, 1)))
+    else:
+        requests = getattr(options, "requests", 400)
+        clients = getattr(options, "clients", 16)
+
+        print("\n" + "="*80)
+        print("SERVICIO DE ORÁCULOS: LATENCIA Y RENDIMIENTO")
+        print("="*80)
+        print(f"\n{requests} peticiones (BV n=8 de fase y DJ con auxiliar, 200 shots), "
+              f"{clients} clientes con una petición en vuelo cada uno")
+
+        rows = load_test(requests, clients)
+        print("\n┌────────────────────────────┬────────────┬────────────┬──────────────┬────────────┐")
+        print("│ Modo                       │ p50 (ms)   │ p99 (ms)   │ Peticiones/s │ Lote medio │")
+        print("├────────────────────────────┼────────────┼────────────┼──────────────┼────────────┤")
+        for label, p50, p99, throughput, batch in rows:
+            print(f"│ {label:<26} │ {p50*1e3:^10.1f} │ {p99*1e3:^10.1f} │ {throughput:^12.1f} │ "
+                  f"{batch:^10.1f} │")
+        print("└────────────────────────────┴────────────┴────────────┴──────────────┴────────────┘")
+        print("  Un proceso por petición: importa CUDA-Q y compila el kernel cada vez "
+              "(5 peticiones en serie)")
+        print("="*80 + "\n")
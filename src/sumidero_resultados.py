@@ -0,0 +1,296 @@
+import json
+import os
+import time
+from collections import Counter
+
+from marginales import counts_to_arrays, index_to_bits
+
+# ============================================================================
+# SUMIDERO DE RESULTADOS EN COLUMNAS (JSON LINES / PARQUET / ARROW IPC)
+# ============================================================================
+#
+# En lugar de imprimir cada SampleResult (hasta 2^n líneas por ejecución),
+# cada ejecución se guarda como un registro:
+#
+#   algorithm, n, oracle, variant, engine, shots, verdict,
+#   width, indices[], counts[]      (conteos como arrays índice/conteo)
+#   probabilities[]                 (modo exacto, en lugar de counts[])
+#   elapsed_s, timestamp, ...       (tiempos y campos extra)
+#
+# Con más de 64 bits las cadenas no caben en un índice: indices queda a None
+# y los resultados van como cadenas en bitstrings[] (con ≤ 64 bits es None).
+# Los registros del modo exacto (probability_record) tienen engine "exact",
+# shots 0, counts a None y la probabilidad de cada índice no nulo.
+#
+# Los registros se acumulan en lotes de tamaño acotado y cada lote se escribe
+# de una vez. El formato sale de la extensión del archivo:
+#
+#   .jsonl              JSON Lines (por defecto, sin dependencias)
+#   .parquet            Parquet (requiere pyarrow)
+#   .arrow / .feather   Arrow IPC (requiere pyarrow)
+#
+# En Parquet/Arrow el esquema es fijo (record_schema) y no se infiere del
+# primer lote: con un lote de solo ≤ 64 bits bitstrings sería una columna de
+# nulos y el primer registro de > 64 bits ya no encajaría. Los campos extra
+# (p. ej. max_shots) se añaden al final con el tipo inferido del primer lote.
+#
+# La salida por consola queda como vista resumida opcional (summarize_counts).
+# ============================================================================
+
+FORMATS = {".jsonl": "jsonl", ".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+
+
+def _result_width(result):
+    for bits, _ in result.items():
+        return len(bits)
+    return 0
+
+
+def run_record(result, algorithm, n, oracle, variant="phase", engine="cudaq", shots=None,
+               elapsed_s=None, verdict=None, **extra):
+    """Registro de una ejecución con los conteos como arrays índice/conteo
+
+    verdict: conclusión del análisis ("constant" / "balanced" en DJ, la
+    cadena recuperada en BV).
+    """
+    width = _result_width(result)
+    if width > 64:
+        indices = None
+        bitstrings = [bits for bits, _ in result.items()]
+        counts = [int(count) for _, count in result.items()]
+    else:
+        indices, counts, width = counts_to_arrays(result)
+        indices, counts, bitstrings = indices.tolist(), counts.tolist(), None
+    record = {
+        "algorithm": algorithm,
+        "n": n,
+        "oracle": oracle if isinstance(oracle, str) else repr(oracle),
+        "variant": variant,
+        "engine": engine,
+        "shots": sum(counts) if shots is None else shots,
+        "verdict": verdict,
+        "width": width,
+        "indices": indices,
+        "bitstrings": bitstrings,
+        "counts": counts,
+        "probabilities": None,
+        "elapsed_s": elapsed_s,
+        "timestamp": time.time(),
+    }
+    record.update(extra)
+    return record
+
+
+def probability_record(probs, width, algorithm, n, oracle, variant="phase", elapsed_s=None,
+                       verdict=None, threshold=1e-9, **extra):
+    """Registro del modo exacto: índices con probabilidad > threshold y su probabilidad"""
+    indices = [int(index) for index in (probs > threshold).nonzero()[0]]
+    record = {
+        "algorithm": algorithm,
+        "n": n,
+        "oracle": oracle if isinstance(oracle, str) else repr(oracle),
+        "variant": variant,
+        "engine": "exact",
+        "shots": 0,
+        "verdict": verdict,
+        "width": width,
+        "indices": indices,
+        "bitstrings": None,
+        "counts": None,
+        "probabilities": [float(probs[index]) for index in indices],
+        "elapsed_s": elapsed_s,
+        "timestamp": time.time(),
+    }
+    record.update(extra)
+    return record
+
+
+def record_schema(records=()):
+    """Esquema Arrow de los registros; los campos extra se infieren de records"""
+    import pyarrow as pa
+
+    fields = [
+        pa.field("algorithm", pa.string()),
+        pa.field("n", pa.int64()),
+        pa.field("oracle", pa.string()),
+        pa.field("variant", pa.string()),
+        pa.field("engine", pa.string()),
+        pa.field("shots", pa.int64()),
+        pa.field("verdict", pa.string()),
+        pa.field("width", pa.int64()),
+        pa.field("indices", pa.list_(pa.uint64())),
+        pa.field("bitstrings", pa.list_(pa.string())),
+        pa.field("counts", pa.list_(pa.int64())),
+        pa.field("probabilities", pa.list_(pa.float64())),
+        pa.field("elapsed_s", pa.float64()),
+        pa.field("timestamp", pa.float64()),
+    ]
+    known = {field.name for field in fields}
+    extra = [key for key in dict.fromkeys(key for record in records for key in record)
+             if key not in known]
+    if extra:
+        inferred = pa.Table.from_pylist([{key: record.get(key) for key in extra}
+                                         for record in records]).schema
+        fields.extend(inferred)
+    return pa.schema(fields)
+
+
+def kernel_variant(kernel_func, kernel_args=(), default="phase"):
+    """"ancilla" si el kernel deja algún qubit sin medir (el auxiliar); si no, "phase"
+
+    Si el kernel no se puede trazar, devuelve default.
+    """
+    from oraculo_parametrico import phase_oracle_kernel
+    from recursos_circuito import kernel_circuit
+
+    if kernel_func is phase_oracle_kernel:
+        return "phase"
+    try:
+        num_qubits, _, measured = kernel_circuit(kernel_func, kernel_args)
+    except ValueError:
+        return default
+    return "ancilla" if len(set(measured)) < num_qubits else "phase"
+
+
+class ResultSink:
+    """Escribe registros de ejecución en lotes acotados
+
+    Se usa como gestor de contexto; el formato se deduce de la extensión
+    salvo que se indique con format.
+    """
+
+    def __init__(self, path, format=None, batch_size=1000):
+        if format is None:
+            format = FORMATS.get(os.path.splitext(path)[1].lower(), "jsonl")
+        if format not in FORMATS.values():
+            raise ValueError(f"Formato desconocido: {format!r} "
+                             f"(opciones: {', '.join(sorted(set(FORMATS.values())))})")
+        if format != "jsonl":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as error:
+                raise ImportError(f"El formato {format!r} requiere pyarrow "
+                                  "(pip install pyarrow); use .jsonl sin dependencias") from error
+
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+        self.written = 0
+        self._batch = []
+        self._writer = None
+        self._schema = None
+        self._file = None
+
+    def write(self, record):
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._batch:
+            return
+        if self.format == "jsonl":
+            if self._file is None:
+                self._file = open(self.path, "w")
+            self._file.write("".join(json.dumps(record) + "\n" for record in self._batch))
+            self._file.flush()
+        else:
+            self._write_arrow(self._batch)
+        self.written += len(self._batch)
+        self._batch = []
+
+    def _write_arrow(self, records):
+        import pyarrow as pa
+
+        if self._writer is None:
+            self._schema = record_schema(records)
+            if self.format == "parquet":
+                import pyarrow.parquet as pq
+                self._writer = pq.ParquetWriter(self.path, self._schema)
+            else:
+                self._writer = pa.ipc.new_file(self.path, self._schema)
+        self._writer.write_table(pa.Table.from_pylist(records, schema=self._schema))
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_jsonl(path):
+    """Itera los registros de un archivo JSON Lines"""
+    with open(path) as records:
+        for line in records:
+            yield json.loads(line)
+
+
+def silent(*args, **kwargs):
+    """Sustituto de print cuando la vista por consola está desactivada"""
+
+
+def summarize_counts(result, top=8):
+    """Vista resumida de los conteos: completa si hay pocos resultados, si no
+    los `top` más frecuentes"""
+    if _result_width(result) > 64:
+        # Sin índices de 64 bits: las cadenas directamente
+        counter = Counter(dict(result.items()))
+        shown = counter.most_common(top)
+        body = " ".join(f"{bits}:{count}" for bits, count in sorted(shown))
+        hidden = len(counter) - len(shown)
+        if hidden:
+            body += (f" … (+{hidden} resultados, {sum(c for _, c in shown)}/"
+                     f"{sum(counter.values())} shots mostrados)")
+        return "{ " + body + " }\n"
+
+    indices, counts, width = counts_to_arrays(result)
+    order = counts.argsort(kind="stable")[::-1][:top]
+    shown = sorted(order, key=lambda i: indices[i])
+    body = " ".join(f"{index_to_bits(indices[i], width)}:{counts[i]}" for i in shown)
+    hidden = len(counts) - len(shown)
+    if hidden:
+        body += f" … (+{hidden} resultados, {int(counts[order].sum())}/{int(counts.sum())} shots mostrados)"
+    return "{ " + body + " }\n"
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    from motor_estabilizador import stabilizer_sample
+    from oraculos import all_secrets
+    from registro_kernels import get_kernel
+
+    print("\n" + "="*80)
+    print("SUMIDERO DE RESULTADOS: JSON LINES EN LOTES")
+    print("="*80)
+
+    n = 8
+    secrets = all_secrets(n)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bv.jsonl")
+        start = time.perf_counter()
+        with ResultSink(path, batch_size=64) as sink:
+            for secret in secrets:
+                run_start = time.perf_counter()
+                result = stabilizer_sample(get_kernel("bv", n, secret, ancilla=True))
+                sink.write(run_record(result, "bv", n, secret, "ancilla", "stabilizer",
+                                      elapsed_s=time.perf_counter() - run_start))
+        elapsed = time.perf_counter() - start
+
+        records = list(read_jsonl(path))
+        assert len(records) == len(secrets)
+        assert all(index_to_bits(r["indices"][0], r["width"]) == r["oracle"] for r in records)
+        print(f"\n✓ {len(records)} registros BV n={n} en {elapsed:.2f} s "
+              f"({os.path.getsize(path) / 1024:.0f} KB, lotes de 64)")
+
+    # Vista resumida de un resultado con muchos resultados distintos
+    wide = {format(i, "012b"): 1 + i % 7 for i in range(4096)}
+    print(f"\nResumen de 4096 resultados: {summarize_counts(wide, top=4)}")
+    print("="*80 + "\n")
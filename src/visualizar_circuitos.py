@@ -1,98 +1,177 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Circle, FancyArrowPatch
+import time
+import tracemalloc
+
 import numpy as np
 
+from circuito_ir import Circuit
+
 # ============================================================================
 # VISUALIZACIÓN DE CIRCUITOS CUÁNTICOS
 # ============================================================================
+#
+# Las compuertas no se dibujan una a una: add_gate, add_cz y add_barrier solo
+# encolan primitivas (cajas, segmentos y puntos) y render() las emite todas
+# juntas, una PatchCollection para las cajas, otra para los puntos de control
+# y una LineCollection por estilo de línea. Así un oráculo de 100 qubits y 500
+# compuertas son unas pocas colecciones en lugar de miles de artistas.
+# Con batched=False se emite un artista por primitiva (modo anterior, para
+# comparar en benchmark_rendering).
+#
+# matplotlib se importa al crear la figura, no al importar el módulo, para
+# que construir_figuras.py pueda fijar el backend Agg en cada proceso.
+# ============================================================================
+
+# Colores (borde, relleno) de las compuertas de un qubit
+GATE_STYLES = {
+    'H': ('blue', 'lightblue'),
+    'Z': ('green', 'lightgreen'),
+    'X': ('orange', 'lightyellow'),
+    'M': ('red', 'lightyellow'),
+    'RX': ('gray', 'whitesmoke'),
+    'RY': ('gray', 'whitesmoke'),
+    'RZ': ('gray', 'whitesmoke'),
+}
+
+# Arco del medidor como polilínea (semicírculo de radio 0.15)
+_ARC = np.linspace(0, np.pi, 16)
+_ARC_X = 0.15 * np.cos(_ARC)
+_ARC_Y = 0.15 * np.sin(_ARC)
+
+# Objetivo ⊕ de las X controladas (círculo de radio 0.2)
+_RING = np.linspace(0, 2 * np.pi, 33)
+_RING_X = 0.2 * np.cos(_RING)
+_RING_Y = 0.2 * np.sin(_RING)
+
 
 class QuantumCircuitDrawer:
     """Clase para dibujar circuitos cuánticos de manera visual"""
     
-    def __init__(self, num_qubits, figsize=(14, 8)):
+    def __init__(self, num_qubits, figsize=(14, 8), length=10, batched=True, ax=None,
+                 qubit_labels=None):
+        import matplotlib.pyplot as plt
+        
         self.num_qubits = num_qubits
-        self.fig, self.ax = plt.subplots(figsize=figsize)
-        self.ax.set_xlim(0, 10)
+        self.length = length
+        self.batched = batched
+        if ax is None:
+            self.fig, self.ax = plt.subplots(figsize=figsize)
+        else:
+            self.fig, self.ax = ax.figure, ax
+        self.ax.set_xlim(0, length)
         self.ax.set_ylim(-0.5, num_qubits + 0.5)
         self.ax.axis('off')
         
+        # Primitivas en cola hasta render()
+        self._boxes = []      # (x, y, ancho, alto, borde, relleno)
+        self._segments = {}   # (color, grosor, estilo, alfa) → [segmentos]
+        self._dots = []       # (x, y, color)
+        self._letters = {}    # (texto, color, tamaño) → [posiciones]
+        
         # Dibujar líneas de qubits
         for i in range(num_qubits):
             y = num_qubits - 1 - i
-            self.ax.plot([0.5, 9.5], [y, y], 'k-', linewidth=1.5)
-            self.ax.text(0.2, y, f'|q{i}⟩', fontsize=14, ha='right', va='center')
+            self._line([(0.5, y), (length - 0.5, y)], 'k', 1.5)
+            label = qubit_labels[i] if qubit_labels else f'|q{i}⟩'
+            self.ax.text(0.2, y, label, fontsize=14, ha='right', va='center')
+    
+    def _line(self, points, color, linewidth, linestyle='solid', alpha=1.0):
+        self._segments.setdefault((color, linewidth, linestyle, alpha), []).append(points)
+    
+    def _letter(self, x, y, text, color='black', fontsize=16):
+        self._letters.setdefault((text, color, fontsize), []).append((x, y))
     
     def add_gate(self, gate_type, qubit, position, label=''):
         """Añade una compuerta al circuito"""
         y = self.num_qubits - 1 - qubit
+        if gate_type not in GATE_STYLES:
+            return
+        edge, face = GATE_STYLES[gate_type]
         
-        if gate_type == 'H':
-            # Compuerta Hadamard (cuadrado azul)
-            box = FancyBboxPatch((position - 0.2, y - 0.25), 0.4, 0.5,
-                                boxstyle="round,pad=0.05", 
-                                edgecolor='blue', facecolor='lightblue', linewidth=2)
-            self.ax.add_patch(box)
-            self.ax.text(position, y, 'H', fontsize=16, ha='center', va='center', weight='bold')
-        
-        elif gate_type == 'Z':
-            # Compuerta Z (cuadrado verde)
-            box = FancyBboxPatch((position - 0.2, y - 0.25), 0.4, 0.5,
-                                boxstyle="round,pad=0.05", 
-                                edgecolor='green', facecolor='lightgreen', linewidth=2)
-            self.ax.add_patch(box)
-            self.ax.text(position, y, 'Z', fontsize=16, ha='center', va='center', weight='bold')
-        
-        elif gate_type == 'M':
+        if gate_type == 'M':
             # Medición (símbolo de medidor)
-            box = FancyBboxPatch((position - 0.25, y - 0.3), 0.5, 0.6,
-                                boxstyle="round,pad=0.05", 
-                                edgecolor='red', facecolor='lightyellow', linewidth=2)
-            self.ax.add_patch(box)
-            # Dibujar símbolo de medidor
-            arc = patches.Arc((position, y - 0.1), 0.3, 0.3, angle=0, theta1=0, theta2=180, 
-                            color='red', linewidth=2)
-            self.ax.add_patch(arc)
-            self.ax.plot([position, position + 0.1], [y - 0.1, y + 0.2], 'r-', linewidth=2)
+            self._boxes.append((position - 0.25, y - 0.3, 0.5, 0.6, edge, face))
+            self._line(np.column_stack([position + _ARC_X, y - 0.1 + _ARC_Y]), 'red', 2)
+            self._line([(position, y - 0.1), (position + 0.1, y + 0.2)], 'red', 2)
+        else:
+            # Compuerta de un qubit (cuadrado con su letra)
+            self._boxes.append((position - 0.2, y - 0.25, 0.4, 0.5, edge, face))
+            self._letter(position, y, gate_type, fontsize=16 if len(gate_type) == 1 else 11)
+    
+    def add_controlled(self, controls, target, position, kind='z'):
+        """Añade una Z o X controlada por uno o varios qubits"""
+        color = 'purple' if kind == 'z' else 'blue'
+        ys = [self.num_qubits - 1 - q for q in (*controls, target)]
         
-        elif gate_type == 'X':
-            # Compuerta X (cuadrado naranja)
-            box = FancyBboxPatch((position - 0.2, y - 0.25), 0.4, 0.5,
-                                boxstyle="round,pad=0.05", 
-                                edgecolor='orange', facecolor='lightyellow', linewidth=2)
-            self.ax.add_patch(box)
-            self.ax.text(position, y, 'X', fontsize=16, ha='center', va='center', weight='bold')
+        # Línea vertical conectando los qubits y círculos de control
+        self._line([(position, min(ys)), (position, max(ys))], color, 2)
+        for y in ys[:-1]:
+            self._dots.append((position, y, color))
+        
+        # Objetivo: punto (Z, simétrica) o ⊕ (X)
+        y = ys[-1]
+        if kind == 'z':
+            self._dots.append((position, y, color))
+        else:
+            self._line(np.column_stack([position + _RING_X, y + _RING_Y]), color, 2)
+            self._line([(position - 0.2, y), (position + 0.2, y)], color, 2)
     
     def add_cz(self, control_qubit, target_qubit, position):
         """Añade una compuerta CZ (Controlled-Z)"""
-        y_control = self.num_qubits - 1 - control_qubit
-        y_target = self.num_qubits - 1 - target_qubit
-        
-        # Dibujar línea vertical conectando los qubits
-        self.ax.plot([position, position], [y_control, y_target], 'purple', linewidth=2)
-        
-        # Círculo de control (filled)
-        circle_control = Circle((position, y_control), 0.1, color='purple', zorder=10)
-        self.ax.add_patch(circle_control)
-        
-        # Círculo de target (filled)
-        circle_target = Circle((position, y_target), 0.1, color='purple', zorder=10)
-        self.ax.add_patch(circle_target)
+        self.add_controlled([control_qubit], target_qubit, position, 'z')
         
         # Etiqueta CZ
-        mid_y = (y_control + y_target) / 2
-        self.ax.text(position + 0.4, mid_y, 'CZ', fontsize=12, color='purple', weight='bold')
+        mid_y = (2 * self.num_qubits - 2 - control_qubit - target_qubit) / 2
+        self._letter(position + 0.55, mid_y, 'CZ', 'purple', 12)
     
     def add_barrier(self, position, label=''):
         """Añade una barrera visual (separador)"""
         for i in range(self.num_qubits):
             y = self.num_qubits - 1 - i
-            self.ax.plot([position, position], [y - 0.3, y + 0.3], 'gray', 
-                        linewidth=3, linestyle='--', alpha=0.5)
+            self._line([(position, y - 0.3), (position, y + 0.3)], 'gray', 3, '--', 0.5)
         if label:
             self.ax.text(position, self.num_qubits + 0.3, label, 
                         fontsize=11, ha='center', style='italic', color='gray')
     
+    def render(self):
+        """Emite las primitivas en cola (colecciones si batched) y vacía la cola"""
+        from matplotlib.collections import LineCollection, PatchCollection
+        from matplotlib.patches import Circle, FancyBboxPatch
+        
+        boxes = [FancyBboxPatch((x, y), width, height, boxstyle="round,pad=0.05",
+                                edgecolor=edge, facecolor=face, linewidth=2)
+                 for x, y, width, height, edge, face in self._boxes]
+        dots = [Circle((x, y), 0.1, color=color, zorder=10) for x, y, color in self._dots]
+        if self.batched:
+            # Cada letra repetida es un marcador mathtext de un único scatter
+            for (text, color, fontsize), points in self._letters.items():
+                x, y = np.transpose(points)
+                self.ax.scatter(x, y, s=(0.7 * fontsize * len(text))**2, c=color,
+                                marker=f'$\\mathbf{{{text}}}$', linewidths=0, zorder=3)
+        else:
+            for (text, color, fontsize), points in self._letters.items():
+                for x, y in points:
+                    self.ax.text(x, y, text, fontsize=fontsize, color=color, ha='center',
+                                 va='center', weight='bold')
+        
+        if self.batched:
+            if boxes:
+                self.ax.add_collection(PatchCollection(boxes, match_original=True))
+            for (color, linewidth, linestyle, alpha), segments in self._segments.items():
+                self.ax.add_collection(LineCollection(segments, colors=color, linewidths=linewidth,
+                                                      linestyles=linestyle, alpha=alpha))
+            if dots:
+                self.ax.add_collection(PatchCollection(dots, match_original=True, zorder=10))
+        else:
+            for patch in boxes + dots:
+                self.ax.add_patch(patch)
+            for (color, linewidth, linestyle, alpha), segments in self._segments.items():
+                for segment in segments:
+                    x, y = np.transpose(segment)
+                    self.ax.plot(x, y, color=color, linewidth=linewidth, linestyle=linestyle,
+                                 alpha=alpha)
+        
+        self._boxes, self._segments, self._dots, self._letters = [], {}, [], {}
+    
     def add_label(self, position, y_offset, text, fontsize=10):
         """Añade una etiqueta descriptiva"""
         self.ax.text(position, -0.7 + y_offset, text, 
@@ -100,167 +179,102 @@ class QuantumCircuitDrawer:
     
     def set_title(self, title):
         """Establece el título del circuito"""
-        self.ax.text(5, self.num_qubits + 0.8, title, 
+        self.ax.text(self.length / 2, self.num_qubits + 0.8, title, 
                     fontsize=18, ha='center', weight='bold')
     
-    def save(self, filename):
+    def save(self, filename, dpi=300):
         """Guarda la figura"""
-        plt.tight_layout()
-        plt.savefig(filename, dpi=300, bbox_inches='tight', facecolor='white')
+        self.render()
+        self.fig.tight_layout()
+        self.fig.savefig(filename, dpi=dpi, bbox_inches='tight', facecolor='white')
         print(f"✓ Circuito guardado en: {filename}")
     
     def show(self):
         """Muestra la figura"""
+        import matplotlib.pyplot as plt
+        
+        self.render()
         plt.tight_layout()
         plt.show()
 
 
 # ============================================================================
-# FUNCIÓN PARA CREAR CIRCUITOS ESPECÍFICOS
+# DIBUJO DESDE EL IR: DISPOSICIÓN AUTOMÁTICA
 # ============================================================================
 
-def draw_deutsch_jozsa_2qubits():
-    """Dibuja el circuito de Deutsch-Jozsa para 2 qubits"""
-    
-    drawer = QuantumCircuitDrawer(num_qubits=2, figsize=(14, 6))
-    drawer.set_title('Algoritmo Deutsch-Jozsa (2 qubits) - Sin qubit auxiliar')
-    
-    # Estado inicial
-    drawer.add_label(0.5, 0, '|00⟩', fontsize=12)
-    
-    # Primera capa de Hadamard
-    drawer.add_gate('H', 0, 1.5)
-    drawer.add_gate('H', 1, 1.5)
-    drawer.add_barrier(2.3, 'Superposición')
-    
-    # Oráculo (ejemplo: función balanceada f(x) = x₀)
-    drawer.add_gate('Z', 0, 4)
-    drawer.add_barrier(5, 'Oráculo')
-    drawer.add_label(4, 0, 'Uf', fontsize=12)
-    
-    # Segunda capa de Hadamard
-    drawer.add_gate('H', 0, 6.5)
-    drawer.add_gate('H', 1, 6.5)
-    drawer.add_barrier(7.3, 'Interferencia')
-    
-    # Medición
-    drawer.add_gate('M', 0, 8.5)
-    drawer.add_gate('M', 1, 8.5)
-    
-    drawer.save('deutsch_jozsa_2qubits.png')
+def draw_circuit(circuit, title=None, ax=None, batched=True, spacing=1.2, figsize=None,
+                 qubit_labels=None):
+    """Dibuja un circuito del IR (circuito_ir.Circuit) con la disposición de layout()
+
+    Cada columna ocupa `spacing` unidades; las mediciones van en una columna
+    final. Devuelve el QuantumCircuitDrawer (sin guardar).
+    """
+    columns, width = circuit.layout()
+    positions = 1.5 + spacing * columns
+    length = 2.5 + spacing * (width + 1)
+    if figsize is None:
+        figsize = (max(8, 0.6 * length), max(3, 0.6 * circuit.num_qubits + 2))
+    drawer = QuantumCircuitDrawer(circuit.num_qubits, figsize, length, batched, ax,
+                                  qubit_labels)
+    
+    for i, (name, qubits, _) in enumerate(circuit.operations()):
+        if name == 'barrier':
+            drawer.add_barrier(positions[i], circuit.labels.get(i, ''))
+        elif len(qubits) == 1:
+            drawer.add_gate(name.upper(), qubits[0], positions[i])
+        else:
+            drawer.add_controlled(qubits[:-1], qubits[-1], positions[i], name[-1])
+    for q in circuit.measured:
+        drawer.add_gate('M', q, 1.5 + spacing * width)
+    
+    if title:
+        drawer.set_title(title)
     return drawer
 
 
-def draw_deutsch_jozsa_3qubits():
-    """Dibuja el circuito de Deutsch-Jozsa para 3 qubits"""
-    
-    drawer = QuantumCircuitDrawer(num_qubits=3, figsize=(14, 7))
-    drawer.set_title('Algoritmo Deutsch-Jozsa (3 qubits) - Sin qubit auxiliar')
-    
-    # Estado inicial
-    drawer.add_label(0.5, 0, '|000⟩', fontsize=12)
-    
-    # Primera capa de Hadamard
-    drawer.add_gate('H', 0, 1.5)
-    drawer.add_gate('H', 1, 1.5)
-    drawer.add_gate('H', 2, 1.5)
-    drawer.add_barrier(2.3, 'Superposición')
-    
-    # Oráculo (ejemplo: función balanceada f(x) = x₀ ⊕ x₁)
-    drawer.add_cz(0, 1, 4)
-    drawer.add_barrier(5, 'Oráculo')
-    drawer.add_label(4, 0, 'Uf', fontsize=12)
-    
-    # Segunda capa de Hadamard
-    drawer.add_gate('H', 0, 6.5)
-    drawer.add_gate('H', 1, 6.5)
-    drawer.add_gate('H', 2, 6.5)
-    drawer.add_barrier(7.3, 'Interferencia')
-    
-    # Medición
-    drawer.add_gate('M', 0, 8.5)
-    drawer.add_gate('M', 1, 8.5)
-    drawer.add_gate('M', 2, 8.5)
-    
-    drawer.save('deutsch_jozsa_3qubits.png')
+# ============================================================================
+# FUNCIÓN PARA CREAR CIRCUITOS ESPECÍFICOS
+# ============================================================================
+
+def _draw_algorithm(algorithm, n, oracle, title, path, dpi, result=None):
+    drawer = draw_circuit(Circuit.for_algorithm(algorithm, n, oracle), title,
+                          figsize=(14, 4 + n))
+    drawer.add_label(0.5, 0, '|' + '0' * n + '⟩', fontsize=12)
+    if result:
+        drawer.add_label(drawer.length - 0.6, 0, f'→ |{result}⟩', fontsize=12)
+    drawer.save(path, dpi)
     return drawer
 
 
-def draw_bernstein_vazirani_2qubits():
+def draw_deutsch_jozsa_2qubits(path='deutsch_jozsa_2qubits.png', dpi=300):
+    """Dibuja el circuito de Deutsch-Jozsa para 2 qubits (f(x) = x₀)"""
+    return _draw_algorithm("dj", 2, "balanced_x0",
+                           'Algoritmo Deutsch-Jozsa (2 qubits) - Sin qubit auxiliar', path, dpi)
+
+
+def draw_deutsch_jozsa_3qubits(path='deutsch_jozsa_3qubits.png', dpi=300):
+    """Dibuja el circuito de Deutsch-Jozsa para 3 qubits (oráculo CZ(0, 1))"""
+    return _draw_algorithm("dj", 3, "balanced_xor_01",
+                           'Algoritmo Deutsch-Jozsa (3 qubits) - Sin qubit auxiliar', path, dpi)
+
+
+def draw_bernstein_vazirani_2qubits(path='bernstein_vazirani_2qubits.png', dpi=300):
     """Dibuja el circuito de Bernstein-Vazirani para 2 qubits"""
-    
-    drawer = QuantumCircuitDrawer(num_qubits=2, figsize=(14, 6))
-    drawer.set_title('Algoritmo Bernstein-Vazirani (2 qubits) - Cadena s = "11"')
-    
-    # Estado inicial
-    drawer.add_label(0.5, 0, '|00⟩', fontsize=12)
-    
-    # Primera capa de Hadamard
-    drawer.add_gate('H', 0, 1.5)
-    drawer.add_gate('H', 1, 1.5)
-    drawer.add_barrier(2.3, 'Superposición')
-    
-    # Oráculo (cadena secreta s = "11")
-    drawer.add_gate('Z', 0, 4)
-    drawer.add_gate('Z', 1, 4)
-    drawer.add_barrier(5, 'Oráculo')
-    drawer.add_label(4, 0, 'Uf (s="11")', fontsize=12)
-    
-    # Segunda capa de Hadamard
-    drawer.add_gate('H', 0, 6.5)
-    drawer.add_gate('H', 1, 6.5)
-    drawer.add_barrier(7.3, 'Interferencia')
-    
-    # Medición
-    drawer.add_gate('M', 0, 8.5)
-    drawer.add_gate('M', 1, 8.5)
-    
-    drawer.add_label(9.2, 0, '→ |11⟩', fontsize=12)
-    
-    drawer.save('bernstein_vazirani_2qubits.png')
-    return drawer
+    return _draw_algorithm("bv", 2, "11",
+                           'Algoritmo Bernstein-Vazirani (2 qubits) - Cadena s = "11"',
+                           path, dpi, result="11")
 
 
-def draw_bernstein_vazirani_3qubits():
+def draw_bernstein_vazirani_3qubits(path='bernstein_vazirani_3qubits.png', dpi=300):
     """Dibuja el circuito de Bernstein-Vazirani para 3 qubits"""
-    
-    drawer = QuantumCircuitDrawer(num_qubits=3, figsize=(14, 7))
-    drawer.set_title('Algoritmo Bernstein-Vazirani (3 qubits) - Cadena s = "101"')
-    
-    # Estado inicial
-    drawer.add_label(0.5, 0, '|000⟩', fontsize=12)
-    
-    # Primera capa de Hadamard
-    drawer.add_gate('H', 0, 1.5)
-    drawer.add_gate('H', 1, 1.5)
-    drawer.add_gate('H', 2, 1.5)
-    drawer.add_barrier(2.3, 'Superposición')
-    
-    # Oráculo (cadena secreta s = "101")
-    drawer.add_gate('Z', 0, 4)
-    drawer.add_gate('Z', 2, 4)
-    drawer.add_barrier(5, 'Oráculo')
-    drawer.add_label(4, 0, 'Uf (s="101")', fontsize=12)
-    
-    # Segunda capa de Hadamard
-    drawer.add_gate('H', 0, 6.5)
-    drawer.add_gate('H', 1, 6.5)
-    drawer.add_gate('H', 2, 6.5)
-    drawer.add_barrier(7.3, 'Interferencia')
-    
-    # Medición
-    drawer.add_gate('M', 0, 8.5)
-    drawer.add_gate('M', 1, 8.5)
-    drawer.add_gate('M', 2, 8.5)
-    
-    drawer.add_label(9.2, 0, '→ |101⟩', fontsize=12)
-    
-    drawer.save('bernstein_vazirani_3qubits.png')
-    return drawer
+    return _draw_algorithm("bv", 3, "101",
+                           'Algoritmo Bernstein-Vazirani (3 qubits) - Cadena s = "101"',
+                           path, dpi, result="101")
 
 
-def draw_comparison_diagram():
+def draw_comparison_diagram(path='comparacion_complejidad.png', dpi=300):
     """Dibuja un diagrama comparativo de complejidad"""
+    import matplotlib.pyplot as plt
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
     
@@ -293,11 +307,55 @@ def draw_comparison_diagram():
     ax2.set_ylim(0, 12)
     
     plt.tight_layout()
-    plt.savefig('comparacion_complejidad.png', dpi=300, bbox_inches='tight', facecolor='white')
-    print(f"✓ Gráfico de comparación guardado en: comparacion_complejidad.png")
+    plt.savefig(path, dpi=dpi, bbox_inches='tight', facecolor='white')
+    print(f"✓ Gráfico de comparación guardado en: {path}")
     plt.close()
 
 
+# ============================================================================
+# BENCHMARK: COLECCIONES vs UN ARTISTA POR COMPUERTA
+# ============================================================================
+
+def random_circuit(num_qubits, num_gates, seed=0):
+    """Circuito aleatorio de H/Z/X/CZ/CX en el IR, con una barrera cada 100 compuertas"""
+    rng = np.random.default_rng(seed)
+    circuit = Circuit(num_qubits, capacity=num_gates + num_gates // 100)
+    for k in range(num_gates):
+        if rng.random() < 0.25:
+            circuit.append(str(rng.choice(['cz', 'cx'])),
+                           *map(int, rng.choice(num_qubits, size=2, replace=False)))
+        else:
+            circuit.append(str(rng.choice(['h', 'z', 'x'])), int(rng.integers(num_qubits)))
+        if (k + 1) % 100 == 0:
+            circuit.barrier()
+    return circuit
+
+
+def draw_random_circuit(num_qubits, num_gates, batched=True, seed=0):
+    """Genera y dibuja (sin guardar) un circuito aleatorio del IR"""
+    return draw_circuit(random_circuit(num_qubits, num_gates, seed), batched=batched)
+
+
+def benchmark_rendering(num_qubits=100, num_gates=500, dpi=50):
+    """Tiempo y memoria pico de construir y rasterizar el circuito (Agg)"""
+    import matplotlib.pyplot as plt
+    
+    rows = {}
+    for batched in (False, True):
+        tracemalloc.start()
+        start = time.perf_counter()
+        drawer = draw_random_circuit(num_qubits, num_gates, batched)
+        drawer.render()
+        drawer.fig.set_dpi(dpi)
+        drawer.fig.canvas.draw()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        rows[batched] = (elapsed, peak / 2**20, len(drawer.ax.get_children()))
+        plt.close(drawer.fig)
+    return rows
+
+
 # ============================================================================
 # PROGRAMA PRINCIPAL
 # ============================================================================
@@ -316,6 +374,25 @@ if __name__ == "__main__":
     draw_bernstein_vazirani_3qubits()
     draw_comparison_diagram()
     
+    # Benchmark: 100 qubits y 500 compuertas, colecciones frente a artistas sueltos
+    rows = benchmark_rendering(100, 500)
+    print("\n┌──────────────────────────┬──────────────┬──────────────┬──────────────┐")
+    print("│ 100 qubits, 500 puertas  │ Tiempo (s)   │ Pico (MB)    │ Artistas     │")
+    print("├──────────────────────────┼──────────────┼──────────────┼──────────────┤")
+    for batched, name in [(False, "Un artista por compuerta"), (True, "Colecciones en lote")]:
+        elapsed, peak, artists = rows[batched]
+        print(f"│ {name:<24} │ {elapsed:^12.2f} │ {peak:^12.1f} │ {artists:^12} │")
+    print("└──────────────────────────┴──────────────┴──────────────┴──────────────┘")
+    
+    # IR → disposición automática → dibujo de 1000 compuertas
+    start = time.perf_counter()
+    drawer = draw_random_circuit(30, 1000)
+    drawer.render()
+    drawer.fig.set_dpi(50)
+    drawer.fig.canvas.draw()
+    print(f"\n1000 compuertas sobre 30 qubits (IR, disposición y dibujo): "
+          f"{time.perf_counter() - start:.2f} s")
+    
     print("\n" + "="*80)
     print("✓ ¡Todas las visualizaciones han sido generadas exitosamente!")
     print("="*80)
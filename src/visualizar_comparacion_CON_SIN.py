@@ -1,409 +1,113 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Circle, Rectangle
 import numpy as np
 
+from circuito_ir import Circuit
+from motor_ruido import DEFAULT_NOISE, success_probability
+from oraculos import build_circuit, oracle_gates
+from recursos_circuito import GATE_LABELS, kernel_resources, resource_comparison, resources_label
+from registro_kernels import get_kernel
+from visualizar_circuitos import draw_circuit
+
 # ============================================================================
 # VISUALIZACIÓN COMPARATIVA: CON vs SIN QUBIT AUXILIAR
 # ============================================================================
+#
+# matplotlib se importa dentro de cada función: importar el módulo (por
+# ejemplo desde construir_figuras.py) no carga matplotlib ni fija backend.
+# Los circuitos salen del IR (circuito_ir.py) y se disponen con draw_circuit;
+# aquí solo se añaden títulos, resaltados y recursos medidos.
+# ============================================================================
 
-def create_comparison_deutsch_jozsa():
-    """Crea comparación visual de Deutsch-Jozsa"""
+def _comparison_panel(ax, algorithm, n, oracle, ancilla, subtitle, result=None):
+    """Dibuja una versión (con o sin auxiliar) desde el IR, con título y recursos"""
+    from matplotlib.patches import Rectangle
     
-    fig = plt.figure(figsize=(16, 10))
-    
-    # ========== VERSIÓN SIN AUXILIAR (ARRIBA) ==========
-    ax1 = plt.subplot(2, 1, 1)
-    ax1.set_xlim(0, 10)
-    ax1.set_ylim(-0.5, 2.5)
-    ax1.axis('off')
+    name = 'Deutsch-Jozsa' if algorithm == 'dj' else 'Bernstein-Vazirani'
+    circuit = Circuit.for_algorithm(algorithm, n, oracle, ancilla)
+    labels = [f'|q{i}⟩' for i in range(n)] + (['|aux⟩'] if ancilla else [])
+    drawer = draw_circuit(circuit, ax=ax, qubit_labels=labels)
+    top = circuit.num_qubits
+    middle = drawer.length / 2
     
     # Título
-    ax1.text(5, 2.8, 'Deutsch-Jozsa SIN Qubit Auxiliar (Optimizada)', 
-            fontsize=16, ha='center', weight='bold', color='green')
-    ax1.text(5, 2.4, 'Función balanceada: f(x) = x₀ ⊕ x₁', 
-            fontsize=12, ha='center', style='italic')
-    
-    # Líneas de qubits
-    for i in range(2):
-        y = 1 - i
-        ax1.plot([0.5, 9.5], [y, y], 'k-', linewidth=1.5)
-        ax1.text(0.2, y, f'|q{i}⟩', fontsize=14, ha='right', va='center')
-    
-    # Estado inicial
-    ax1.text(0.5, -0.5, '|00⟩', fontsize=12, ha='center', color='blue', style='italic')
-    
-    # Primera capa de Hadamard
-    for i in range(2):
-        y = 1 - i
-        box = FancyBboxPatch((1.3, y - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                            edgecolor='blue', facecolor='lightblue', linewidth=2)
-        ax1.add_patch(box)
-        ax1.text(1.5, y, 'H', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Barrera
-    for i in range(2):
-        y = 1 - i
-        ax1.plot([2.5, 2.5], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax1.text(2.5, 2, 'Superposición', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Oráculo CZ
-    ax1.plot([4, 4], [1, 0], 'purple', linewidth=2)
-    circle1 = Circle((4, 1), 0.1, color='purple', zorder=10)
-    ax1.add_patch(circle1)
-    circle2 = Circle((4, 0), 0.1, color='purple', zorder=10)
-    ax1.add_patch(circle2)
-    ax1.text(4.4, 0.5, 'CZ', fontsize=11, color='purple', weight='bold')
-    
-    # Barrera
-    for i in range(2):
-        y = 1 - i
-        ax1.plot([5.5, 5.5], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax1.text(5.5, 2, 'Oráculo', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Segunda capa de Hadamard
-    for i in range(2):
-        y = 1 - i
-        box = FancyBboxPatch((6.8, y - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                            edgecolor='blue', facecolor='lightblue', linewidth=2)
-        ax1.add_patch(box)
-        ax1.text(7, y, 'H', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Barrera
-    for i in range(2):
-        y = 1 - i
-        ax1.plot([8, 8], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax1.text(8, 2, 'Interferencia', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Medición
-    for i in range(2):
-        y = 1 - i
-        box = FancyBboxPatch((8.75, y - 0.3), 0.5, 0.6, boxstyle="round,pad=0.05", 
-                            edgecolor='red', facecolor='lightyellow', linewidth=2)
-        ax1.add_patch(box)
-        arc = patches.Arc((9, y - 0.1), 0.3, 0.3, angle=0, theta1=0, theta2=180, 
-                        color='red', linewidth=2)
-        ax1.add_patch(arc)
-        ax1.plot([9, 9.1], [y - 0.1, y + 0.2], 'r-', linewidth=2)
+    if ancilla:
+        ax.text(middle, top + 1.4, f'{name} CON Qubit Auxiliar (Tradicional)',
+                fontsize=16, ha='center', weight='bold', color='blue')
+    else:
+        ax.text(middle, top + 1.4, f'{name} SIN Qubit Auxiliar (Optimizada)',
+                fontsize=16, ha='center', weight='bold', color='green')
+    ax.text(middle, top + 0.9, subtitle, fontsize=12, ha='center', style='italic')
+    
+    # Resaltar auxiliar (último qubit, abajo)
+    if ancilla:
+        ax.add_patch(Rectangle((0.5, -0.35), drawer.length - 1, 0.7, facecolor='yellow',
+                               alpha=0.15, zorder=0))
+    
+    # Estado inicial y resultado
+    initial = '0' * n + ('1' if ancilla else '')
+    ax.text(0.5, -0.5, f'|{initial}⟩', fontsize=12, ha='center', color='blue', style='italic')
+    if result:
+        ax.text(drawer.length - 0.3, top - 1 - (n - 1) / 2, f'→ |{result}⟩', fontsize=14,
+                ha='left', color='blue' if ancilla else 'green', weight='bold')
     
     # Recursos
-    ax1.text(0.5, -0.9, '📊 Recursos: 2 qubits | 4H + 1CZ | Profundidad: 3', 
-            fontsize=11, ha='left', bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
-    
-    # ========== VERSIÓN CON AUXILIAR (ABAJO) ==========
-    ax2 = plt.subplot(2, 1, 2)
-    ax2.set_xlim(0, 10)
-    ax2.set_ylim(-0.5, 3.5)
-    ax2.axis('off')
+    resources = resources_label(kernel_resources(get_kernel(algorithm, n, oracle, ancilla)))
+    ax.text(0.5, -0.9, f'📊 Recursos: {resources}', fontsize=11, ha='left',
+            bbox=dict(boxstyle='round', facecolor='lightcoral' if ancilla else 'lightgreen',
+                      alpha=0.8))
+    drawer.render()
+
+
+def create_comparison_deutsch_jozsa(path='comparacion_deutsch_jozsa.png', dpi=300):
+    """Crea comparación visual de Deutsch-Jozsa"""
+    import matplotlib.pyplot as plt
     
-    # Título
-    ax2.text(5, 3.8, 'Deutsch-Jozsa CON Qubit Auxiliar (Tradicional)', 
-            fontsize=16, ha='center', weight='bold', color='blue')
-    ax2.text(5, 3.4, 'Función balanceada: f(x) = x₀ ⊕ x₁', 
-            fontsize=12, ha='center', style='italic')
-    
-    # Líneas de qubits
-    for i in range(3):
-        y = 2 - i
-        ax2.plot([0.5, 9.5], [y, y], 'k-', linewidth=1.5)
-        if i < 2:
-            ax2.text(0.2, y, f'|q{i}⟩', fontsize=14, ha='right', va='center')
-        else:
-            ax2.text(0.2, y, '|aux⟩', fontsize=14, ha='right', va='center', color='orange')
-    
-    # Resaltar auxiliar
-    rect = Rectangle((0.5, 0 - 0.35), 9, 0.7, facecolor='yellow', alpha=0.15, zorder=0)
-    ax2.add_patch(rect)
-    
-    # Estado inicial
-    ax2.text(0.5, -0.5, '|001⟩', fontsize=12, ha='center', color='blue', style='italic')
-    
-    # X en auxiliar
-    box = FancyBboxPatch((0.8, 0 - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                        edgecolor='orange', facecolor='lightyellow', linewidth=2)
-    ax2.add_patch(box)
-    ax2.text(1, 0, 'X', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Primera capa de Hadamard
-    for i in range(3):
-        y = 2 - i
-        box = FancyBboxPatch((1.8, y - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                            edgecolor='blue', facecolor='lightblue', linewidth=2)
-        ax2.add_patch(box)
-        ax2.text(2, y, 'H', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Barrera
-    for i in range(3):
-        y = 2 - i
-        ax2.plot([3, 3], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax2.text(3, 3.2, 'Superposición', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Oráculo: CNOT de q0 a aux
-    ax2.plot([4.5, 4.5], [2, 0], 'b', linewidth=2)
-    circle1 = Circle((4.5, 2), 0.1, color='blue', zorder=10)
-    ax2.add_patch(circle1)
-    circle2 = Circle((4.5, 0), 0.2, color='white', edgecolor='blue', linewidth=2, zorder=10)
-    ax2.add_patch(circle2)
-    ax2.plot([4.35, 4.65], [0, 0], 'b-', linewidth=2, zorder=11)
-    ax2.plot([4.5, 4.5], [-0.15, 0.15], 'b-', linewidth=2, zorder=11)
-    
-    # CNOT de q1 a aux
-    ax2.plot([5.5, 5.5], [1, 0], 'b', linewidth=2)
-    circle3 = Circle((5.5, 1), 0.1, color='blue', zorder=10)
-    ax2.add_patch(circle3)
-    circle4 = Circle((5.5, 0), 0.2, color='white', edgecolor='blue', linewidth=2, zorder=10)
-    ax2.add_patch(circle4)
-    ax2.plot([5.35, 5.65], [0, 0], 'b-', linewidth=2, zorder=11)
-    ax2.plot([5.5, 5.5], [-0.15, 0.15], 'b-', linewidth=2, zorder=11)
-    
-    # Barrera
-    for i in range(3):
-        y = 2 - i
-        ax2.plot([6.5, 6.5], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax2.text(6.5, 3.2, 'Oráculo', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Segunda capa de Hadamard (solo trabajo)
-    for i in range(2):
-        y = 2 - i
-        box = FancyBboxPatch((7.3, y - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                            edgecolor='blue', facecolor='lightblue', linewidth=2)
-        ax2.add_patch(box)
-        ax2.text(7.5, y, 'H', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Barrera
-    for i in range(3):
-        y = 2 - i
-        ax2.plot([8.3, 8.3], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax2.text(8.3, 3.2, 'Interferencia', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Medición (solo trabajo)
-    for i in range(2):
-        y = 2 - i
-        box = FancyBboxPatch((9.05, y - 0.3), 0.5, 0.6, boxstyle="round,pad=0.05", 
-                            edgecolor='red', facecolor='lightyellow', linewidth=2)
-        ax2.add_patch(box)
-        arc = patches.Arc((9.3, y - 0.1), 0.3, 0.3, angle=0, theta1=0, theta2=180, 
-                        color='red', linewidth=2)
-        ax2.add_patch(arc)
-        ax2.plot([9.3, 9.4], [y - 0.1, y + 0.2], 'r-', linewidth=2)
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 10))
     
-    # Recursos
-    ax2.text(0.5, -0.9, '📊 Recursos: 3 qubits | 1X + 6H + 2CNOT | Profundidad: 4', 
-            fontsize=11, ha='left', bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8))
+    # SIN auxiliar (arriba) y CON auxiliar (abajo), ambas desde el IR
+    _comparison_panel(ax1, "dj", 2, "balanced_xor", False,
+                      'Función balanceada: oráculo balanced_xor')
+    _comparison_panel(ax2, "dj", 2, "balanced_xor", True,
+                      'Función balanceada: oráculo balanced_xor')
     
     plt.tight_layout()
-    plt.savefig('comparacion_deutsch_jozsa.png', dpi=300, bbox_inches='tight', facecolor='white')
-    print("✓ Comparación Deutsch-Jozsa guardada: comparacion_deutsch_jozsa.png")
+    plt.savefig(path, dpi=dpi, bbox_inches='tight', facecolor='white')
+    print(f"✓ Comparación Deutsch-Jozsa guardada: {path}")
     plt.close()
 
 
-def create_comparison_bernstein_vazirani():
+def create_comparison_bernstein_vazirani(path='comparacion_bernstein_vazirani.png', dpi=300):
     """Crea comparación visual de Bernstein-Vazirani"""
+    import matplotlib.pyplot as plt
     
-    fig = plt.figure(figsize=(16, 10))
-    
-    # ========== VERSIÓN SIN AUXILIAR (ARRIBA) ==========
-    ax1 = plt.subplot(2, 1, 1)
-    ax1.set_xlim(0, 10)
-    ax1.set_ylim(-0.5, 2.5)
-    ax1.axis('off')
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 10))
     
-    # Título
-    ax1.text(5, 2.8, 'Bernstein-Vazirani SIN Qubit Auxiliar (Optimizada)', 
-            fontsize=16, ha='center', weight='bold', color='green')
-    ax1.text(5, 2.4, 'Cadena secreta: s = "11"', 
-            fontsize=12, ha='center', style='italic')
-    
-    # Líneas de qubits
-    for i in range(2):
-        y = 1 - i
-        ax1.plot([0.5, 9.5], [y, y], 'k-', linewidth=1.5)
-        ax1.text(0.2, y, f'|q{i}⟩', fontsize=14, ha='right', va='center')
-    
-    # Estado inicial
-    ax1.text(0.5, -0.5, '|00⟩', fontsize=12, ha='center', color='blue', style='italic')
-    
-    # Primera capa de Hadamard
-    for i in range(2):
-        y = 1 - i
-        box = FancyBboxPatch((1.3, y - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                            edgecolor='blue', facecolor='lightblue', linewidth=2)
-        ax1.add_patch(box)
-        ax1.text(1.5, y, 'H', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Barrera
-    for i in range(2):
-        y = 1 - i
-        ax1.plot([2.5, 2.5], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax1.text(2.5, 2, 'Superposición', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Oráculo: Z en q0 y q1
-    for i in range(2):
-        y = 1 - i
-        box = FancyBboxPatch((3.8, y - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                            edgecolor='green', facecolor='lightgreen', linewidth=2)
-        ax1.add_patch(box)
-        ax1.text(4, y, 'Z', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Barrera
-    for i in range(2):
-        y = 1 - i
-        ax1.plot([5.5, 5.5], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax1.text(5.5, 2, 'Oráculo', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Segunda capa de Hadamard
-    for i in range(2):
-        y = 1 - i
-        box = FancyBboxPatch((6.8, y - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                            edgecolor='blue', facecolor='lightblue', linewidth=2)
-        ax1.add_patch(box)
-        ax1.text(7, y, 'H', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Barrera
-    for i in range(2):
-        y = 1 - i
-        ax1.plot([8, 8], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax1.text(8, 2, 'Interferencia', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Medición
-    for i in range(2):
-        y = 1 - i
-        box = FancyBboxPatch((8.75, y - 0.3), 0.5, 0.6, boxstyle="round,pad=0.05", 
-                            edgecolor='red', facecolor='lightyellow', linewidth=2)
-        ax1.add_patch(box)
-        arc = patches.Arc((9, y - 0.1), 0.3, 0.3, angle=0, theta1=0, theta2=180, 
-                        color='red', linewidth=2)
-        ax1.add_patch(arc)
-        ax1.plot([9, 9.1], [y - 0.1, y + 0.2], 'r-', linewidth=2)
-    
-    # Resultado
-    ax1.text(9.7, 0.5, '→ |11⟩', fontsize=14, ha='left', color='green', weight='bold')
-    
-    # Recursos
-    ax1.text(0.5, -0.9, '📊 Recursos: 2 qubits | 4H + 2Z | Profundidad: 3', 
-            fontsize=11, ha='left', bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
-    
-    # ========== VERSIÓN CON AUXILIAR (ABAJO) ==========
-    ax2 = plt.subplot(2, 1, 2)
-    ax2.set_xlim(0, 10)
-    ax2.set_ylim(-0.5, 3.5)
-    ax2.axis('off')
-    
-    # Título
-    ax2.text(5, 3.8, 'Bernstein-Vazirani CON Qubit Auxiliar (Tradicional)', 
-            fontsize=16, ha='center', weight='bold', color='blue')
-    ax2.text(5, 3.4, 'Cadena secreta: s = "11"', 
-            fontsize=12, ha='center', style='italic')
-    
-    # Líneas de qubits
-    for i in range(3):
-        y = 2 - i
-        ax2.plot([0.5, 9.5], [y, y], 'k-', linewidth=1.5)
-        if i < 2:
-            ax2.text(0.2, y, f'|q{i}⟩', fontsize=14, ha='right', va='center')
-        else:
-            ax2.text(0.2, y, '|aux⟩', fontsize=14, ha='right', va='center', color='orange')
-    
-    # Resaltar auxiliar
-    rect = Rectangle((0.5, 0 - 0.35), 9, 0.7, facecolor='yellow', alpha=0.15, zorder=0)
-    ax2.add_patch(rect)
-    
-    # Estado inicial
-    ax2.text(0.5, -0.5, '|001⟩', fontsize=12, ha='center', color='blue', style='italic')
-    
-    # X en auxiliar
-    box = FancyBboxPatch((0.8, 0 - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                        edgecolor='orange', facecolor='lightyellow', linewidth=2)
-    ax2.add_patch(box)
-    ax2.text(1, 0, 'X', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Primera capa de Hadamard
-    for i in range(3):
-        y = 2 - i
-        box = FancyBboxPatch((1.8, y - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                            edgecolor='blue', facecolor='lightblue', linewidth=2)
-        ax2.add_patch(box)
-        ax2.text(2, y, 'H', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Barrera
-    for i in range(3):
-        y = 2 - i
-        ax2.plot([3, 3], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax2.text(3, 3.2, 'Superposición', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Oráculo: CNOT de q0 a aux
-    ax2.plot([4.5, 4.5], [2, 0], 'b', linewidth=2)
-    circle1 = Circle((4.5, 2), 0.1, color='blue', zorder=10)
-    ax2.add_patch(circle1)
-    circle2 = Circle((4.5, 0), 0.2, color='white', edgecolor='blue', linewidth=2, zorder=10)
-    ax2.add_patch(circle2)
-    ax2.plot([4.35, 4.65], [0, 0], 'b-', linewidth=2, zorder=11)
-    ax2.plot([4.5, 4.5], [-0.15, 0.15], 'b-', linewidth=2, zorder=11)
-    
-    # CNOT de q1 a aux
-    ax2.plot([5.5, 5.5], [1, 0], 'b', linewidth=2)
-    circle3 = Circle((5.5, 1), 0.1, color='blue', zorder=10)
-    ax2.add_patch(circle3)
-    circle4 = Circle((5.5, 0), 0.2, color='white', edgecolor='blue', linewidth=2, zorder=10)
-    ax2.add_patch(circle4)
-    ax2.plot([5.35, 5.65], [0, 0], 'b-', linewidth=2, zorder=11)
-    ax2.plot([5.5, 5.5], [-0.15, 0.15], 'b-', linewidth=2, zorder=11)
-    
-    # Barrera
-    for i in range(3):
-        y = 2 - i
-        ax2.plot([6.5, 6.5], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax2.text(6.5, 3.2, 'Oráculo', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Segunda capa de Hadamard (solo trabajo)
-    for i in range(2):
-        y = 2 - i
-        box = FancyBboxPatch((7.3, y - 0.25), 0.4, 0.5, boxstyle="round,pad=0.05", 
-                            edgecolor='blue', facecolor='lightblue', linewidth=2)
-        ax2.add_patch(box)
-        ax2.text(7.5, y, 'H', fontsize=16, ha='center', va='center', weight='bold')
-    
-    # Barrera
-    for i in range(3):
-        y = 2 - i
-        ax2.plot([8.3, 8.3], [y - 0.3, y + 0.3], 'gray', linewidth=3, linestyle='--', alpha=0.5)
-    ax2.text(8.3, 3.2, 'Interferencia', fontsize=10, ha='center', style='italic', color='gray')
-    
-    # Medición (solo trabajo)
-    for i in range(2):
-        y = 2 - i
-        box = FancyBboxPatch((9.05, y - 0.3), 0.5, 0.6, boxstyle="round,pad=0.05", 
-                            edgecolor='red', facecolor='lightyellow', linewidth=2)
-        ax2.add_patch(box)
-        arc = patches.Arc((9.3, y - 0.1), 0.3, 0.3, angle=0, theta1=0, theta2=180, 
-                        color='red', linewidth=2)
-        ax2.add_patch(arc)
-        ax2.plot([9.3, 9.4], [y - 0.1, y + 0.2], 'r-', linewidth=2)
-    
-    # Resultado
-    ax2.text(9.7, 1, '→ |11⟩', fontsize=14, ha='left', color='blue', weight='bold')
-    
-    # Recursos
-    ax2.text(0.5, -0.9, '📊 Recursos: 3 qubits | 1X + 6H + 2CNOT | Profundidad: 4', 
-            fontsize=11, ha='left', bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8))
+    _comparison_panel(ax1, "bv", 2, "11", False, 'Cadena secreta: s = "11"', result="11")
+    _comparison_panel(ax2, "bv", 2, "11", True, 'Cadena secreta: s = "11"', result="11")
     
     plt.tight_layout()
-    plt.savefig('comparacion_bernstein_vazirani.png', dpi=300, bbox_inches='tight', facecolor='white')
-    print("✓ Comparación Bernstein-Vazirani guardada: comparacion_bernstein_vazirani.png")
+    plt.savefig(path, dpi=dpi, bbox_inches='tight', facecolor='white')
+    print(f"✓ Comparación Bernstein-Vazirani guardada: {path}")
     plt.close()
 
 
-def create_resource_comparison_chart():
-    """Crea gráfico comparativo de recursos"""
+def create_resource_comparison_chart(n_values=(2, 4, 8, 16, 32, 64), path='comparacion_recursos.png',
+                                     dpi=300):
+    """Crea gráfico comparativo de recursos (medidos sobre los kernels de BV
+    con s = 11...1 para cada n)"""
+    import matplotlib.pyplot as plt
     
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
     
-    # Datos
-    n_qubits = np.array([2, 3, 4, 5, 6])
+    # Datos medidos
+    n_qubits = np.array(n_values)
+    measured = resource_comparison(sorted(set(n_values) | {2, 3}))
+    
+    def series(variant, field):
+        return np.array([measured[n][variant][field] for n in n_values])
     
     # Gráfico 1: Número de qubits
-    qubits_sin = n_qubits
-    qubits_con = n_qubits + 1
+    qubits_sin = series("phase", "qubits")
+    qubits_con = series("ancilla", "qubits")
     
     x = np.arange(len(n_qubits))
     width = 0.35
@@ -419,8 +123,8 @@ def create_resource_comparison_chart():
     ax1.grid(True, alpha=0.3, axis='y')
     
     # Gráfico 2: Profundidad del circuito
-    depth_sin = np.array([3, 3, 3, 3, 3])
-    depth_con = np.array([4, 4, 4, 4, 4])
+    depth_sin = series("phase", "depth")
+    depth_con = series("ancilla", "depth")
     
     ax2.bar(x - width/2, depth_sin, width, label='Sin auxiliar', color='green', alpha=0.8)
     ax2.bar(x + width/2, depth_con, width, label='Con auxiliar', color='blue', alpha=0.8)
@@ -433,8 +137,8 @@ def create_resource_comparison_chart():
     ax2.grid(True, alpha=0.3, axis='y')
     
     # Gráfico 3: Número de compuertas
-    gates_sin = 2 * n_qubits + 1
-    gates_con = 1 + 3 * n_qubits + n_qubits
+    gates_sin = series("phase", "total_gates")
+    gates_con = series("ancilla", "total_gates")
     
     ax3.bar(x - width/2, gates_sin, width, label='Sin auxiliar', color='green', alpha=0.8)
     ax3.bar(x + width/2, gates_con, width, label='Con auxiliar', color='blue', alpha=0.8)
@@ -449,14 +153,32 @@ def create_resource_comparison_chart():
     # Gráfico 4: Tabla resumen
     ax4.axis('off')
     
+    def row(label, n, field):
+        sin, con = measured[n]["phase"][field], measured[n]["ancilla"][field]
+        return [label, str(sin), str(con), f'✓ {(sin - con) / con:+.0%}' if con else '=']
+    
+    def noisy_row(n):
+        # Respuesta correcta con el ruido por compuerta DEFAULT_NOISE (motor_ruido)
+        sin, con = (success_probability(*build_circuit(n, oracle_gates("bv", n, "1" * n, ancilla),
+                                                       ancilla), DEFAULT_NOISE)
+                    for ancilla in (False, True))
+        return [f'Éxito ruido (n={n})', f'{sin:.1%}', f'{con:.1%}',
+                f"{'✓ ' if sin > con else ''}{(sin - con) * 100:+.1f} pp"]
+    
+    def gate_types(n, variant):
+        return ', '.join(GATE_LABELS.get(name, name.upper())
+                         for name in measured[n][variant]["gates"])
+    
     table_data = [
         ['Aspecto', 'Sin Auxiliar', 'Con Auxiliar', 'Ventaja'],
-        ['Qubits (n=2)', '2', '3', '✓ -33%'],
-        ['Qubits (n=3)', '3', '4', '✓ -25%'],
-        ['Profundidad', '3', '4', '✓ -25%'],
-        ['Compuertas', 'Menos', 'Más', '✓ Mejor'],
-        ['Tipo compuertas', 'Z, H', 'CNOT, H, X', '✓ Más simple'],
-        ['Coherencia', 'Mayor', 'Menor', '✓ Mejor'],
+        row('Qubits (n=2)', 2, "qubits"),
+        row('Qubits (n=3)', 3, "qubits"),
+        row('Profundidad (n=2)', 2, "depth"),
+        row('Compuertas (n=2)', 2, "total_gates"),
+        row('Dos qubits (n=2)', 2, "two_qubit_gates"),
+        ['Tipo compuertas', gate_types(2, "phase"), gate_types(2, "ancilla"), '✓ Más simple'],
+        noisy_row(2),
+        noisy_row(8),
         ['Implementación', 'Directa', 'Tradicional', '✓ Más eficiente']
     ]
     
@@ -478,8 +200,8 @@ def create_resource_comparison_chart():
     ax4.set_title('Resumen Comparativo', fontsize=14, weight='bold', pad=20)
     
     plt.tight_layout()
-    plt.savefig('comparacion_recursos.png', dpi=300, bbox_inches='tight', facecolor='white')
-    print("✓ Gráfico de recursos guardado: comparacion_recursos.png")
+    plt.savefig(path, dpi=dpi, bbox_inches='tight', facecolor='white')
+    print(f"✓ Gráfico de recursos guardado: {path}")
     plt.close()
 
 
@@ -0,0 +1,41 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+import cache_resultados  # noqa: E402
+from algoritmos_3qubits import run_bernstein_vazirani_3qubits  # noqa: E402
+from registro_kernels import get_kernel  # noqa: E402
+
+
+def test_seeded_run_is_cached(tmp_path, monkeypatch):
+    import cudaq
+
+    cache_resultados.enable_cache(str(tmp_path))
+    try:
+        kernel = get_kernel("bv", 3, "101")
+        first = run_bernstein_vazirani_3qubits(kernel, "101", shots=200, engine="cudaq",
+                                               seed=7, verbose=False)
+        assert len(os.listdir(tmp_path)) == 1
+
+        # La segunda llamada con la misma semilla no debe llegar a cudaq.sample
+        def fail(*args, **kwargs):
+            raise AssertionError("cudaq.sample llamado con la entrada en caché")
+
+        monkeypatch.setattr(cudaq, "sample", fail)
+        second = run_bernstein_vazirani_3qubits(kernel, "101", shots=200, engine="cudaq",
+                                                seed=7, verbose=False)
+        assert second["counts"] == first["counts"]
+        assert second["indices"] == first["indices"]
+    finally:
+        cache_resultados.disable_cache()
+
+
+def test_seed_is_set_without_cache(monkeypatch):
+    import cudaq
+
+    seeds = []
+    monkeypatch.setattr(cudaq, "set_random_seed", seeds.append)
+    cache_resultados.disable_cache()
+    cache_resultados.cached_sample(get_kernel("bv", 3, "101"), (), 10, seed=11)
+    assert seeds == [11]
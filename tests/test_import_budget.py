@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from registro_kernels import check_import_budget  # noqa: E402
+
+# Los módulos de algoritmos se importan al arrancar cada worker: sin salida,
+# sin CUDA-Q y por debajo del presupuesto de tiempo.
+ALGORITHM_MODULES = ["algoritmos_3qubits", "algoritmos_con_auxiliar"]
+
+
+@pytest.mark.parametrize("module", ALGORITHM_MODULES)
+def test_import_budget(module):
+    assert check_import_budget(module, budget_seconds=0.5) < 0.5
+
+
+def test_import_budget_detects_cudaq():
+    with pytest.raises(RuntimeError, match="importa cudaq"):
+        check_import_budget("cudaq", budget_seconds=60)